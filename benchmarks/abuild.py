@@ -0,0 +1,73 @@
+"""Benchmark building components with asynchronous setup steps.
+
+Usage:
+    python benchmarks/abuild.py
+
+Every ``Pool`` is created by an ``async`` factory that waits for I/O. ``sequential``
+builds the configs with ``build`` and awaits the returned pools one after another,
+``abuild`` awaits the factories while building and opens sibling pools concurrently.
+"""
+
+import asyncio
+import dataclasses
+import time
+from typing import Any, Dict, List, cast
+
+from colt import ColtBuilder, Registrable
+
+
+class Pool(Registrable):
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+    @classmethod
+    async def open(cls, url: str, latency: float) -> "Pool":
+        await asyncio.sleep(latency)
+        return cls(url)
+
+
+Pool.register("pool", constructor="open")(Pool)
+
+
+@dataclasses.dataclass
+class Shard:
+    primary: Pool
+    replica: Pool
+
+
+@dataclasses.dataclass
+class Cluster:
+    shards: List[Shard]
+
+
+def cluster_config(shards: int, latency: float) -> Dict[str, Any]:
+    def pool(name: str) -> Dict[str, Any]:
+        return {"@type": "pool", "url": name, "latency": latency}
+
+    return {"shards": [{"primary": pool(f"p{i}"), "replica": pool(f"r{i}")} for i in range(shards)]}
+
+
+async def build_sequential(builder: ColtBuilder, config: Dict[str, Any]) -> Cluster:
+    cluster = builder(config, Cluster)
+    for shard in cluster.shards:
+        # `build` returns the coroutines of the factories in place of the pools
+        shard.primary = await cast(Any, shard.primary)
+        shard.replica = await cast(Any, shard.replica)
+    return cluster
+
+
+def measure(name: str, func: Any) -> None:
+    start = time.perf_counter()
+    asyncio.run(func())
+    print(f"{name:<12} {(time.perf_counter() - start) * 1e3:10.1f} ms/build")
+
+
+def main() -> None:
+    builder = ColtBuilder()
+    config = cluster_config(shards=8, latency=0.02)
+    measure("sequential", lambda: build_sequential(builder, config))
+    measure("abuild", lambda: builder.abuild(config, Cluster))
+
+
+if __name__ == "__main__":
+    main()
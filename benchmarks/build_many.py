@@ -0,0 +1,74 @@
+"""Benchmark building a batch of small configs of the same type.
+
+Usage:
+    python benchmarks/build_many.py
+
+``loop`` calls ``colt.build`` for every config, which creates a new builder and
+repeats the annotation analysis on each call. ``build_many`` shares a single
+builder across the batch, either collecting a list or iterating lazily.
+"""
+
+import dataclasses
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+import colt
+
+
+@dataclasses.dataclass
+class Address:
+    city: str
+    zipcode: str
+
+
+@dataclasses.dataclass
+class Record:
+    id: int
+    name: str
+    score: float
+    tags: List[str]
+    address: Address
+    parent: Optional[int] = None
+
+
+def make_configs(size: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"record-{i}",
+            "score": i / 10,
+            "tags": ["a", "b"],
+            "address": {"city": "Tokyo", "zipcode": f"{i:07d}"},
+        }
+        for i in range(size)
+    ]
+
+
+def build_loop(configs: List[Dict[str, Any]]) -> List[Record]:
+    return [colt.build(config, Record) for config in configs]
+
+
+def build_many(configs: List[Dict[str, Any]]) -> List[Record]:
+    return colt.build_many(configs, Record)
+
+
+def build_many_lazy(configs: List[Dict[str, Any]]) -> List[Record]:
+    return list(colt.build_many(iter(configs), Record, lazy=True))
+
+
+def measure(name: str, func: Callable[[], Any], size: int) -> None:
+    seconds = min(timeit.repeat(func, number=1, repeat=5))
+    print(f"{name:<16} {seconds * 1e3:10.1f} ms/batch {seconds / size * 1e6:8.2f} us/config")
+
+
+def main() -> None:
+    size = 10_000
+    configs = make_configs(size)
+    assert build_loop(configs) == build_many(configs) == build_many_lazy(configs)
+    measure("loop", lambda: build_loop(configs), size)
+    measure("build_many", lambda: build_many(configs), size)
+    measure("build_many/lazy", lambda: build_many_lazy(configs), size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark repeated builds of the same root class.
+
+Usage:
+    python benchmarks/build_plan.py
+
+``cold`` creates a new ``ColtBuilder`` for every build (as ``colt.build`` does),
+so the annotation analysis is repeated on each call. ``warm`` reuses a single
+builder whose compiled build plans are cached per annotation.
+"""
+
+import dataclasses
+import timeit
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from colt import ColtBuilder
+
+
+@dataclasses.dataclass
+class Leaf:
+    name: str
+    weight: float
+    tags: List[str]
+
+
+@dataclasses.dataclass
+class Node:
+    value: int
+    leaf: Leaf
+    child: Optional["Node"] = None
+
+
+@dataclasses.dataclass
+class Wide:
+    ints: Dict[str, int]
+    leaves: List[Leaf]
+    a0: int
+    a1: str
+    a2: float
+    a3: Optional[int]
+    a4: List[int]
+    a5: Dict[str, str]
+    a6: Leaf
+    a7: Optional[Leaf]
+
+
+def deep_config(depth: int) -> Dict[str, Any]:
+    config: Dict[str, Any] = {"value": 0, "leaf": {"name": "leaf", "weight": 1.0, "tags": ["a"]}}
+    for i in range(1, depth):
+        config = {"value": i, "leaf": {"name": "leaf", "weight": 1.0, "tags": ["a"]}, "child": config}
+    return config
+
+
+def wide_config(width: int) -> Dict[str, Any]:
+    leaf = {"name": "leaf", "weight": 1.5, "tags": ["a", "b"]}
+    return {
+        "ints": {f"k{i}": i for i in range(width)},
+        "leaves": [leaf] * width,
+        "a0": 1,
+        "a1": "x",
+        "a2": 0.5,
+        "a3": None,
+        "a4": list(range(width)),
+        "a5": {f"k{i}": str(i) for i in range(width)},
+        "a6": leaf,
+        "a7": leaf,
+    }
+
+
+def build_cold(config: Any, cls: Any) -> Any:
+    return ColtBuilder()(config, cls)
+
+
+def measure(name: str, func: Callable[[], Any], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<12} {seconds * 1e3:10.3f} ms/build")
+
+
+def main() -> None:
+    cases = [
+        ("deep", deep_config(50), Node, 200),
+        ("wide", wide_config(100), Wide, 200),
+    ]
+    for label, config, cls, number in cases:
+        builder = ColtBuilder()
+        measure(f"{label}/cold", partial(build_cold, config, cls), number)
+        measure(f"{label}/warm", partial(builder, config, cls), number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark callbacks that only care about the root config.
+
+Usage:
+    python benchmarks/callback.py
+
+``raising`` skips every other node by raising ``SkipCallback``, ``declared``
+declares ``paths = [()]`` so that the builder does not call it for other nodes.
+"""
+
+import dataclasses
+import timeit
+from typing import Any, Callable, List, Optional, Type, TypeVar, Union
+
+from colt import ColtBuilder, ColtCallback, ColtContext, SkipCallback
+from colt.types import ParamPath
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class Item:
+    name: str
+    price: float
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    items: List[Item]
+
+
+class Raising(ColtCallback):
+    def on_build(
+        self,
+        path: ParamPath,
+        config: Any,
+        builder: ColtBuilder,
+        context: ColtContext,
+        annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> Any:
+        if path:
+            raise SkipCallback
+        return config
+
+
+class Declared(Raising):
+    paths = [()]
+
+
+def main() -> None:
+    config = {"id": 1, "items": [{"name": f"item{i}", "price": i} for i in range(100)]}
+    for name, callbacks in [
+        ("none", None),
+        ("raising", [Raising()]),
+        ("declared", [Declared()]),
+        ("raising x4", [Raising() for _ in range(4)]),
+        ("declared x4", [Declared() for _ in range(4)]),
+    ]:
+        builder = ColtBuilder(callback=callbacks)
+        seconds = min(timeit.repeat(lambda: builder(config, Order), number=100, repeat=5)) / 100
+        print(f"{name:<12} {seconds * 1e3:8.3f} ms/build")
+
+
+if __name__ == "__main__":
+    main()
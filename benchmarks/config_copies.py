@@ -0,0 +1,70 @@
+"""Benchmark memory and time of building wide typed configs.
+
+Usage:
+    python benchmarks/config_copies.py
+
+The root config names its class with the typekey and passes positional arguments
+with the args key, and so does each of its entries. ``transient`` is the peak
+memory of the build minus the memory retained by the result, i.e. the working
+memory of the builder, which includes every copy of a config that is alive while
+its arguments are built.
+"""
+
+import time
+import tracemalloc
+from typing import Any, Dict
+
+from colt import ColtBuilder, Registrable
+
+
+class Component(Registrable):
+    pass
+
+
+@Component.register("entry")
+class Entry(Component):
+    def __init__(self, name: str, value: int, **options: Any) -> None:
+        self.name = name
+        self.value = value
+        self.options = options
+
+
+@Component.register("table")
+class Table(Component):
+    def __init__(self, name: str, **entries: Component) -> None:
+        self.name = name
+        self.entries = entries
+
+
+def wide_config(width: int, options: int) -> Dict[str, Any]:
+    config: Dict[str, Any] = {"@type": "table", "*": ["root"]}
+    for i in range(width):
+        entry: Dict[str, Any] = {"@type": "entry", "*": [f"e{i}"], "value": i}
+        entry.update({f"option{j}": j for j in range(options)})
+        config[f"entry{i}"] = entry
+    return config
+
+
+def main() -> None:
+    config = wide_config(width=20_000, options=20)
+    builder = ColtBuilder()
+    builder(config, Component)
+
+    tracemalloc.start()
+    result = builder(config, Component)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        builder(config, Component)
+        timings.append(time.perf_counter() - start)
+    print(
+        f"transient {(peak - retained) / 2**20:8.2f} MiB  peak {peak / 2**20:8.2f} MiB  time {min(timings) * 1e3:8.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark restarting a process that builds an expensive component.
+
+Usage:
+    python benchmarks/disk_cache.py
+
+``Index`` takes a while to construct. ``cold`` builds it with an empty
+``DiskCache``, ``warm`` simulates a restart with a new builder and a new cache
+object on the same directory, which loads the pickled index instead.
+"""
+
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from colt import ColtBuilder, DiskCache, Registrable
+
+
+class Component(Registrable):
+    pass
+
+
+@Component.register("index", cacheable=True)
+class Index(Component):
+    def __init__(self, documents: int) -> None:
+        self.postings: Dict[str, List[int]] = {}
+        for doc in range(documents):
+            for term in (f"t{doc % 997}", f"t{doc % 101}", f"t{doc % 13}"):
+                self.postings.setdefault(term, []).append(doc)
+
+
+def measure(name: str, directory: str, config: Dict[str, Any]) -> None:
+    builder = ColtBuilder(disk_cache=DiskCache(directory, version="1"))
+    start = time.perf_counter()
+    builder(config, Component)
+    print(f"{name:<12} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+
+def main() -> None:
+    config = {"@type": "index", "documents": 500_000}
+    with tempfile.TemporaryDirectory() as directory:
+        measure("cold", directory, config)
+        measure("warm", directory, config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark the build engines on chained configs.
+
+Usage:
+    python benchmarks/engine.py
+
+``recursive`` builds nested values with nested ``_build`` calls and is limited by
+the recursion limit, ``stack`` drives the same build steps with an explicit stack.
+"""
+
+import dataclasses
+import timeit
+from typing import Any, Dict, Optional
+
+from colt import ColtBuilder
+
+
+@dataclasses.dataclass
+class Stage:
+    name: str
+    weight: float
+    next: Optional["Stage"] = None
+
+
+def chain_config(depth: int) -> Dict[str, Any]:
+    config: Dict[str, Any] = {"name": "last", "weight": 1.0}
+    for i in range(depth - 1):
+        config = {"name": f"stage{i}", "weight": i, "next": config}
+    return config
+
+
+def main() -> None:
+    for depth in (100, 200, 10_000):
+        config = chain_config(depth)
+        for engine in ("recursive", "stack"):
+            builder = ColtBuilder(engine=engine)
+            try:
+                builder(config, Stage)
+            except RecursionError:
+                print(f"depth={depth:<6} {engine:<10} RecursionError")
+                continue
+            seconds = min(timeit.repeat(lambda: builder(config, Stage), number=10, repeat=5)) / 10
+            print(f"depth={depth:<6} {engine:<10} {seconds * 1e3:10.3f} ms/build")
+
+
+if __name__ == "__main__":
+    main()
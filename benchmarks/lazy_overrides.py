@@ -0,0 +1,50 @@
+"""Benchmark `Lazy.construct` with overrides on a large config.
+
+Usage:
+    python benchmarks/lazy_overrides.py
+
+The lazy config holds a large inline table next to a few small settings, and
+each construction overrides a single setting. ``overlay`` is the time to apply
+the overrides alone, ``construct`` includes building the object.
+"""
+
+import time
+from typing import Any, Dict, List
+
+from colt import ColtBuilder, Lazy
+from colt.utils import override_fields
+
+
+class Model:
+    def __init__(self, rate: float, table: List[Dict[str, Any]]) -> None:
+        self.rate = rate
+        self.table = table
+
+
+class Trainer:
+    def __init__(self, model: Lazy[Model]) -> None:
+        self.model = model
+
+
+def main() -> None:
+    table = [{"id": i, "label": f"l{i}", "features": [i, i + 1, i + 2]} for i in range(20_000)]
+    trainer = ColtBuilder()({"model": {"rate": 0.1, "table": table}}, Trainer)
+    lazy = trainer.model
+    repeat = 20
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        override_fields(lazy.config, [("rate", i / 100)])
+    overlay = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        lazy.construct(rate=i / 100)
+    construct = (time.perf_counter() - start) / repeat
+
+    print(f"overlay:   {overlay * 1e3:9.3f} ms/call")
+    print(f"construct: {construct * 1e3:9.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
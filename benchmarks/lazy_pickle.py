@@ -0,0 +1,64 @@
+"""Benchmark sending `Lazy` factories to a process pool.
+
+Usage:
+    python benchmarks/lazy_pickle.py
+
+The root config holds a large dataset next to a small lazy model. Each task
+receives the pickled lazy model and constructs it in a worker process.
+``payload`` is the size of one pickled `Lazy`, compared to the root config.
+"""
+
+import dataclasses
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from colt import ColtBuilder, Lazy, Registrable
+
+
+class Model(Registrable):
+    pass
+
+
+@Model.register("mlp")
+class MLP(Model):
+    def __init__(self, sizes: List[int], seed: int = 0) -> None:
+        self.sizes = sizes
+        self.seed = seed
+
+
+@dataclasses.dataclass
+class Job:
+    model: Lazy[Model]
+    data: List[List[float]]
+
+
+def construct(lazy: Lazy[Model], seed: int) -> int:
+    model = lazy.construct(seed=seed)
+    assert isinstance(model, MLP)
+    return model.seed
+
+
+def main() -> None:
+    config = {
+        "model": {"@type": "mlp", "sizes": [256, 128, 10]},
+        "data": [[float(j) for j in range(100)] for _ in range(2_000)],
+    }
+    job = ColtBuilder()(config, Job)
+    tasks = 2_000
+
+    print(f"root config: {len(pickle.dumps(config)):9d} bytes")
+    print(f"payload:     {len(pickle.dumps(job.model)):9d} bytes")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")) as executor:
+        seeds = list(executor.map(construct, [job.model] * tasks, range(tasks), chunksize=50))
+    elapsed = time.perf_counter() - start
+    assert seeds == list(range(tasks))
+    print(f"{tasks} tasks:  {elapsed * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark startup with many plugin modules that are slow to import.
+
+Usage:
+    python benchmarks/lazy_registration.py
+
+A temporary package holds plugin modules that each take a while to import, like
+modules depending on heavy libraries. ``eager`` imports the whole package with
+``colt.import_modules`` before building a config that uses one plugin, ``lazy``
+registers all plugins with a manifest and only imports the one that is used.
+"""
+
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from typing import Dict
+
+import colt
+from colt import Registrable
+
+
+class Plugin(Registrable):
+    pass
+
+
+PLUGINS = 40
+
+MODULE = """
+from __main__ import Plugin
+
+# stands in for importing heavy dependencies
+_table = [i * i for i in range(200_000)]
+
+
+@Plugin.register("{mode}:plugin{index}")
+class Plugin{index}(Plugin):
+    def __init__(self, size: int) -> None:
+        self.size = size
+"""
+
+
+def write_package(directory: Path, mode: str) -> None:
+    package = directory / f"colt_benchmark_{mode}"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for index in range(PLUGINS):
+        source = MODULE.format(mode=mode, index=index)
+        (package / f"plugin{index}.py").write_text(textwrap.dedent(source))
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        for mode in ("eager", "lazy"):
+            write_package(Path(directory), mode)
+
+        start = time.perf_counter()
+        colt.import_modules(["colt_benchmark_eager"])
+        colt.build({"@type": "eager:plugin7", "size": 1}, Plugin)
+        print(f"eager: {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+        start = time.perf_counter()
+        manifest: Dict[str, str] = {
+            f"lazy:plugin{index}": f"colt_benchmark_lazy.plugin{index}:Plugin{index}" for index in range(PLUGINS)
+        }
+        Plugin.register_lazy(manifest)
+        colt.build({"@type": "lazy:plugin7", "size": 1}, Plugin)
+        print(f"lazy:  {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
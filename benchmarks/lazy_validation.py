@@ -0,0 +1,65 @@
+"""Benchmark creating and updating many `Lazy` objects field by field.
+
+Usage:
+    python benchmarks/lazy_validation.py
+
+Each trainer config holds a lazy model with a wide table of layers, and every
+lazy model is updated a few times before a fraction of them is constructed,
+like a sweep driver does. ``eager`` validates each lazy config on creation,
+``deferred`` postpones it until construction.
+"""
+
+import dataclasses
+import time
+from typing import Any, Dict, List
+
+from colt import ColtBuilder, Lazy
+
+
+@dataclasses.dataclass
+class Layer:
+    size: int
+    dropout: float = 0.0
+
+
+@dataclasses.dataclass
+class Model:
+    layers: List[Layer]
+    head: Layer
+    rate: float
+
+
+@dataclasses.dataclass
+class Trainer:
+    model: Lazy[Model]
+
+
+def trainer_config(width: int) -> Dict[str, Any]:
+    layers = [{"size": i, "dropout": 0.1} for i in range(width)]
+    return {"model": {"layers": layers, "head": {"size": 1}, "rate": 0.1}}
+
+
+def run(builder: ColtBuilder, count: int, width: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        trainer = builder(trainer_config(width), Trainer)
+        trainer.model.update(rate=i / count)
+        trainer.model.update({"head.size": i})
+        trainer.model.update({"head.dropout": 0.5})
+        if i % 10 == 0:
+            trainer.model.construct()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count, width = 500, 200
+    for name, builder in [
+        ("eager", ColtBuilder()),
+        ("deferred", ColtBuilder(defer_lazy_validation=True)),
+    ]:
+        elapsed = run(builder, count, width)
+        print(f"{name:8s}: {elapsed * 1e3:8.1f} ms  {builder.lazy_validation_info}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark building a config with one million leaves.
+
+Usage:
+    python benchmarks/linked_path.py
+
+Reports the build time and the peak memory allocated during the build
+(measured with tracemalloc in a separate run).
+"""
+
+import dataclasses
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from colt import ColtBuilder
+
+
+@dataclasses.dataclass
+class Features:
+    vocab: Dict[str, int]
+    weights: List[float]
+
+
+@dataclasses.dataclass
+class Model:
+    features: Features
+
+
+def make_config(num_leaves: int) -> Dict[str, Any]:
+    half = num_leaves // 2
+    return {
+        "features": {
+            "vocab": {f"token{i}": i for i in range(half)},
+            "weights": [float(i) for i in range(half)],
+        }
+    }
+
+
+def measure(name: str, func: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<12} {elapsed:8.3f} s  peak {peak / 2**20:8.1f} MiB")
+
+
+def main() -> None:
+    config = make_config(1_000_000)
+    builder = ColtBuilder()
+    measure("1M leaves", lambda: builder(config, Model))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark repeated builds of configs sharing a static component.
+
+Usage:
+    python benchmarks/object_cache.py
+
+Every request builds a ``Handler`` whose ``Lookup`` table is the same. ``uncached``
+constructs the table for each build, ``cached`` uses a builder given an
+``ObjectCache`` and returns the table built first.
+"""
+
+import dataclasses
+import timeit
+from typing import Any, Dict
+
+from colt import ColtBuilder, ObjectCache, Registrable
+
+
+class Resource(Registrable):
+    pass
+
+
+@Resource.register("lookup", cacheable=True)
+class Lookup(Resource):
+    def __init__(self, size: int) -> None:
+        self.table = {f"key{i}": i for i in range(size)}
+
+
+@dataclasses.dataclass
+class Handler:
+    name: str
+    lookup: Resource
+
+
+def handler_config(i: int) -> Dict[str, Any]:
+    return {"name": f"handler{i}", "lookup": {"@type": "lookup", "size": 10_000}}
+
+
+def measure(name: str, builder: ColtBuilder, number: int = 200) -> None:
+    configs = [handler_config(i) for i in range(number)]
+    seconds = min(timeit.repeat(lambda: [builder(config, Handler) for config in configs], number=1, repeat=3))
+    print(f"{name:<12} {seconds / number * 1e6:10.1f} us/build")
+
+
+def main() -> None:
+    measure("uncached", ColtBuilder())
+    builder = ColtBuilder(object_cache=ObjectCache(maxsize=16))
+    measure("cached", builder)
+    print(builder.object_cache_info)
+
+
+if __name__ == "__main__":
+    main()
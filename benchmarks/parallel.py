@@ -0,0 +1,51 @@
+"""Benchmark building independent I/O-bound components on a thread pool.
+
+Usage:
+    python benchmarks/parallel.py
+
+Each component sleeps for 50 ms in its constructor, standing in for loading a
+model or opening an index.
+"""
+
+import dataclasses
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from colt import ColtBuilder
+
+DELAY = 0.05
+
+
+class Component:
+    def __init__(self, name: str) -> None:
+        time.sleep(DELAY)
+        self.name = name
+
+
+@dataclasses.dataclass
+class App:
+    model: Component
+    tokenizer: Component
+    index: Component
+    reranker: Component
+    cache: Component
+    name: str = "app"
+
+
+def measure(name: str, executor: Optional[ThreadPoolExecutor]) -> None:
+    config = {key: {"name": key} for key in ("model", "tokenizer", "index", "reranker", "cache")}
+    builder = ColtBuilder(executor=executor)
+    start = time.perf_counter()
+    builder(config, App)
+    print(f"{name:<12} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+def main() -> None:
+    measure("sequential", None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        measure("thread pool", executor)
+
+
+if __name__ == "__main__":
+    main()
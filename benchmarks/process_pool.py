@@ -0,0 +1,66 @@
+"""Benchmark building CPU-heavy sibling objects in a process pool.
+
+Usage:
+    python benchmarks/process_pool.py
+
+``Simulation`` is registered with ``executor="process"``. ``sequential`` builds
+all simulations in the calling process, ``process`` ships each of them to a
+``ProcessPoolExecutor`` and receives the pickled objects.
+"""
+
+import dataclasses
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from colt import ColtBuilder, Registrable
+
+
+class Model(Registrable):
+    pass
+
+
+@Model.register("simulation", executor="process")
+class Simulation(Model):
+    def __init__(self, steps: int) -> None:
+        state = 0
+        for i in range(steps):
+            state = (state * 31 + i) % 1_000_003
+        self.state = state
+
+
+@dataclasses.dataclass
+class Ensemble:
+    a: Model
+    b: Model
+    c: Model
+    d: Model
+
+
+def ensemble_config(steps: int) -> Dict[str, Any]:
+    return {key: {"@type": "simulation", "steps": steps} for key in "abcd"}
+
+
+def measure(name: str, func: Callable[[], Any], repeat: int = 3) -> None:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    print(f"{name:<12} {min(timings) * 1e3:10.1f} ms/build")
+
+
+def main() -> None:
+    config = ensemble_config(2_000_000)
+    measure("sequential", lambda: ColtBuilder()(config, Ensemble))
+    context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1), mp_context=context) as executor:
+        builder = ColtBuilder(process_executor=executor)
+        builder(config, Ensemble)  # start the workers
+        measure("process", lambda: builder(config, Ensemble))
+
+
+if __name__ == "__main__":
+    main()
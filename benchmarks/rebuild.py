@@ -0,0 +1,60 @@
+"""Benchmark rebuilding a large config after changing one hyperparameter.
+
+Usage:
+    python benchmarks/rebuild.py
+
+``build`` constructs the changed config from scratch, ``rebuild`` reuses the
+objects of the previous result built from unchanged subtrees.
+"""
+
+import copy
+import dataclasses
+import time
+from typing import Any, Callable, Dict, List
+
+from colt import ColtBuilder
+
+
+class Vocabulary:
+    def __init__(self, size: int) -> None:
+        self.tokens = [f"token{i}" for i in range(size)]
+
+
+@dataclasses.dataclass
+class Layer:
+    vocabulary: Vocabulary
+    width: int
+
+
+@dataclasses.dataclass
+class Network:
+    layers: List[Layer]
+    learning_rate: float
+
+
+def network_config(layers: int) -> Dict[str, Any]:
+    return {
+        "layers": [{"vocabulary": {"size": 20_000}, "width": i} for i in range(layers)],
+        "learning_rate": 0.1,
+    }
+
+
+def measure(name: str, func: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{name:<12} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+
+def main() -> None:
+    builder = ColtBuilder(history=1)
+    old_config = network_config(50)
+    old = builder(old_config, Network)
+    new_config = copy.deepcopy(old_config)
+    new_config["layers"][7]["width"] = 100
+
+    measure("build", lambda: ColtBuilder()(new_config, Network))
+    measure("rebuild", lambda: builder.rebuild(old_config, old, new_config, Network))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark sharing a heavy component through a reference.
+
+Usage:
+    python benchmarks/reference.py
+
+``Embedding`` allocates a large table when it is constructed. ``duplicated``
+configures the same table for the encoder and the decoder, so it is built twice,
+while ``referenced`` builds it once and injects it with ``{"@ref": ...}``.
+"""
+
+import dataclasses
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from colt import ColtBuilder
+
+
+class Embedding:
+    def __init__(self, rows: int, dim: int) -> None:
+        self.table: List[List[float]] = [[0.0] * dim for _ in range(rows)]
+
+
+@dataclasses.dataclass
+class Encoder:
+    embedding: Embedding
+
+
+@dataclasses.dataclass
+class Decoder:
+    embedding: Embedding
+
+
+@dataclasses.dataclass
+class Model:
+    encoder: Encoder
+    decoder: Decoder
+
+
+def measure(name: str, config: Dict[str, Any]) -> None:
+    builder = ColtBuilder()
+    tracemalloc.start()
+    start = time.perf_counter()
+    builder(config, Model)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<12} {elapsed * 1e3:10.1f} ms {peak / 2**20:10.1f} MiB")
+
+
+def main() -> None:
+    embedding = {"rows": 20_000, "dim": 64}
+    measure("duplicated", {"encoder": {"embedding": embedding}, "decoder": {"embedding": embedding}})
+    measure(
+        "referenced", {"encoder": {"embedding": embedding}, "decoder": {"embedding": {"@ref": "encoder.embedding"}}}
+    )
+
+
+if __name__ == "__main__":
+    main()
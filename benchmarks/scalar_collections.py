@@ -0,0 +1,40 @@
+"""Benchmark building large collections of scalars.
+
+Usage:
+    python benchmarks/scalar_collections.py
+
+``fast`` builds with a plain builder. ``per-element`` installs a no-op
+``on_build`` callback, which makes the builder call ``_build`` for every element.
+"""
+
+import timeit
+from typing import Any, Callable, Dict, List
+
+from colt import ColtBuilder, ColtCallback
+
+
+class Noop(ColtCallback):
+    hooks = ("on_build",)
+
+
+def measure(name: str, func: Callable[[], Any], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<28} {seconds * 1e3:10.2f} ms/build")
+
+
+def main() -> None:
+    size = 100_000
+    cases = [
+        ("List[float]", [i / 3 for i in range(size)], List[float]),
+        ("List[float] (ints)", list(range(size)), List[float]),
+        ("Dict[str, int]", {f"k{i}": i for i in range(size)}, Dict[str, int]),
+    ]
+    fast, slow = ColtBuilder(), ColtBuilder(callback=Noop())
+    for label, config, annotation in cases:
+        assert fast(config, annotation) == slow(config, annotation)
+        measure(f"{label}/fast", lambda: fast(config, annotation), 5)
+        measure(f"{label}/per-element", lambda: slow(config, annotation), 5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark finding every error of a config.
+
+Usage:
+    python benchmarks/validate.py
+
+``dry_run`` stops at the first error, so finding all errors of a config takes
+one run per error (fixing the reported error before the next run), plus a run
+on the fixed config. ``validate`` reports every error in a single pass.
+"""
+
+import copy
+import dataclasses
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from colt import ColtBuilder, ConfigurationError
+
+
+@dataclasses.dataclass
+class Optimizer:
+    lr: float
+    betas: List[float]
+
+
+@dataclasses.dataclass
+class Experiment:
+    name: str
+    seed: int
+    features: List[int]
+    metrics: Dict[str, float]
+    optimizer: Optimizer
+
+
+def experiment(i: int) -> Dict[str, Any]:
+    return {
+        "name": f"exp{i}",
+        "seed": i,
+        "features": list(range(200)),
+        "metrics": {f"m{j}": j / 10 for j in range(50)},
+        "optimizer": {"lr": 0.01, "betas": [0.9, 0.999]},
+    }
+
+
+def make_configs(size: int, errors: int) -> List[List[Dict[str, Any]]]:
+    """Configs with `errors`, `errors - 1`, ..., 0 remaining errors."""
+    valid = [experiment(i) for i in range(size)]
+    broken = copy.deepcopy(valid)
+    step = size // errors
+    for k in range(errors):
+        broken[k * step]["optimizer"]["lr"] = "fast"
+    configs = []
+    for fixed in range(errors + 1):
+        config = copy.deepcopy(broken)
+        for k in range(fixed):
+            config[k * step]["optimizer"]["lr"] = 0.01
+        configs.append(config)
+    return configs
+
+
+def dry_run_until_valid(builder: ColtBuilder, configs: List[Any]) -> int:
+    runs = 0
+    for config in configs:
+        runs += 1
+        try:
+            builder.dry_run(config, List[Experiment])
+        except ConfigurationError:
+            continue
+    return runs
+
+
+def measure(name: str, func: Callable[[], Any]) -> None:
+    seconds = min(timeit.repeat(func, number=3, repeat=5)) / 3
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<22} {seconds * 1e3:10.1f} ms {peak / 1024:10.1f} KiB peak")
+
+
+def main() -> None:
+    size, errors = 200, 20
+    configs = make_configs(size, errors)
+    builder = ColtBuilder()
+
+    report = builder.validate(configs[0], List[Experiment])
+    assert len(report.issues) == errors
+    assert dry_run_until_valid(builder, configs) == errors + 1
+
+    measure("dry_run x errors", lambda: dry_run_until_valid(builder, configs))
+    measure("validate", lambda: builder.validate(configs[0], List[Experiment]))
+    measure("dry_run (valid)", lambda: builder.dry_run(configs[-1], List[Experiment]))
+    measure("validate (valid)", lambda: builder.validate(configs[-1], List[Experiment]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,22 @@
 from importlib.metadata import version
-from typing import Any, Callable, Optional, Sequence, Type, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from colt.builder import ColtBuilder
+from colt.cache import CacheInfo, DiskCache, ObjectCache
 from colt.callback import ColtCallback, SkipCallback
 from colt.constructed import Constructed
 from colt.context import ColtContext
@@ -10,24 +25,38 @@ from colt.error import ConfigurationError
 from colt.jsonschema import JsonSchemaGenerator
 from colt.lazy import Lazy
 from colt.placeholder import Placeholder
+from colt.plan import BuildPlan
 from colt.registrable import Registrable
 from colt.utils import import_modules
+from colt.validation import LazyValidationInfo, ValidationIssue, ValidationReport
 
 __version__ = version("colt")
 __all__ = [
+    "BuildPlan",
+    "CacheInfo",
     "Lazy",
+    "LazyValidationInfo",
     "Registrable",
     "ColtContext",
     "ConfigurationError",
     "Constructed",
     "DefaultRegistry",
+    "DiskCache",
     "JsonSchemaGenerator",
+    "ObjectCache",
     "Placeholder",
     "SkipCallback",
+    "ValidationIssue",
+    "ValidationReport",
     "import_modules",
     "register",
+    "register_entry_points",
+    "register_lazy",
+    "abuild",
     "build",
+    "build_many",
     "dry_run",
+    "validate",
 ]
 
 T = TypeVar("T")
@@ -37,14 +66,24 @@ def register(
     name: str,
     constructor: Optional[str] = None,
     exist_ok: bool = False,
+    executor: Optional[Literal["process"]] = None,
+    cacheable: bool = False,
 ) -> Callable[[Type[T]], Type[T]]:
     def decorator(cls: Type[T]) -> Type[T]:
-        DefaultRegistry.register(name, constructor, exist_ok)(cls)
+        DefaultRegistry.register(name, constructor, exist_ok, executor, cacheable)(cls)
         return cls
 
     return decorator
 
 
+def register_lazy(manifest: Mapping[str, str], exist_ok: bool = False) -> None:
+    DefaultRegistry.register_lazy(manifest, exist_ok)
+
+
+def register_entry_points(group: str, exist_ok: bool = False) -> None:
+    DefaultRegistry.register_entry_points(group, exist_ok)
+
+
 @overload
 def build(
     config: Any,
@@ -54,6 +93,8 @@ def build(
     argskey: Optional[str] = ...,
     strict: bool = ...,
     callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
 ) -> T: ...
 
 
@@ -66,6 +107,8 @@ def build(
     argskey: Optional[str] = ...,
     strict: bool = ...,
     callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
 ) -> T: ...
 
 
@@ -78,6 +121,8 @@ def build(
     argskey: Optional[str] = ...,
     strict: bool = ...,
     callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
 ) -> Any: ...
 
 
@@ -90,6 +135,8 @@ def build(
     schemakey: Optional[str] = None,
     strict: bool = False,
     callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = None,
+    tagkey: Optional[str] = None,
+    refkey: Optional[str] = None,
 ) -> Union[T, Any]:
     builder = ColtBuilder(
         typekey=typekey,
@@ -97,10 +144,178 @@ def build(
         schemakey=schemakey,
         strict=strict,
         callback=callback,
+        tagkey=tagkey,
+        refkey=refkey,
     )
     return builder(config, cls)
 
 
+@overload
+async def abuild(
+    config: Any,
+    cls: Type[T],
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+) -> T: ...
+
+
+@overload
+async def abuild(
+    config: Any,
+    cls: Callable[..., T],
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+) -> T: ...
+
+
+@overload
+async def abuild(
+    config: Any,
+    cls: None = ...,
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+) -> Any: ...
+
+
+async def abuild(
+    config: Any,
+    cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+    *,
+    typekey: Optional[str] = None,
+    argskey: Optional[str] = None,
+    schemakey: Optional[str] = None,
+    strict: bool = False,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = None,
+    tagkey: Optional[str] = None,
+    refkey: Optional[str] = None,
+) -> Union[T, Any]:
+    builder = ColtBuilder(
+        typekey=typekey,
+        argskey=argskey,
+        schemakey=schemakey,
+        strict=strict,
+        callback=callback,
+        tagkey=tagkey,
+        refkey=refkey,
+    )
+    return await builder.abuild(config, cls)
+
+
+@overload
+def build_many(
+    configs: Iterable[Any],
+    cls: Type[T],
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+    lazy: Literal[False] = ...,
+) -> List[T]: ...
+
+
+@overload
+def build_many(
+    configs: Iterable[Any],
+    cls: Type[T],
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+    lazy: Literal[True],
+) -> Iterator[T]: ...
+
+
+@overload
+def build_many(
+    configs: Iterable[Any],
+    cls: Callable[..., T],
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+    lazy: Literal[False] = ...,
+) -> List[T]: ...
+
+
+@overload
+def build_many(
+    configs: Iterable[Any],
+    cls: Callable[..., T],
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+    lazy: Literal[True],
+) -> Iterator[T]: ...
+
+
+@overload
+def build_many(
+    configs: Iterable[Any],
+    cls: None = ...,
+    *,
+    typekey: Optional[str] = ...,
+    argskey: Optional[str] = ...,
+    strict: bool = ...,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = ...,
+    tagkey: Optional[str] = ...,
+    refkey: Optional[str] = ...,
+    lazy: bool = ...,
+) -> Any: ...
+
+
+def build_many(
+    configs: Iterable[Any],
+    cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+    *,
+    typekey: Optional[str] = None,
+    argskey: Optional[str] = None,
+    schemakey: Optional[str] = None,
+    strict: bool = False,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = None,
+    tagkey: Optional[str] = None,
+    refkey: Optional[str] = None,
+    lazy: bool = False,
+) -> Union[List[T], Iterator[T], Any]:
+    builder = ColtBuilder(
+        typekey=typekey,
+        argskey=argskey,
+        schemakey=schemakey,
+        strict=strict,
+        callback=callback,
+        tagkey=tagkey,
+        refkey=refkey,
+    )
+    return builder.build_many(configs, cls, lazy=lazy)
+
+
 def dry_run(
     config: Any,
     cls: Optional[Union[Type[T], Callable[..., T]]] = None,
@@ -110,6 +325,8 @@ def dry_run(
     schemakey: Optional[str] = None,
     strict: bool = False,
     callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = None,
+    tagkey: Optional[str] = None,
+    refkey: Optional[str] = None,
 ) -> None:
     builder = ColtBuilder(
         typekey=typekey,
@@ -117,5 +334,31 @@ def dry_run(
         schemakey=schemakey,
         strict=strict,
         callback=callback,
+        tagkey=tagkey,
+        refkey=refkey,
     )
     builder.dry_run(config, cls)
+
+
+def validate(
+    config: Any,
+    cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+    *,
+    typekey: Optional[str] = None,
+    argskey: Optional[str] = None,
+    schemakey: Optional[str] = None,
+    strict: bool = False,
+    callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = None,
+    tagkey: Optional[str] = None,
+    refkey: Optional[str] = None,
+) -> ValidationReport:
+    builder = ColtBuilder(
+        typekey=typekey,
+        argskey=argskey,
+        schemakey=schemakey,
+        strict=strict,
+        callback=callback,
+        tagkey=tagkey,
+        refkey=refkey,
+    )
+    return builder.validate(config, cls)
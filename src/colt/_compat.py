@@ -47,4 +47,15 @@ else:
             return cls
 
 
-__all__ = ["GenericAlias", "UnionType", "EnumType", "NoneType"]
+# entry_points(group=...)
+if sys.version_info >= (3, 10):
+    from importlib.metadata import entry_points
+else:
+    from importlib.metadata import EntryPoint
+    from importlib.metadata import entry_points as _entry_points
+
+    def entry_points(*, group: str) -> "list[EntryPoint]":
+        return list(_entry_points().get(group, ()))
+
+
+__all__ = ["GenericAlias", "UnionType", "EnumType", "NoneType", "entry_points"]
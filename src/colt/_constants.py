@@ -3,3 +3,5 @@ from typing import Final
 DEFAULT_TYPEKEY: Final = "@type"
 DEFAULT_ARGSKEY: Final = "*"
 DEFAULT_SCHEMAKEY: Final = "$schema"
+DEFAULT_REFKEY: Final = "@ref"
+DEFAULT_ENGINE: Final = "recursive"
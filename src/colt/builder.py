@@ -1,15 +1,24 @@
-import io
+import asyncio
+import inspect
+import pickle
 import textwrap
+import threading
 import traceback
-import typing
 import warnings
-from collections import abc
+from collections import OrderedDict, abc
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import suppress
+from contextvars import ContextVar
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
-    ForwardRef,
+    FrozenSet,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -21,12 +30,12 @@ from typing import (
     TypeVar,
     Union,
     cast,
-    get_type_hints,
     overload,
 )
 
 from colt import _constants
-from colt._compat import EnumType, GenericAlias, UnionType
+from colt._compat import GenericAlias, NoneType, UnionType
+from colt.cache import CacheInfo, DiskCache, ObjectCache, UnionMismatchCache, get_config_key, get_config_shape
 from colt.callback import ColtCallback, MultiCallback, SkipCallback
 from colt.constructed import Constructed
 from colt.context import ColtContext
@@ -34,28 +43,204 @@ from colt.default_registry import DefaultRegistry
 from colt.error import ConfigurationError
 from colt.lazy import Lazy
 from colt.placeholder import Placeholder
+from colt.plan import BuildPlan, PlanCache
+from colt.record import BuildRecord, find_unchanged_paths
+from colt.reference import ReferenceTable, find_references
 from colt.registrable import Registrable
-from colt.types import ParamPath
+from colt.signature import SignatureCache
+from colt.types import LinkedPath, ParamPath
 from colt.utils import (
-    evaluate_forward_refs,
     get_new_type_constructor,
     get_path_name,
-    get_typevar_map,
-    infer_scope,
-    is_namedtuple,
     is_new_type,
     is_typeddict,
     issubtype,
-    remove_optional,
     replace_types,
     reveal_origin,
-    trace_bases,
+    to_linked_path,
+    to_param_path,
 )
+from colt.validation import LazyValidationInfo, ValidationIssue, ValidationReport, ValidationScope
 
 T = TypeVar("T")
 
+# A handler is called as `handler(builder, config, path, plan, *, context,
+# raise_configuration_error, skip_construction)` for annotations whose origin it is
+# registered for, and `path` is an opaque `LinkedPath`. A plain handler returns the
+# built value and builds nested values with `builder.build_child(child_config, path,
+# key, child_annotation, context=context)`. A generator handler instead yields a
+# `BuildRequest` (see `ColtBuilder.child_request`) for each nested value, receives its
+# result (or its exception) and returns the built value, so that it can be driven by
+# any engine. Configs the handler does not accept may be delegated to the default
+# handler with `builder.build_default` (or `yield from builder.default_steps(...)` from
+# a generator handler). Generator handlers may also yield a `GatherRequest` for nested
+# values that do not depend on each other, and an `AwaitRequest` for the result of an
+# asynchronous constructor.
+BuildHandler = Callable[..., Any]
+# `(config, path, annotation, raise_configuration_error, skip_construction)` of a nested value.
+BuildRequest = Tuple[Any, LinkedPath, Any, bool, bool]
+
+
+class GatherRequest:
+    """Request to build independent nested values, resumed with the list of their values.
+
+    `abuild` builds them concurrently, other engines one after another.
+    """
+
+    __slots__ = ("requests",)
+
+    def __init__(self, requests: List[BuildRequest]) -> None:
+        self.requests = requests
+
+
+class AwaitRequest:
+    """Request to await the result of a constructor, resumed with the awaited value.
+
+    `abuild` awaits it, other engines resume with the awaitable itself.
+    """
+
+    __slots__ = ("awaitable",)
+
+    def __init__(self, awaitable: Any) -> None:
+        self.awaitable = awaitable
+
+
+class _TypeMismatchError(ConfigurationError):
+    """Mismatch of the type of the config at `path` and the annotation it is built with.
+
+    Unlike other errors, it only depends on the type of the config, so union members
+    rejected with it for a config are rejected for every config of the same shape.
+    """
+
+    def __init__(self, message: str, path: LinkedPath = None) -> None:
+        super().__init__(message)
+        self.path = path
+
+
+# `(config, path, annotation, kind, value)` of an argument compiled by an `ObjectFactory`.
+# Depending on `kind`, `value` is the value of a "constant" argument, the `ObjectFactory`
+# of an "object" argument, or the compiled elements of a "list" argument. Arguments of
+# the kind "build" are built with the builder.
+FactoryArgument = Tuple[Any, LinkedPath, Any, str, Any]
+
+
+class ObjectFactory:
+    """Compiled construction of an object config that has been built once.
+
+    The constructor and the annotations of the arguments are resolved once, arguments
+    whose configs are immutable scalars are built once, since they always build to the
+    same value, and nested objects and lists are compiled as well. Other arguments,
+    and arguments whose configs are not the compiled ones (e.g. overridden by
+    `override_fields`), are built with the builder on each call. Created by
+    `ColtBuilder._compile_factory`.
+    """
+
+    def __init__(
+        self,
+        builder: "ColtBuilder",
+        annotation: Any,
+        constructor: Callable[..., Any],
+        path: LinkedPath,
+        typename: Any,
+        args_config: Any,
+        args: List[FactoryArgument],
+        kwargs: Dict[str, FactoryArgument],
+    ) -> None:
+        self.builder = builder
+        self.annotation = annotation
+        self.constructor = constructor
+        self.path = path
+        self.typename = typename
+        self.args_config = args_config
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self, config: Any, context: ColtContext) -> Any:
+        builder = self.builder
+        typekey, argskey = builder._typekey, builder._argskey
+        if (
+            not isinstance(config, abc.Mapping)
+            or config.get(typekey) is not self.typename
+            or config.get(argskey) is not self.args_config
+        ):
+            return builder._build(config, self.path, self.annotation, context=context)
+
+        args = [self._build_argument(argument, argument[0], context) for argument in self.args]
+        kwargs: Dict[str, Any] = {}
+        type_hints = builder._signatures[self.constructor].type_hints
+        for key, val in config.items():
+            if key == typekey or key == argskey:
+                continue
+            argument = self.kwargs.get(key)
+            if argument is None:
+                kwargs[key] = builder._build(val, (self.path, key), type_hints.get(key), context=context)
+            else:
+                kwargs[key] = self._build_argument(argument, val, context)
+
+        try:
+            return self.constructor(*args, **kwargs)
+        except Exception as e:
+            raise ConfigurationError(
+                f"[{get_path_name(to_param_path(self.path))}] Failed to construct object with constructor "
+                f"{self.constructor}."
+            ) from e
+
+    def _build_argument(self, argument: FactoryArgument, config: Any, context: ColtContext) -> Any:
+        compiled, path, annotation, kind, value = argument
+        if kind == "constant":
+            if config is compiled:
+                return value
+        elif kind == "object":
+            return value(config, context)
+        elif kind == "list":
+            if type(config) is list and len(config) == len(value):
+                return [self._build_argument(element, x, context) for element, x in zip(value, config)]
+        return self.builder._build(config, path, annotation, context=context)
+
+
+StepRequest = Union[BuildRequest, GatherRequest, AwaitRequest]
+BuildSteps = Generator[StepRequest, Any, Any]
+HandlerT = TypeVar("HandlerT", bound=BuildHandler)
+
+# Element types of collections built without a per-element `_build` call when no
+# `on_build` callback is installed, mapped to the config types returned as they are. Other
+# configs (including ints for float and subclasses such as enums) take the usual path.
+_SCALAR_TYPES: Dict[Any, Tuple[type, ...]] = {int: (int, bool), float: (float,), str: (str,), bool: (bool,)}
+# Config types that are valid for each scalar type without building them, used when
+# construction is skipped.
+_VALID_SCALAR_CONFIGS: Dict[Any, Tuple[type, ...]] = {**_SCALAR_TYPES, float: (float, int, bool)}
+
+_COLLECTION_TYPES = (list, set, tuple, abc.Mapping)
+# Config types of arguments that are built once by an `ObjectFactory`, if they build to
+# the same types.
+_CONSTANT_TYPES = {str, int, float, bool, NoneType}
+
+
+# Marks threads building subtrees for a parallel builder, which build nested arguments
+# sequentially so that they never wait for tasks queued behind them.
+_worker_state = threading.local()
+
+# Set while `abuild` runs, so that arguments are requested with `GatherRequest`.
+_async_build: ContextVar[bool] = ContextVar("colt_async_build", default=False)
+# Set while a config is only checked and the result is discarded (`validate` and the
+# checks of `Lazy`), so that collections are not assembled from skipped values.
+_check_only: ContextVar[bool] = ContextVar("colt_check_only", default=False)
+
+
+def _is_scalar_type(annotation: Any) -> bool:
+    return isinstance(annotation, type) and annotation in _SCALAR_TYPES
+
+
+def _gather_steps(requests: List[BuildRequest]) -> Generator[BuildRequest, Any, List[Any]]:
+    values: List[Any] = []
+    for request in requests:
+        values.append((yield request))
+    return values
+
 
 class ColtBuilder:
+    _handlers: ClassVar[Dict[Any, BuildHandler]] = {}
+
     def __init__(
         self,
         typekey: Optional[str] = None,
@@ -63,6 +248,16 @@ class ColtBuilder:
         schemakey: Optional[str] = None,
         strict: bool = False,
         callback: Optional[Union[ColtCallback, Sequence[ColtCallback]]] = None,
+        tagkey: Optional[str] = None,
+        union_cache: bool = False,
+        engine: Optional[Literal["recursive", "stack"]] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        process_executor: Optional[ProcessPoolExecutor] = None,
+        refkey: Optional[str] = None,
+        object_cache: Optional[ObjectCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        history: int = 0,
+        defer_lazy_validation: bool = False,
     ) -> None:
         if isinstance(callback, abc.Sequence):
             callback = MultiCallback(*callback)
@@ -72,6 +267,33 @@ class ColtBuilder:
         self._schemakey = schemakey or _constants.DEFAULT_SCHEMAKEY
         self._strict = strict
         self._callback = callback
+        # callbacks are only called for the hooks they implement
+        self._start_callback = callback if callback is not None and callback.implements("on_start") else None
+        self._build_callback = callback if callback is not None and callback.implements("on_build") else None
+        self._tagkey = tagkey
+        self._refkey = refkey or _constants.DEFAULT_REFKEY
+        self._union_cache = UnionMismatchCache() if union_cache else None
+        self._object_cache = object_cache
+        self._disk_cache = disk_cache
+        # records of the latest results, keyed on their ids, for `rebuild`
+        self._history = history
+        self._records: "OrderedDict[int, Tuple[Any, BuildRecord]]" = OrderedDict()
+        self._defer_lazy_validation = defer_lazy_validation
+        self._lazy_validation_lock = threading.Lock()
+        self._lazy_validation_counts = [0, 0, 0, 0]
+        self._plans = PlanCache()
+        self._signatures = SignatureCache()
+
+        self._executor = executor
+        self._process_executor = process_executor
+
+        self._engine = engine or _constants.DEFAULT_ENGINE
+        if self._engine == "recursive":
+            self._run = self._run_recursive
+        elif self._engine == "stack":
+            self._run = self._run_stack
+        else:
+            raise ValueError(f"unknown engine: {self._engine}")
 
     @property
     def typekey(self) -> str:
@@ -81,6 +303,14 @@ class ColtBuilder:
     def argskey(self) -> str:
         return self._argskey
 
+    @property
+    def tagkey(self) -> Optional[str]:
+        return self._tagkey
+
+    @property
+    def refkey(self) -> str:
+        return self._refkey
+
     @property
     def strict(self) -> bool:
         return self._strict
@@ -89,6 +319,200 @@ class ColtBuilder:
     def callback(self) -> Optional[ColtCallback]:
         return self._callback
 
+    @property
+    def engine(self) -> str:
+        return self._engine
+
+    @property
+    def executor(self) -> Optional[ThreadPoolExecutor]:
+        return self._executor
+
+    @property
+    def process_executor(self) -> Optional[ProcessPoolExecutor]:
+        return self._process_executor
+
+    @property
+    def union_cache_info(self) -> Optional[CacheInfo]:
+        """Statistics of the union choice cache, or `None` if it is disabled."""
+        if self._union_cache is None:
+            return None
+        return self._union_cache.info()
+
+    @property
+    def object_cache(self) -> Optional[ObjectCache]:
+        return self._object_cache
+
+    @property
+    def object_cache_info(self) -> Optional[CacheInfo]:
+        """Statistics of the object cache, or `None` if it is not given."""
+        if self._object_cache is None:
+            return None
+        return self._object_cache.info()
+
+    @property
+    def disk_cache(self) -> Optional[DiskCache]:
+        return self._disk_cache
+
+    @property
+    def history(self) -> int:
+        return self._history
+
+    @property
+    def defer_lazy_validation(self) -> bool:
+        return self._defer_lazy_validation
+
+    @property
+    def lazy_validation_info(self) -> LazyValidationInfo:
+        """Statistics of the validations of the `Lazy` configs created by this builder."""
+        with self._lazy_validation_lock:
+            return LazyValidationInfo(*self._lazy_validation_counts)
+
+    @classmethod
+    def register_handler(
+        cls,
+        *origins: Any,
+        exist_ok: bool = False,
+    ) -> Callable[[HandlerT], HandlerT]:
+        """Register a handler used to build annotations with the given origins.
+
+        The handler may be a plain function or a generator function yielding the
+        builds of nested values (see `BuildHandler`). Plans compiled before the
+        registration keep their previous handler.
+        """
+
+        def decorator(handler: HandlerT) -> HandlerT:
+            for origin in origins:
+                if not exist_ok and origin in cls._handlers:
+                    raise ValueError(f"handler conflict: {origin}")
+                cls._handlers[origin] = handler
+            return handler
+
+        return decorator
+
+    def build_child(
+        self,
+        config: Any,
+        path: LinkedPath,
+        key: Union[int, str],
+        annotation: Optional[Union[Type[T], Callable[..., T], Any]] = None,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool = True,
+        skip_construction: bool = False,
+    ) -> Union[T, Any]:
+        """Build the nested value at `key` of the config a handler is called with."""
+        return self._build(
+            config,
+            (path, key),
+            annotation,
+            context=context,
+            raise_configuration_error=raise_configuration_error,
+            skip_construction=skip_construction,
+        )
+
+    @staticmethod
+    def child_request(
+        config: Any,
+        path: LinkedPath,
+        key: Union[int, str],
+        annotation: Any = None,
+        *,
+        raise_configuration_error: bool = True,
+        skip_construction: bool = False,
+    ) -> BuildRequest:
+        """Request yielded by a generator handler to build the nested value at `key`."""
+        return (config, (path, key), annotation, raise_configuration_error, skip_construction)
+
+    def build_default(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> Any:
+        """Build a config with the default handler, e.g. from a custom handler."""
+        return self._run(
+            self.default_steps(
+                config,
+                path,
+                plan,
+                context=context,
+                raise_configuration_error=raise_configuration_error,
+                skip_construction=skip_construction,
+            ),
+            context,
+        )
+
+    def default_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        """Steps of the default handler, to be delegated to from a generator handler."""
+        return self._object_steps(
+            config,
+            path,
+            plan,
+            context=context,
+            raise_configuration_error=raise_configuration_error,
+            skip_construction=skip_construction,
+        )
+
+    def compile(self, cls: Optional[Union[Type[T], Callable[..., T], Any]] = None) -> BuildPlan:
+        """Analyse an annotation once and return its cached build plan."""
+        try:
+            return self._plans[cls]
+        except KeyError:
+            plan = self._plans[cls] = self._compile(cls)
+            return plan
+        except TypeError:
+            # unhashable annotations (e.g. Annotated with unhashable metadata) are not cached
+            return self._compile(cls)
+
+    def _compile(self, cls: Any) -> BuildPlan:
+        plan = BuildPlan.from_annotation(cls)
+        self._resolve_handler(plan)
+        return plan
+
+    def _resolve_handler(self, plan: BuildPlan) -> BuildHandler:
+        handler = plan.handler = self._get_handler(plan)
+        plan.stepwise = inspect.isgeneratorfunction(handler)
+        return handler
+
+    def _get_handler(self, plan: BuildPlan) -> BuildHandler:
+        try:
+            handler = self._handlers.get(plan.origin)
+        except TypeError:
+            handler = None
+        if handler is not None:
+            return handler
+        if plan.is_namedtuple:
+            return ColtBuilder._namedtuple_steps
+        if plan.is_enum:
+            return ColtBuilder._build_enum
+        return ColtBuilder._object_steps
+
+    def invalidate_caches(self, *modules: str) -> None:
+        """Drop cached plans and constructor signatures.
+
+        If module names are given, only entries for objects defined in these modules
+        (or their submodules) are dropped, e.g. after reloading them.
+        """
+        self._plans.invalidate(modules)
+        self._signatures.invalidate(modules)
+        if self._union_cache is not None:
+            self._union_cache.clear()
+        if self._object_cache is not None:
+            self._object_cache.clear()
+
     @overload
     def __call__(self, config: Any) -> Any: ...
 
@@ -105,14 +529,134 @@ class ColtBuilder:
         self,
         config: Any,
         cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> Union[T, Any]:
+        return self._build_root(config, cls, BuildRecord() if self._history > 0 else None)
+
+    def rebuild(
+        self,
+        old_config: Any,
+        old_result: Any,
+        new_config: Any,
+        cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> Union[T, Any]:
+        """Build `new_config`, reusing the objects of `old_result` built from unchanged parts of `old_config`.
+
+        `old_result` must be one of the latest `history` results of this builder. An
+        object is reused if the config at its path is equal in both configs and it was
+        built for the same annotation, so only changed paths and their ancestors are
+        constructed again. Nothing is reused if callbacks are given or the new config
+        contains references, since the objects may then depend on other parts of the config.
+        """
+        entry = self._records.get(id(old_result))
+        if entry is None or entry[0] is not old_result:
+            raise ValueError(
+                "old_result is not one of the latest results of this builder; "
+                "give the builder a positive `history` to rebuild its results."
+            )
+        if self._callback is not None:
+            return self._build_root(new_config, cls, BuildRecord())
+        if isinstance(old_config, abc.Mapping) and self._schemakey in old_config:
+            old_config = {k: v for k, v in old_config.items() if k != self._schemakey}
+        if isinstance(new_config, abc.Mapping) and self._schemakey in new_config:
+            new_config = {k: v for k, v in new_config.items() if k != self._schemakey}
+        return self._build_root(new_config, cls, entry[1].reuse(find_unchanged_paths(old_config, new_config)))
+
+    def _build_root(
+        self,
+        config: Any,
+        cls: Optional[Union[Type[T], Callable[..., T]]],
+        record: Optional[BuildRecord],
     ) -> Union[T, Any]:
         if isinstance(config, abc.Mapping) and self._schemakey in config:
             config = {k: v for k, v in config.items() if k != self._schemakey}
         context = ColtContext(config=config)
-        if self._callback is not None:
+        if self._start_callback is not None:
+            with suppress(SkipCallback):
+                config = self._start_callback.on_start(config, self, context, cls)
+        context.references = ReferenceTable.from_config(config, self._refkey, cls)
+        if record is not None and record.reusable and context.references is not None:
+            record = BuildRecord()
+        context.record = record
+        obj = self._build(config, None, cls, context=context)
+        if record is not None:
+            self._records[id(obj)] = (obj, record)
+            self._records.move_to_end(id(obj))
+            while len(self._records) > self._history:
+                self._records.popitem(last=False)
+        return obj
+
+    @overload
+    async def abuild(self, config: Any) -> Any: ...
+
+    @overload
+    async def abuild(self, config: Any, cls: Type[T]) -> T: ...
+
+    @overload
+    async def abuild(self, config: Any, cls: Callable[..., T]) -> T: ...
+
+    @overload
+    async def abuild(self, config: Any, cls: None = ...) -> Any: ...
+
+    async def abuild(
+        self,
+        config: Any,
+        cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> Union[T, Any]:
+        """Build a config like calling the builder, awaiting asynchronous constructors.
+
+        Awaitables returned by constructors (e.g. `async def` factory methods registered
+        as constructors) are awaited. Arguments configured with mappings or collections
+        are built concurrently with `asyncio.gather`, and the first error in the order of
+        the config is raised once all of them are finished.
+        """
+        if isinstance(config, abc.Mapping) and self._schemakey in config:
+            config = {k: v for k, v in config.items() if k != self._schemakey}
+        context = ColtContext(config=config)
+        if self._start_callback is not None:
             with suppress(SkipCallback):
-                config = self._callback.on_start(config, self, context, cls)
-        return self._build(config, (), cls, context=context)
+                config = self._start_callback.on_start(config, self, context, cls)
+        context.references = ReferenceTable.from_config(config, self._refkey, cls)
+        # shared objects are built one at a time
+        token = _async_build.set(context.references is None)
+        try:
+            return await self._abuild(config, None, cls, context, True)
+        finally:
+            _async_build.reset(token)
+
+    @overload
+    def build_many(self, configs: Iterable[Any], cls: Type[T], *, lazy: Literal[False] = ...) -> List[T]: ...
+
+    @overload
+    def build_many(self, configs: Iterable[Any], cls: Type[T], *, lazy: Literal[True]) -> Iterator[T]: ...
+
+    @overload
+    def build_many(self, configs: Iterable[Any], cls: Callable[..., T], *, lazy: Literal[False] = ...) -> List[T]: ...
+
+    @overload
+    def build_many(self, configs: Iterable[Any], cls: Callable[..., T], *, lazy: Literal[True]) -> Iterator[T]: ...
+
+    @overload
+    def build_many(self, configs: Iterable[Any], cls: None = ..., *, lazy: bool = ...) -> Any: ...
+
+    def build_many(
+        self,
+        configs: Iterable[Any],
+        cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+        *,
+        lazy: bool = False,
+    ) -> Union[List[T], Iterator[T], Any]:
+        """Build every config of `configs` into `cls`.
+
+        The build plan of `cls` and the constructor signatures are resolved once
+        and shared across the batch, while each config gets its own context.
+        `configs` may be any iterable. With `lazy=True`, an iterator is returned
+        and each config is built when the iterator is advanced.
+        """
+        self.compile(cls)
+        results = (self(config, cls) for config in configs)
+        if lazy:
+            return results
+        return list(results)
 
     def dry_run(
         self,
@@ -123,15 +667,196 @@ class ColtBuilder:
         context: Optional[ColtContext] = None,
     ) -> Union[T, Any]:
         context = context or ColtContext(config=config)
-        if self._callback is not None:
+        if self._start_callback is not None:
             with suppress(SkipCallback):
-                config = self._callback.on_start(config, self, context, cls)
-        return self._build(config, path, cls, context=context, skip_construction=True)
+                config = self._start_callback.on_start(config, self, context, cls)
+        if context.references is None:
+            context.references = ReferenceTable.from_config(config, self._refkey, cls)
+        return self._build(config, to_linked_path(path), cls, context=context, skip_construction=True)
+
+    def validate(
+        self,
+        config: Any,
+        cls: Optional[Union[Type[T], Callable[..., T]]] = None,
+        *,
+        path: ParamPath = (),
+        context: Optional[ColtContext] = None,
+    ) -> ValidationReport:
+        """Check a config without constructing objects and report every configuration error.
+
+        Unlike `dry_run`, checking does not stop at the first error: an invalid value is
+        reported with its path and the rest of the config is checked as well. Failures of
+        the members of a union are reported as a single error of the union.
+        """
+        context = context or ColtContext(config=config)
+        if self._start_callback is not None:
+            with suppress(SkipCallback):
+                config = self._start_callback.on_start(config, self, context, cls)
+        if context.references is None:
+            context.references = ReferenceTable.from_config(config, self._refkey, cls)
+        report = ValidationReport()
+        linked_path = to_linked_path(path)
+        token = _check_only.set(True)
+        try:
+            _, steps = self._begin_build(config, linked_path, cls, context, True, True)
+            if steps is not None:
+                self._run_validation(steps, linked_path, context, report.issues)
+        except ConfigurationError as e:
+            report.issues.append(ValidationIssue(path, e))
+        finally:
+            _check_only.reset(token)
+        return report
+
+    def _validate_lazy(
+        self,
+        config: Any,
+        cls: Any,
+        path: ParamPath,
+        context: ColtContext,
+        updates: Optional[Sequence[Tuple[ParamPath, Any]]] = None,
+    ) -> None:
+        """Dry-run the config of a `Lazy`, or only its updated fields if `updates` are given.
+
+        `updates` are the paths of the updated fields relative to the config and their
+        new values. The whole config is checked if callbacks are installed or references
+        are involved, since checking a field may then depend on the rest of the config.
+        """
+        token = _check_only.set(True)
+        try:
+            if updates is None:
+                self._count_lazy_validation(full=1)
+                self.dry_run(config, cls, path=path, context=context)
+                return
+            if (
+                self._callback is not None
+                or context.references is not None
+                or any(find_references(value, self._refkey) for _, value in updates)
+            ):
+                self._count_lazy_validation(full=1)
+                self.dry_run(config, cls, path=path, context=context)
+                return
+            # keys selecting the constructor of a mapping affect how its other fields are checked
+            selectors = (self._typekey, self._argskey, self._tagkey)
+            scope = ValidationScope(
+                to_linked_path(path + (field_path[:-1] if field_path and field_path[-1] in selectors else field_path))
+                for field_path, _ in updates
+            )
+            try:
+                self._build(
+                    config,
+                    to_linked_path(path),
+                    cls,
+                    context=ColtContext(config=config, scope=scope),
+                    skip_construction=True,
+                )
+            finally:
+                self._count_lazy_validation(scoped=1, skipped=scope.skipped)
+        finally:
+            _check_only.reset(token)
+
+    def _compile_factory(
+        self,
+        config: Any,
+        path: ParamPath,
+        annotation: Any,
+        context: ColtContext,
+    ) -> Optional[ObjectFactory]:
+        """Compile the construction of an object config that has been built once, e.g. by a `Lazy`.
+
+        Returns `None` if the config has to be built as usual, i.e. if it is not the
+        config of an object with a non-generic constructor, or if callbacks, references,
+        records or executors take part in building it.
+        """
+        if (
+            self._callback is not None
+            or self._executor is not None
+            or self._process_executor is not None
+            or context.references is not None
+            or context.record is not None
+        ):
+            return None
+        return self._compile_object(config, to_linked_path(path), annotation)
+
+    def _compile_object(self, config: Any, path: LinkedPath, annotation: Any) -> Optional[ObjectFactory]:
+        if not isinstance(config, abc.Mapping):
+            return None
+        plan = self.compile(annotation)
+        handler = plan.handler or self._resolve_handler(plan)
+        if handler is not ColtBuilder._object_steps or plan.annotation is None or plan.is_callable or plan.is_typevar:
+            return None
+
+        constructor: Any
+        if self._typekey in config:
+            candidate_constructor = plan.candidate_constructor
+            if candidate_constructor is not None and self._has_argument(candidate_constructor, self._typekey):
+                return None
+            try:
+                constructor = self._get_constructor(config, path, plan.annotation)
+            except ConfigurationError:
+                return None
+            if constructor is not None and is_new_type(constructor):
+                constructor = get_new_type_constructor(constructor)
+        elif plan.is_instance_origin and isinstance(config, plan.origin):
+            return None
+        else:
+            constructor = plan.constructor
+        if (
+            constructor is None
+            or self._signatures[constructor].generic
+            or (self._object_cache is not None or self._disk_cache is not None)
+            and Registrable.is_cacheable(constructor)
+        ):
+            return None
+        args_config = config.get(self._argskey)
+        if args_config is not None and not isinstance(args_config, (list, tuple)):
+            return None
+
+        type_hints = self._signatures[constructor].type_hints
+        args = [
+            self._compile_argument(val, ((path, self._argskey), i), None) for i, val in enumerate(args_config or ())
+        ]
+        kwargs = {
+            key: self._compile_argument(val, (path, key), type_hints.get(key))
+            for key, val in config.items()
+            if key != self._typekey and key != self._argskey
+        }
+        return ObjectFactory(self, annotation, constructor, path, config.get(self._typekey), args_config, args, kwargs)
+
+    def _compile_argument(self, config: Any, path: LinkedPath, annotation: Any) -> FactoryArgument:
+        plan = self.compile(annotation)
+        kind = type(config)
+        if kind in _CONSTANT_TYPES:
+            if config is None and not (self._strict and plan.annotation is None):
+                return config, path, annotation, "constant", None
+            handler = plan.handler or self._resolve_handler(plan)
+            if plan.annotation is not None and plan.stepwise and handler is ColtBuilder._object_steps:
+                value = self._build_value(config, path, plan)
+                if type(value) in _CONSTANT_TYPES:
+                    return config, path, annotation, "constant", value
+        elif kind is list:
+            handler = plan.handler or self._resolve_handler(plan)
+            if plan.annotation is not None and handler is ColtBuilder._sequence_steps:
+                value_cls = plan.args[0] if plan.args else None
+                elements = [self._compile_argument(x, (path, i), value_cls) for i, x in enumerate(config)]
+                return config, path, annotation, "list", elements
+        elif isinstance(config, abc.Mapping):
+            factory = self._compile_object(config, path, annotation)
+            if factory is not None:
+                return config, path, annotation, "object", factory
+        return config, path, annotation, "build", None
+
+    def _count_lazy_validation(self, full: int = 0, scoped: int = 0, deferred: int = 0, skipped: int = 0) -> None:
+        with self._lazy_validation_lock:
+            counts = self._lazy_validation_counts
+            counts[0] += full
+            counts[1] += scoped
+            counts[2] += deferred
+            counts[3] += skipped
 
     @staticmethod
     def _get_constructor_by_name(
         name: str,
-        path: ParamPath,
+        path: LinkedPath,
         annotation: Optional[Union[Type[T], Callable[..., T], Any]] = None,
         allow_to_import: bool = True,
     ) -> Union[Type[T], Callable[..., T]]:
@@ -145,7 +870,7 @@ class ColtBuilder:
         else:
             constructor = cast(Type[T], DefaultRegistry.by_name(name, allow_to_import))
         if constructor is None:
-            raise ConfigurationError(f"[{get_path_name(path)}] type not found error: {name}")
+            raise ConfigurationError(f"[{get_path_name(to_param_path(path))}] type not found error: {name}")
         return constructor
 
     def _has_argument(
@@ -153,24 +878,12 @@ class ColtBuilder:
         constructor: Callable[..., T],
         key: str,
     ) -> bool:
-        if isinstance(constructor, type):
-            try:
-                type_hints = get_type_hints(
-                    getattr(constructor, "__init__"),  # noqa: B009
-                )
-            except NameError:
-                type_hints = constructor.__init__.__annotations__  # type: ignore[misc]
-        else:
-            try:
-                type_hints = get_type_hints(constructor)
-            except NameError:
-                type_hints = constructor.__annotations__
-        return key in type_hints
+        return key in self._signatures[constructor].annotated_arguments
 
     def _get_constructor(
         self,
         config: Any,
-        path: ParamPath,
+        path: LinkedPath,
         annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
     ) -> Optional[Union[Type[T], Callable[..., T]]]:
         if not isinstance(config, Mapping):
@@ -187,375 +900,1164 @@ class ColtBuilder:
             allow_to_import=not self._strict,
         )
 
-    def _construct_args(
+    def _construct_args_steps(
         self,
         constructor: Callable[..., T],
         config: Mapping[str, Any],
-        path: ParamPath,
+        path: LinkedPath,
         *,
         context: ColtContext,
         skip_construction: bool = False,
-    ) -> Tuple[List[Any], Dict[str, Any]]:
+        typed: bool = False,
+    ) -> Generator[StepRequest, Any, Tuple[List[Any], Dict[str, Any]]]:
+        """Build the arguments of a constructor from a config.
+
+        The config is not copied: the args key and, if `typed` is set, the typekey are
+        skipped while reading the keyword arguments.
+        """
         if not config:
             return [], {}
 
-        args_config = config.get(self._argskey, [])
+        excluded: Tuple[str, ...] = (self._typekey,) if typed else ()
+        args_config: Any = ()
         if self._argskey in config:
-            config = dict(config)
-            config.pop(self._argskey)
+            args_config = config[self._argskey]
+            excluded += (self._argskey,)
 
         if not isinstance(args_config, (list, tuple)):
-            raise ConfigurationError(f"[{get_path_name(path)}] Arguments must be a list or tuple.")
+            raise ConfigurationError(f"[{get_path_name(to_param_path(path))}] Arguments must be a list or tuple.")
 
-        args: List[Any] = [
-            self._build(
-                val,
-                path + (self._argskey, i),
-                context=context,
-                skip_construction=skip_construction,
-            )
-            for i, val in enumerate(args_config)
-        ]
+        args: List[Any] = []
+        for i, val in enumerate(args_config):
+            args.append((yield (val, ((path, self._argskey), i), None, True, skip_construction)))
 
-        if isinstance(constructor, type):
-            try:  # type: ignore[unreachable]
-                if is_typeddict(constructor):
-                    type_hints = get_type_hints(constructor)
-                else:
-                    type_hints = get_type_hints(
-                        getattr(constructor, "__init__"),  # noqa: B009
-                    )
-            except NameError:
-                type_hints = constructor.__init__.__annotations__  # type: ignore[misc]
-        else:
-            try:
-                type_hints = get_type_hints(constructor)
-            except NameError:
-                type_hints = constructor.__annotations__
+        signature = self._signatures[constructor]
+        type_hints = signature.type_hints
+        kwargs: Dict[str, Any] = {}
+
+        if not skip_construction and not signature.generic and _async_build.get():
+            keys = [key for key, val in config.items() if isinstance(val, _COLLECTION_TYPES) and key not in excluded]
+            if len(keys) > 1:
+                values = yield GatherRequest(
+                    [(config[key], (path, key), type_hints.get(key), True, False) for key in keys]
+                )
+                gathered = dict(zip(keys, values))
+                for key, val in config.items():
+                    if key in excluded:
+                        continue
+                    if key in gathered:
+                        kwargs[key] = gathered[key]
+                    else:
+                        kwargs[key] = yield (val, (path, key), type_hints.get(key), True, False)
+                return args, kwargs
+
+        if (
+            (self._executor is not None or self._process_executor is not None)
+            and not skip_construction
+            and not signature.generic
+            and context.references is None
+        ):
+            # without type variables in the hints, arguments do not depend on each other,
+            # so subtrees are built concurrently and collected in the order of the config
+            futures, shipped = self._submit_subtrees(config, path, type_hints, context, excluded)
+            if futures:
+                try:
+                    for key, val in config.items():
+                        if key in excluded:
+                            continue
+                        future = futures.get(key)
+                        if future is None:
+                            kwargs[key] = yield (val, (path, key), type_hints.get(key), True, skip_construction)
+                        elif key not in shipped:
+                            kwargs[key] = future.result()
+                        else:
+                            payload = future.result()
+                            if payload is None:
+                                # the object cannot be sent back from the worker process
+                                kwargs[key] = yield (val, (path, key), type_hints.get(key), True, skip_construction)
+                            else:
+                                kwargs[key] = pickle.loads(payload)
+                finally:
+                    for future in futures.values():
+                        future.cancel()
+                return args, kwargs
 
         typevar_map: Dict[TypeVar, Any] = {}
 
-        def get_annotation(key: str) -> Any:
-            annotaiton = type_hints.get(key)
-            return replace_types(annotaiton, typevar_map)
-
-        def update_typevar(obj: Any, annotation: Any) -> Any:
-            cls = type(obj)
-            scope = infer_scope(cls)
-            annotation_typevar_map = {k: v for k, v in get_typevar_map(annotation).items() if isinstance(v, TypeVar)}
-            for cls_ in trace_bases(cls):
-                for type_var, type_ in get_typevar_map(cls_).items():
-                    if isinstance(type_, ForwardRef):
-                        type_ = evaluate_forward_refs(type_, globals(), scope)
-                    type_var = annotation_typevar_map.get(type_var, type_var)
-                    typevar_map[type_var] = type_
+        def update_typevar(obj: Any, annotation: Any) -> None:
+            bindings = self.compile(type(obj)).typevar_bindings
+            if not bindings:
+                return
+            annotation_typevar_map = self.compile(annotation).typevar_params
+            for type_var, type_ in bindings:
+                typevar_map[annotation_typevar_map.get(type_var, type_var)] = type_
 
-        kwargs: Dict[str, Any] = {}
         for key, val in config.items():
-            annotation = get_annotation(key)
-            obj = self._build(
-                val,
-                path + (key,),
-                annotation,
-                context=context,
-                skip_construction=skip_construction,
-            )
+            if key in excluded:
+                continue
+            annotation = replace_types(type_hints.get(key), typevar_map)
+            obj = yield (val, (path, key), annotation, True, skip_construction)
             kwargs[key] = obj
             update_typevar(obj, annotation)
 
         return args, kwargs
 
+    def _submit_subtrees(
+        self,
+        config: Mapping[str, Any],
+        path: LinkedPath,
+        type_hints: Mapping[str, Any],
+        context: ColtContext,
+        excluded: Tuple[str, ...],
+    ) -> Tuple[Dict[str, "Future[Any]"], Set[str]]:
+        """Submit independent argument subtrees to the executors.
+
+        Arguments building a class registered with `executor="process"` are shipped to
+        the process pool if they can be pickled. Other arguments configured with mappings
+        or collections are submitted to the thread pool if there are at least two of them.
+        Returns the futures and the keys of the shipped arguments.
+        """
+        futures: Dict[str, "Future[Any]"] = {}
+        shipped: Set[str] = set()
+        threaded: List[str] = []
+        for key, val in config.items():
+            if not isinstance(val, _COLLECTION_TYPES) or key in excluded:
+                continue
+            annotation = type_hints.get(key)
+            process_executor = self._process_executor
+            if process_executor is not None:
+                constructor = self._process_constructor(val, (path, key), annotation)
+                payload = (
+                    None if constructor is None else self._pickle_subtree(val, (path, key), annotation, constructor)
+                )
+                if payload is not None:
+                    futures[key] = process_executor.submit(_build_in_process, payload)
+                    shipped.add(key)
+                    continue
+            threaded.append(key)
+        if self._executor is not None and len(threaded) > 1 and not getattr(_worker_state, "active", False):
+            for key in threaded:
+                futures[key] = self._executor.submit(
+                    self._build_in_worker, config[key], (path, key), type_hints.get(key), context
+                )
+        return futures, shipped
+
+    def _process_constructor(self, config: Any, path: LinkedPath, annotation: Any) -> Any:
+        """Constructor of a config to be built in a worker process, or `None` if it is built here."""
+        if self._build_callback is not None or not isinstance(config, abc.Mapping):
+            return None
+        try:
+            if self._typekey in config:
+                constructor = self._get_constructor(config, path, annotation)
+            else:
+                constructor = self.compile(annotation).constructor
+        except ConfigurationError:
+            return None
+        return constructor if Registrable.executor_of(constructor) == "process" else None
+
+    def _settings(self) -> Dict[str, Any]:
+        """Options to create a builder that builds configs like this one in another process.
+
+        Callbacks, caches, executors and records are not included.
+        """
+        return {
+            "typekey": self._typekey,
+            "argskey": self._argskey,
+            "schemakey": self._schemakey,
+            "strict": self._strict,
+            "tagkey": self._tagkey,
+            "refkey": self._refkey,
+            "engine": self._engine,
+            "defer_lazy_validation": self._defer_lazy_validation,
+        }
+
+    def _pickle_subtree(self, config: Any, path: LinkedPath, annotation: Any, constructor: Any) -> Optional[bytes]:
+        # the constructor is pickled so that unpickling imports the module registering it,
+        # e.g. in workers started with "spawn" which do not share the registry
+        try:
+            return pickle.dumps((self._settings(), constructor, config, to_param_path(path), annotation))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. local classes or lambdas in the config; the subtree is built here
+            return None
+
+    def _build_in_worker(self, config: Any, path: LinkedPath, annotation: Any, context: ColtContext) -> Any:
+        _worker_state.active = True
+        try:
+            return self._build(config, path, annotation, context=context)
+        finally:
+            _worker_state.active = False
+
     def _build(
         self,
         config: Any,
-        path: ParamPath,
+        path: LinkedPath,
         annotation: Optional[Union[Type[T], Callable[..., T], Any]] = None,
         *,
         context: ColtContext,
         raise_configuration_error: bool = True,
         skip_construction: bool = False,
     ) -> Union[T, Any]:
-        if self._callback is not None:
-            with suppress(SkipCallback):
-                config = self._callback.on_build(path, config, self, context, annotation)
+        value, steps = self._begin_build(
+            config, path, annotation, context, raise_configuration_error, skip_construction
+        )
+        if steps is None:
+            return value
+        return self._run(steps, context)
+
+    def _begin_build(
+        self,
+        config: Any,
+        path: LinkedPath,
+        annotation: Any,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> Tuple[Any, Optional[BuildSteps]]:
+        """Run the checks common to all annotations and dispatch to the handler.
 
-        if annotation is not None and isinstance(annotation, type):
-            annotation = remove_optional(annotation)
+        Returns `(value, None)` if the value is built, and `(None, steps)` if the
+        handler yields child builds which have to be driven by the engine.
+        """
+        scope = context.scope
+        if scope is not None and scope.excludes(path):
+            return None, None
 
-        if annotation == Any:
-            annotation = None
+        callback = self._build_callback
+        if callback is not None:
+            param_path = to_param_path(path)
+            if callback.accepts(param_path, annotation):
+                with suppress(SkipCallback):
+                    config = callback.on_build(param_path, config, self, context, annotation)
+
+        plan = self.compile(annotation)
+        annotation = plan.annotation
+
+        references = context.references
+        if references is not None:
+            shared = self._begin_shared(config, path, plan, references, raise_configuration_error, skip_construction)
+            if shared is not None:
+                return shared
 
         if isinstance(config, Constructed):
-            return config.value  # already built upstream; do not touch
+            return config.value, None  # already built upstream; do not touch
 
         if isinstance(config, Placeholder):
             if annotation is not None and not config.match_type_hint(annotation):
                 raise ConfigurationError(
-                    f"[{get_path_name(path)}] Placeholder type mismatch: expected {annotation}, got {config.type_hint}"
+                    f"[{get_path_name(to_param_path(path))}] Placeholder type mismatch: expected {annotation}, got {config.type_hint}"
                 )
-            return config
+            return config, None
 
         if self._strict and annotation is None:
             warnings.warn(
-                f"[{get_path_name(path)}] Given config is not constructed because currently "
+                f"[{get_path_name(to_param_path(path))}] Given config is not constructed because currently "
                 "strict mode is enabled and the type annotation is not given.",
                 UserWarning,
             )
-            return config
-
-        origin = reveal_origin(annotation)
-        args = typing.get_args(annotation)
+            return config, None
 
         if config is None:
-            return config
+            return config, None
 
-        if (
-            origin
-            in (
-                List,
-                list,
-                Sequence,
-                abc.Sequence,
-                abc.MutableSequence,
+        handler = plan.handler
+        if handler is None:
+            handler = self._resolve_handler(plan)
+
+        if plan.stepwise and handler is ColtBuilder._object_steps and not isinstance(config, _COLLECTION_TYPES):
+            # the default handler never builds nested values of other configs; skip creating steps
+            return self._build_value(config, path, plan), None
+
+        record = context.record
+        if record is not None and not skip_construction and isinstance(config, _COLLECTION_TYPES):
+            return self._begin_recorded(handler, config, path, plan, record, context, raise_configuration_error)
+
+        result = handler(
+            self,
+            config,
+            path,
+            plan,
+            context=context,
+            raise_configuration_error=raise_configuration_error,
+            skip_construction=skip_construction,
+        )
+        if plan.stepwise:
+            return None, result
+        return result, None
+
+    def _begin_recorded(
+        self,
+        handler: BuildHandler,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        record: BuildRecord,
+        context: ColtContext,
+        raise_configuration_error: bool,
+    ) -> Tuple[Any, Optional[BuildSteps]]:
+        """Reuse the object built for an unchanged config, or build it and record it."""
+        param_path = to_param_path(path)
+        entry = record.reusable.get(param_path)
+        if entry is not None and entry[0] == plan.annotation:
+            return entry[1], None
+        result = handler(
+            self,
+            config,
+            path,
+            plan,
+            context=context,
+            raise_configuration_error=raise_configuration_error,
+            skip_construction=False,
+        )
+        if plan.stepwise:
+            return None, self._recorded_steps(result, param_path, plan.annotation, record)
+        record.objects[param_path] = (plan.annotation, result)
+        return result, None
+
+    @staticmethod
+    def _recorded_steps(steps: BuildSteps, path: ParamPath, annotation: Any, record: BuildRecord) -> BuildSteps:
+        value = yield from steps
+        record.objects[path] = (annotation, value)
+        return value
+
+    def _begin_shared(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        references: ReferenceTable,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> Optional[Tuple[Any, Optional[BuildSteps]]]:
+        """Begin to build a reference or a referenced config so that the object is built once.
+
+        Returns `None` if the config is neither of them and has to be built as usual.
+        """
+        param_path = to_param_path(path)
+        if param_path in references.targets:
+            if references.pending == param_path:
+                references.pending = None
+            else:
+                return self._begin_target(
+                    param_path, config, param_path, plan, references, raise_configuration_error, skip_construction
+                )
+
+        if not isinstance(config, abc.Mapping) or self._refkey not in config:
+            return None
+
+        name = config[self._refkey]
+        if len(config) != 1 or not isinstance(name, str):
+            raise ConfigurationError(
+                f"[{get_path_name(param_path)}] A reference must be a mapping with the only key "
+                f"{self._refkey!r} and the dotted path to the referenced config."
             )
-            and isinstance(config, abc.Iterable)
-            and not isinstance(config, abc.Mapping)
+        try:
+            target, target_config = references.resolve(name)
+        except KeyError as e:
+            raise ConfigurationError(f"[{get_path_name(param_path)}] Referenced config {name!r} is not found.") from e
+        references.targets.add(target)
+        return self._begin_target(
+            target, target_config, param_path, plan, references, raise_configuration_error, skip_construction
+        )
+
+    def _begin_target(
+        self,
+        target: ParamPath,
+        config: Any,
+        path: ParamPath,
+        plan: BuildPlan,
+        references: ReferenceTable,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> Tuple[Any, Optional[BuildSteps]]:
+        if target in references.values and not skip_construction:
+            value = references.values[target]
+            self._check_shared_type(value, path, plan)
+            return value, None
+        if target in references.building:
+            raise ConfigurationError(
+                f"[{get_path_name(path)}] Circular reference to {get_path_name(target)!r}; "
+                "the referenced config depends on itself."
+            )
+        annotation = plan.annotation
+        if target != path:
+            # reached through a reference first, so the target is built with its own annotation
+            annotation = self._target_annotation(references, target, annotation)
+        references.building.add(target)
+        # the engine begins the requested build right away, which builds the target as usual
+        references.pending = target
+        return None, self._target_steps(
+            target, config, path, plan, annotation, references, raise_configuration_error, skip_construction
+        )
+
+    def _target_steps(
+        self,
+        target: ParamPath,
+        config: Any,
+        path: ParamPath,
+        plan: BuildPlan,
+        annotation: Any,
+        references: ReferenceTable,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        try:
+            value = yield (config, to_linked_path(target), annotation, raise_configuration_error, skip_construction)
+        finally:
+            references.building.discard(target)
+        if not skip_construction:
+            references.values[target] = value
+            if annotation is not plan.annotation:
+                self._check_shared_type(value, path, plan)
+        return value
+
+    def _target_annotation(self, references: ReferenceTable, target: ParamPath, default: Any) -> Any:
+        """Annotation of a referenced config at its own path, resolved from the root of the build.
+
+        Returns `default` (the annotation of the reference) if the annotation depends on
+        more than the config and the type hints along the path, e.g. within a union.
+        """
+        try:
+            return references.annotations[target]
+        except KeyError:
+            pass
+        annotation = references.annotation
+        config = references.root
+        try:
+            for key in target:
+                annotation = self._nested_annotation(config, annotation, key)
+                config = config[key]
+        except (LookupError, TypeError, ConfigurationError):
+            return default
+        references.annotations[target] = annotation
+        return annotation
+
+    def _nested_annotation(self, config: Any, annotation: Any, key: Any) -> Any:
+        """Annotation of the nested config at `key` of a config built with an annotation.
+
+        Raises `KeyError` if it cannot be determined without building the config.
+        """
+        plan = self.compile(annotation)
+        while plan.handler in (ColtBuilder._lazy_steps, ColtBuilder._union_steps) or plan.is_typevar:
+            if plan.is_typevar:
+                plan = self.compile(plan.annotation.__bound__)
+            elif plan.handler is ColtBuilder._lazy_steps:
+                plan = self.compile(plan.args[0] if plan.args else None)
+            else:
+                members = [arg for arg in plan.args if arg is not NoneType]
+                if len(members) != 1:
+                    raise KeyError(key)
+                plan = self.compile(members[0])
+        handler = plan.handler
+        args = plan.args
+        if isinstance(config, (list, tuple)):
+            if handler is ColtBuilder._tuple_steps and args and not (len(args) == 2 and args[1] == Ellipsis):
+                return args[key]
+            if handler is ColtBuilder._namedtuple_steps:
+                return list(plan.field_type_hints.values())[key]
+            if handler in (ColtBuilder._sequence_steps, ColtBuilder._set_steps, ColtBuilder._tuple_steps):
+                return args[0] if args else None
+            if handler is ColtBuilder._object_steps:
+                return args[0] if args else None
+            raise KeyError(key)
+        if not isinstance(config, abc.Mapping):
+            raise KeyError(key)
+        if handler is ColtBuilder._mapping_steps:
+            return args[1] if args else None
+        if handler is ColtBuilder._namedtuple_steps and self._typekey not in config:
+            return plan.field_type_hints.get(key)
+        if handler is not ColtBuilder._object_steps:
+            raise KeyError(key)
+        if self._typekey in config and not (
+            plan.candidate_constructor is not None and self._has_argument(plan.candidate_constructor, self._typekey)
         ):
-            value_cls = args[0] if args else None
-            return list(
-                self._build(
-                    x,
-                    path + (i,),
-                    value_cls,
-                    context=context,
-                    skip_construction=skip_construction,
+            try:
+                constructor = self._get_constructor_by_name(
+                    config[self._typekey], None, plan.annotation, allow_to_import=not self._strict
                 )
-                for i, x in enumerate(config)
+            except ConfigurationError:
+                if plan.annotation is None:
+                    return None
+                raise
+            if constructor and is_new_type(constructor):
+                constructor = get_new_type_constructor(constructor)  # type: ignore
+        elif plan.annotation is None:
+            return None
+        else:
+            constructor = plan.constructor
+        if key == self._argskey:
+            # positional arguments are built without annotations
+            return None
+        return self._signatures[constructor].type_hints.get(key)
+
+    def _check_shared_type(self, value: Any, path: ParamPath, plan: BuildPlan) -> None:
+        annotation = plan.annotation
+        if not isinstance(annotation, type) or plan.is_numeric:
+            return
+        try:
+            matched = isinstance(value, annotation)
+        except TypeError:
+            # e.g. TypedDict and protocols
+            return
+        if not matched:
+            raise ConfigurationError(
+                f"[{get_path_name(path)}] Type mismatch of the referenced object, expected type is "
+                f"{annotation}, but actual type is {type(value)}."
             )
 
-        if origin in (Set, set, abc.Set) and isinstance(config, abc.Iterable) and not isinstance(config, abc.Mapping):
-            value_cls = args[0] if args else None
-            return set(
-                self._build(
-                    x,
-                    path + (i,),
-                    value_cls,
+    def _run_recursive(self, steps: BuildSteps, context: ColtContext) -> Any:
+        """Drive build steps by building each requested child with `_build`."""
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    if type(request) is tuple:
+                        value = self._build(
+                            request[0],
+                            request[1],
+                            request[2],
+                            context=context,
+                            raise_configuration_error=request[3],
+                            skip_construction=request[4],
+                        )
+                    elif isinstance(request, AwaitRequest):
+                        value = request.awaitable
+                    else:
+                        value = self._run_recursive(_gather_steps(cast(GatherRequest, request).requests), context)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+
+    def _run_stack(self, steps: BuildSteps, context: ColtContext) -> Any:
+        """Drive build steps with an explicit stack instead of recursion.
+
+        Steps of the children are pushed onto the stack and resumed with the
+        child's value (or the child's exception) once the child is built, so the
+        Python stack depth does not grow with the depth of the config.
+        """
+        stack: List[BuildSteps] = [steps]
+        value: Any = None
+        error: Optional[Exception] = None
+        while stack:
+            steps = stack[-1]
+            try:
+                if error is None:
+                    request = steps.send(value)
+                else:
+                    exception, error = error, None
+                    request = steps.throw(exception)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+                error = e
+                continue
+            if type(request) is not tuple:
+                if isinstance(request, AwaitRequest):
+                    value = request.awaitable
+                else:
+                    stack.append(_gather_steps(cast(GatherRequest, request).requests))
+                    value = None
+                continue
+            try:
+                value, child = self._begin_build(request[0], request[1], request[2], context, request[3], request[4])
+            except Exception as e:
+                error = e
+                continue
+            if child is not None:
+                stack.append(child)
+                value = None
+        return value
+
+    def _run_validation(
+        self,
+        steps: BuildSteps,
+        path: LinkedPath,
+        context: ColtContext,
+        issues: List[ValidationIssue],
+    ) -> None:
+        """Drive build steps like `_run_stack`, collecting configuration errors instead of raising them.
+
+        A configuration error is recorded at the path of the value that raised it and its
+        parent is resumed with `None`. Within union trials (requested without
+        `raise_configuration_error`), errors are passed to the union as usual. An error
+        raised again at the same path, e.g. by a referenced config checked for each of its
+        references, is recorded once.
+        """
+        reported: Set[Tuple[ParamPath, str]] = set()
+
+        def report(path: LinkedPath, error: ConfigurationError) -> None:
+            param_path = to_param_path(path)
+            if (param_path, str(error)) not in reported:
+                reported.add((param_path, str(error)))
+                issues.append(ValidationIssue(param_path, error))
+
+        stack: List[BuildSteps] = [steps]
+        paths: List[LinkedPath] = [path]
+        collecting: List[bool] = [True]
+        value: Any = None
+        error: Optional[Exception] = None
+        while stack:
+            steps = stack[-1]
+            try:
+                if error is None:
+                    request = steps.send(value)
+                else:
+                    exception, error = error, None
+                    request = steps.throw(exception)
+            except StopIteration as stop:
+                stack.pop()
+                paths.pop()
+                collecting.pop()
+                value = stop.value
+                continue
+            except Exception as e:
+                stack.pop()
+                failed_path = paths.pop()
+                if collecting.pop() and isinstance(e, ConfigurationError):
+                    report(failed_path, e)
+                    value = None
+                elif not stack:
+                    raise
+                else:
+                    error = e
+                continue
+            if type(request) is not tuple:
+                if isinstance(request, AwaitRequest):
+                    value = request.awaitable
+                else:
+                    stack.append(_gather_steps(cast(GatherRequest, request).requests))
+                    paths.append(paths[-1])
+                    collecting.append(collecting[-1])
+                    value = None
+                continue
+            child_path = request[1]
+            collect = collecting[-1] and request[3]
+            try:
+                value, child = self._begin_build(request[0], child_path, request[2], context, request[3], True)
+            except Exception as e:
+                if collect and isinstance(e, ConfigurationError):
+                    report(child_path, e)
+                    value = None
+                else:
+                    error = e
+                continue
+            if child is not None:
+                stack.append(child)
+                paths.append(child_path)
+                collecting.append(collect)
+                value = None
+
+    async def _abuild(
+        self,
+        config: Any,
+        path: LinkedPath,
+        annotation: Any,
+        context: ColtContext,
+        raise_configuration_error: bool,
+    ) -> Any:
+        value, steps = self._begin_build(config, path, annotation, context, raise_configuration_error, False)
+        if steps is None:
+            return value
+        return await self._run_async(steps, context)
+
+    async def _run_async(self, steps: BuildSteps, context: ColtContext) -> Any:
+        """Drive build steps like `_run_recursive`, awaiting children and constructors."""
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    if type(request) is tuple:
+                        value = await self._abuild(request[0], request[1], request[2], context, request[3])
+                    elif isinstance(request, AwaitRequest):
+                        value = await request.awaitable
+                    else:
+                        value = await self._gather(cast(GatherRequest, request).requests, context)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _gather(self, requests: List[BuildRequest], context: ColtContext) -> List[Any]:
+        results = await asyncio.gather(
+            *(self._abuild(request[0], request[1], request[2], context, request[3]) for request in requests),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
+
+    def _sequence_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        if not isinstance(config, abc.Iterable) or isinstance(config, abc.Mapping):
+            return (
+                yield from self._object_steps(
+                    config,
+                    path,
+                    plan,
                     context=context,
+                    raise_configuration_error=raise_configuration_error,
                     skip_construction=skip_construction,
                 )
-                for i, x in enumerate(config)
             )
+        value_cls = plan.args[0] if plan.args else None
+        return (yield from self._items_steps(config, path, value_cls, skip_construction))
 
-        if origin in (Tuple, tuple) and isinstance(config, abc.Iterable) and not isinstance(config, abc.Mapping):
-            if not args:
-                return tuple(
-                    self._build(
-                        x,
-                        path + (i,),
-                        context=context,
-                        skip_construction=skip_construction,
-                    )
-                    for i, x in enumerate(config)
+    def _set_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        if not isinstance(config, abc.Iterable) or isinstance(config, abc.Mapping):
+            return (
+                yield from self._object_steps(
+                    config,
+                    path,
+                    plan,
+                    context=context,
+                    raise_configuration_error=raise_configuration_error,
+                    skip_construction=skip_construction,
                 )
+            )
+        value_cls = plan.args[0] if plan.args else None
+        values = yield from self._items_steps(config, path, value_cls, skip_construction)
+        return None if values is None else set(values)
 
-            if len(args) == 2 and args[1] == Ellipsis:
-                return tuple(
-                    self._build(
-                        x,
-                        path + (i,),
-                        args[0],
-                        context=context,
-                        skip_construction=skip_construction,
-                    )
-                    for i, x in enumerate(config)
+    def _tuple_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        if not isinstance(config, abc.Iterable) or isinstance(config, abc.Mapping):
+            return (
+                yield from self._object_steps(
+                    config,
+                    path,
+                    plan,
+                    context=context,
+                    raise_configuration_error=raise_configuration_error,
+                    skip_construction=skip_construction,
                 )
+            )
 
-            if isinstance(config, abc.Sized) and len(config) != len(args):
-                raise ConfigurationError(
-                    f"[{get_path_name(path)}] Tuple sizes of the given config and annotation "
-                    f"are mismatched: {config} / {args}"
-                )
+        args = plan.args
+        if not args or (len(args) == 2 and args[1] == Ellipsis):
+            value_cls = args[0] if args else None
+            items = yield from self._items_steps(config, path, value_cls, skip_construction)
+            return None if items is None else tuple(items)
 
-            return tuple(
-                self._build(value_config, path + (i,), value_cls, context=context)
-                for i, (value_config, value_cls) in enumerate(zip(config, args))
+        if isinstance(config, abc.Sized) and len(config) != len(args):
+            raise ConfigurationError(
+                f"[{get_path_name(to_param_path(path))}] Tuple sizes of the given config and annotation "
+                f"are mismatched: {config} / {args}"
             )
 
-        if origin in (Dict, dict, abc.Mapping, abc.MutableMapping) and isinstance(config, abc.Mapping):
-            key_cls = args[0] if args else None
-            value_cls = args[1] if args else None
-            return {
-                self._build(
-                    key_config,
-                    path + (f"[key:{i}]",),
-                    key_cls,
-                    context=context,
-                    skip_construction=skip_construction,
-                ): self._build(
-                    value_config,
-                    path + (key_config,),
-                    value_cls,
+        values: List[Any] = []
+        for i, (value_config, value_cls) in enumerate(zip(config, args)):
+            values.append((yield (value_config, (path, i), value_cls, True, False)))
+        return tuple(values)
+
+    def _mapping_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        if not isinstance(config, abc.Mapping):
+            return (
+                yield from self._object_steps(
+                    config,
+                    path,
+                    plan,
                     context=context,
+                    raise_configuration_error=raise_configuration_error,
                     skip_construction=skip_construction,
                 )
-                for i, (key_config, value_config) in enumerate(config.items())
-            }
+            )
+        key_cls = plan.args[0] if plan.args else None
+        value_cls = plan.args[1] if plan.args else None
+        scalar = self._build_callback is None and _is_scalar_type(key_cls) and _is_scalar_type(value_cls)
+        if skip_construction and _check_only.get():
+            # the result is discarded, so keys and values are only checked
+            valid_keys = _VALID_SCALAR_CONFIGS[key_cls] if scalar else ()
+            valid_values = _VALID_SCALAR_CONFIGS[value_cls] if scalar else ()
+            for i, (key_config, value_config) in enumerate(config.items()):
+                if type(key_config) not in valid_keys:
+                    yield (key_config, (path, i, None), key_cls, True, skip_construction)
+                if type(value_config) not in valid_values:
+                    yield (value_config, (path, key_config), value_cls, True, skip_construction)
+            return None
+        values: Dict[Any, Any] = {}
+        if scalar:
+            # keys and values of scalar types are checked in place, only other configs are built
+            accepted_keys = _SCALAR_TYPES[key_cls]
+            accepted_values = _SCALAR_TYPES[value_cls]
+            to_float = value_cls is float
+            for i, (key_config, value_config) in enumerate(config.items()):
+                key = key_config
+                if type(key) not in accepted_keys:
+                    key = yield (key_config, (path, i, None), key_cls, True, skip_construction)
+                kind = type(value_config)
+                if kind in accepted_values:
+                    values[key] = value_config
+                elif to_float and (kind is int or kind is bool):
+                    values[key] = float(value_config)
+                else:
+                    values[key] = yield (value_config, (path, key_config), value_cls, True, skip_construction)
+            return values
+        for i, (key_config, value_config) in enumerate(config.items()):
+            key = yield (key_config, (path, i, None), key_cls, True, skip_construction)
+            values[key] = yield (value_config, (path, key_config), value_cls, True, skip_construction)
+        return values
 
-        if origin == Literal:
-            if config not in args:
-                raise ConfigurationError(f"[{get_path_name(path)}] {config} is not a valid literal value.")
-            return config
+    def _items_steps(
+        self,
+        config: Iterable[Any],
+        path: LinkedPath,
+        value_cls: Any,
+        skip_construction: bool,
+    ) -> Generator[StepRequest, Any, Optional[List[Any]]]:
+        """Build the elements of an iterable config into a list, or only check them if the result is discarded."""
+        scalar = self._build_callback is None and _is_scalar_type(value_cls)
+        if skip_construction and _check_only.get():
+            valid = _VALID_SCALAR_CONFIGS[value_cls] if scalar else ()
+            for i, x in enumerate(config):
+                if type(x) not in valid:
+                    yield (x, (path, i), value_cls, True, skip_construction)
+            return None
+        values: List[Any] = []
+        append = values.append
+        if scalar:
+            # elements of scalar types are checked in place, only other configs are built
+            accepted = _SCALAR_TYPES[value_cls]
+            to_float = value_cls is float
+            for i, x in enumerate(config):
+                kind = type(x)
+                if kind in accepted:
+                    append(x)
+                elif to_float and (kind is int or kind is bool):
+                    append(float(x))
+                else:
+                    append((yield (x, (path, i), value_cls, True, skip_construction)))
+            return values
+        if _async_build.get():
+            requests: List[BuildRequest] = [(x, (path, i), value_cls, True, False) for i, x in enumerate(config)]
+            if len(requests) > 1:
+                return (yield GatherRequest(requests))
+            for request in requests:
+                append((yield request))
+            return values
+        for i, x in enumerate(config):
+            append((yield (x, (path, i), value_cls, True, skip_construction)))
+        return values
+
+    def _build_literal(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> Any:
+        if config not in plan.args:
+            raise ConfigurationError(f"[{get_path_name(to_param_path(path))}] {config} is not a valid literal value.")
+        return config
 
-        if annotation and is_namedtuple(annotation) and isinstance(config, abc.Mapping) and self._typekey not in config:
-            type_hints = get_type_hints(annotation)
-            kwargs = {
-                key: self._build(
-                    value_config,
-                    path + (key,),
-                    type_hints.get(key),
+    def _namedtuple_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        if not isinstance(config, abc.Mapping) or self._typekey in config:
+            return (
+                yield from self._object_steps(
+                    config,
+                    path,
+                    plan,
                     context=context,
+                    raise_configuration_error=raise_configuration_error,
                     skip_construction=skip_construction,
                 )
-                for key, value_config in config.items()
-            }
-            if skip_construction:
-                return None
-            return annotation(**kwargs)
+            )
+        type_hints = plan.field_type_hints
+        kwargs: Dict[str, Any] = {}
+        for key, value_config in config.items():
+            kwargs[key] = yield (value_config, (path, key), type_hints.get(key), True, skip_construction)
+        if skip_construction:
+            return None
+        return plan.annotation(**kwargs)
 
-        if annotation and isinstance(annotation, EnumType):
+    def _build_enum(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> Any:
+        try:
+            return plan.annotation(config)
+        except ValueError as e:
+            if raise_configuration_error:
+                raise ConfigurationError(
+                    f"[{get_path_name(to_param_path(path))}] Failed to construct object with type {plan.annotation}."
+                ) from e
+            else:
+                raise
+
+    def _union_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        if not plan.args:
+            return (yield (config, path, None, True, skip_construction))
+
+        members = self._discriminate_union(config, path, plan)
+        if members is not None and len(members) == 1:
+            return (yield (config, path, members[0], raise_configuration_error, skip_construction))
+        if not members:
+            # no discriminator applies, or none of the members matches it; try all of them
+            # so that the error reports every failure
+            members = plan.args
+
+        # `on_build` callbacks may rewrite configs depending on their values
+        cache_key: Optional[Hashable] = None
+        mismatches: Optional[FrozenSet[Any]] = None
+        if self._union_cache is not None and self._build_callback is None:
+            cache_key = (plan.annotation, get_config_shape(config, self._typekey))
             try:
-                return annotation(config)
-            except ValueError as e:
-                if raise_configuration_error:
-                    raise ConfigurationError(
-                        f"[{get_path_name(path)}] Failed to construct object with type {annotation}."
-                    ) from e
-                else:
-                    raise
+                mismatches = self._union_cache.get(cache_key)
+            except TypeError:
+                cache_key = None
+            if mismatches and any(member not in mismatches for member in members):
+                members = [member for member in members if member not in mismatches]
+
+        trial_exceptions: List[Tuple[Any, Exception]] = []
+        for value_cls in members:
+            try:
+                obj = yield (config, path, value_cls, False, skip_construction)
+            except (ValueError, TypeError, ConfigurationError, AttributeError) as e:
+                trial_exceptions.append((value_cls, e))
+                continue
+            self._update_union_cache(cache_key, mismatches, path, trial_exceptions)
+            return obj
+        self._update_union_cache(cache_key, mismatches, path, trial_exceptions)
+
+        trial_messages = [
+            f"[{get_path_name(to_param_path(path))}] Trying to construct {plan.annotation} with type {cls}:\n{e}\n"
+            + "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            for cls, e in trial_exceptions
+        ]
+        raise ConfigurationError(
+            "\n\n"
+            + "\n".join(textwrap.indent(msg, "  ") for msg in trial_messages)
+            + f"\n[{get_path_name(to_param_path(path))}] Failed to construct object with type {plan.annotation}"
+        )
+
+    def _update_union_cache(
+        self,
+        key: Optional[Hashable],
+        mismatches: Optional[FrozenSet[Any]],
+        path: LinkedPath,
+        trial_exceptions: List[Tuple[Any, Exception]],
+    ) -> None:
+        """Remember the union members whose type does not match a config of the given shape."""
+        if self._union_cache is None or key is None:
+            return
+        known = mismatches or frozenset()
+        found = frozenset(cls for cls, e in trial_exceptions if isinstance(e, _TypeMismatchError) and e.path is path)
+        if mismatches is None or not found <= known:
+            self._union_cache.put(key, known | found)
 
-        if origin in (Union, UnionType):
-            if not args:
-                return self._build(config, path, context=context, skip_construction=skip_construction)
+    def _discriminate_union(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+    ) -> Optional[List[Any]]:
+        """Select the members of a union that can be built from the given config.
 
-            trial_exceptions: List[Tuple[Any, Exception, str]] = []
-            for value_cls in args:
+        Members are discriminated by the type name under the typekey, by values of
+        `Literal`-annotated arguments and by the value of the tagkey argument. This
+        is only possible for mapping configs when every member is a class built by the
+        default handler and no `on_build` callback may rewrite the config. `None` is returned when
+        no discriminator applies, and the matching members otherwise (in declaration order).
+        """
+        if self._build_callback is not None or not isinstance(config, abc.Mapping):
+            return None
+
+        typename = config.get(self._typekey) if self._typekey in config else None
+        if self._typekey in config and not isinstance(typename, str):
+            return None
+
+        members: List[Any] = []
+        for member in plan.args:
+            if member is NoneType:
+                continue
+            member_plan = self.compile(member)
+            if member_plan.handler is None:
+                self._resolve_handler(member_plan)
+            constructor = member_plan.constructor
+            if (
+                member_plan.handler is not ColtBuilder._object_steps
+                or not isinstance(member_plan.annotation, type)
+                or not isinstance(constructor, type)
+            ):
+                return None
+            if typename is not None:
+                if self._has_argument(member_plan.candidate_constructor, self._typekey):
+                    return None
                 try:
-                    return self._build(
-                        config,
-                        path,
-                        value_cls,
-                        context=context,
-                        raise_configuration_error=False,
-                        skip_construction=skip_construction,
+                    constructor = self._get_constructor_by_name(
+                        typename, path, member_plan.annotation, allow_to_import=not self._strict
                     )
-                except (ValueError, TypeError, ConfigurationError, AttributeError) as e:
-                    with io.StringIO() as fp:
-                        traceback.print_exc(file=fp)
-                        tb = fp.getvalue()
-                    trial_exceptions.append((value_cls, e, tb))
+                except ConfigurationError:
                     continue
+                if (
+                    isinstance(constructor, type)
+                    and not is_typeddict(constructor)
+                    and not issubclass(constructor, member_plan.annotation)
+                ):
+                    continue
+            if self._match_tags(config, constructor):
+                members.append(member)
+        return members
 
-            trial_messages = [
-                f"[{get_path_name(path)}] Trying to construct {annotation} with type {cls}:\n{e}\n{tb}"
-                for cls, e, tb in trial_exceptions
-            ]
-            raise ConfigurationError(
-                "\n\n"
-                + "\n".join(textwrap.indent(msg, "  ") for msg in trial_messages)
-                + f"\n[{get_path_name(path)}] Failed to construct object with type {annotation}"
-            )
+    def _match_tags(self, config: Mapping[str, Any], constructor: Any) -> bool:
+        signature = self._signatures[constructor]
+        for key, values in signature.literal_arguments.items():
+            if key in config and config[key] not in values:
+                return False
+        tagkey = self._tagkey
+        if tagkey is not None and tagkey in config and tagkey not in signature.literal_arguments:
+            if tagkey in signature.defaults and signature.defaults[tagkey] != config[tagkey]:
+                return False
+        return True
 
-        if origin == Lazy:
-            value_cls = args[0] if args else None
-            return Lazy(config, path, context, value_cls, self)
+    def _lazy_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        value_cls = plan.args[0] if plan.args else None
+        param_path = to_param_path(path)
+        if skip_construction:
+            # the config is checked in place instead of by a `Lazy` checking it on its own,
+            # so that validation continues after errors within it
+            references = context.references
+            if references is not None and param_path in references.targets:
+                references.pending = param_path
+            return (yield (config, path, value_cls, raise_configuration_error, skip_construction))
+        return Lazy(config, param_path, context, value_cls, self)
+
+    def _object_steps(
+        self,
+        config: Any,
+        path: LinkedPath,
+        plan: BuildPlan,
+        *,
+        context: ColtContext,
+        raise_configuration_error: bool,
+        skip_construction: bool,
+    ) -> BuildSteps:
+        annotation = plan.annotation
+        origin = plan.origin
 
         if isinstance(config, (list, set, tuple)):
             if origin is not None and not isinstance(config, origin):
-                raise ConfigurationError(
-                    f"[{get_path_name(path)}] Type mismatch, expected type is "
-                    f"{origin}, but actual type is {type(config)}."
+                raise _TypeMismatchError(
+                    f"[{get_path_name(to_param_path(path))}] Type mismatch, expected type is "
+                    f"{origin}, but actual type is {type(config)}.",
+                    path,
                 )
             if (
                 isinstance(annotation, type)
                 and not isinstance(annotation, GenericAlias)
                 and not isinstance(config, annotation)
             ):
-                raise ConfigurationError(
-                    f"[{get_path_name(path)}] Type mismatch, expected type is "
-                    f"{annotation}, but actual type is {type(config)}."
+                raise _TypeMismatchError(
+                    f"[{get_path_name(to_param_path(path))}] Type mismatch, expected type is "
+                    f"{annotation}, but actual type is {type(config)}.",
+                    path,
                 )
             cls = type(config)
-            value_cls = args[0] if args else None
-            return cls(
-                self._build(
-                    x,
-                    path + (i,),
-                    value_cls,
-                    context=context,
-                    skip_construction=skip_construction,
-                )
-                for i, x in enumerate(config)
-            )
-
-        if isinstance(annotation, type) and issubclass(annotation, (float, complex)) and isinstance(config, int):
-            return annotation(config)
-
-        if (
-            origin is not None
-            and not is_typeddict(origin)
-            and isinstance(origin, type)
-            and isinstance(config, origin)
-            and not (isinstance(config, Mapping) and self._typekey in config)
-        ):
-            return config
+            value_cls = plan.args[0] if plan.args else None
+            values = yield from self._items_steps(config, path, value_cls, skip_construction)
+            return None if values is None else cls(values)
 
         if not isinstance(config, abc.Mapping):
-            if origin is not None and not isinstance(config, origin):
-                raise ConfigurationError(
-                    f"[{get_path_name(path)}] Type mismatch, expected type is "
-                    f"{origin}, but actual type is {type(config)}."
-                )
-            if (
-                isinstance(annotation, type)
-                and not isinstance(annotation, GenericAlias)
-                and not isinstance(config, annotation)
-            ):
-                raise ConfigurationError(
-                    f"[{get_path_name(path)}] Type mismatch, expected type is "
-                    f"{annotation}, but actual type is {type(config)}."
-                )
+            return self._build_value(config, path, plan)
+
+        if plan.is_instance_origin and isinstance(config, origin) and self._typekey not in config:
             return config
 
         if annotation is None and self._typekey not in config:
-            return {
-                key: self._build(
-                    val,
-                    path + (key,),
-                    context=context,
-                    skip_construction=skip_construction,
-                )
-                for key, val in config.items()
-            }
+            return (yield from self._untyped_mapping_steps(config, path, skip_construction))
 
-        if not origin and isinstance(annotation, TypeVar):
-            return self._build(
-                config,
-                path,
-                annotation.__bound__,
-                context=context,
-                skip_construction=skip_construction,
-            )
+        if plan.is_typevar:
+            return (yield (config, path, plan.annotation.__bound__, True, skip_construction))
 
+        typed = False
         if self._typekey in config:
-            config = dict(config)
-            candidate_constructor = origin or annotation
+            candidate_constructor = plan.candidate_constructor
             if candidate_constructor is not None and self._has_argument(candidate_constructor, self._typekey):
                 # typekey conflicts with a constructor argument; treat it as a regular argument
-                constructor = candidate_constructor  # type: ignore[assignment]
+                constructor = plan.constructor
             else:
                 class_name = config[self._typekey]
                 try:
-                    constructor: Union[Type[T], Callable[..., T]] = self._get_constructor_by_name(
+                    constructor = self._get_constructor_by_name(
                         class_name, path, annotation, allow_to_import=not self._strict
                     )
                 except ConfigurationError:
@@ -563,29 +2065,19 @@ class ColtBuilder:
                     # not a registered name, so treat the mapping as plain data rather than a
                     # type tag (e.g. list[dict[str, Any]] with {"type": "text", ...} elements).
                     if annotation is None or annotation is Any:
-                        return {
-                            key: self._build(
-                                val,
-                                path + (key,),
-                                context=context,
-                                skip_construction=skip_construction,
-                            )
-                            for key, val in config.items()
-                        }
+                        return (yield from self._untyped_mapping_steps(config, path, skip_construction))
                     raise
-                # Consume the typekey only once dispatch is confirmed, so the fallback
-                # above keeps the original mapping (and key order) untouched.
-                config.pop(self._typekey)
+                # the typekey is skipped when reading arguments instead of copying the config
+                typed = True
+                if constructor and is_new_type(constructor):
+                    constructor = get_new_type_constructor(constructor)  # type: ignore
         else:
-            constructor = origin or annotation  # type: ignore
+            constructor = plan.constructor
 
-        if constructor and is_new_type(constructor):
-            constructor = get_new_type_constructor(constructor)  # type: ignore
-
-        if origin == abc.Callable:
+        if plan.is_callable:
             if not issubtype(constructor, annotation, strict=self._strict):
                 raise ConfigurationError(
-                    f"[{get_path_name(path)}] Type mismatch, expected type is {type}, but actual type is {constructor}."
+                    f"[{get_path_name(to_param_path(path))}] Type mismatch, expected type is {type}, but actual type is {constructor}."
                 )
         elif (
             annotation is not None
@@ -595,27 +2087,165 @@ class ColtBuilder:
             and not issubclass(constructor, annotation)
         ):
             raise ConfigurationError(
-                f"[{get_path_name(path)}] Type mismatch, expected type is "
+                f"[{get_path_name(to_param_path(path))}] Type mismatch, expected type is "
                 f"{annotation}, but actual type is {constructor}."
             )
 
-        args_for_constructor, kwargs_for_constructor = self._construct_args(
+        cache_keys: Optional[Tuple[Optional[Hashable], Optional[str]]] = None
+        if (
+            (self._object_cache is not None or self._disk_cache is not None)
+            and not skip_construction
+            and self._build_callback is None
+            and context.references is None
+            and Registrable.is_cacheable(constructor)
+        ):
+            cache_keys = self._cache_keys(constructor, config)
+            cached, obj = self._get_cached(cache_keys)
+            if cached:
+                return obj
+
+        args_for_constructor, kwargs_for_constructor = yield from self._construct_args_steps(
             constructor,
             config,
             path,
             context=context,
             skip_construction=skip_construction,
+            typed=typed,
         )
 
         if skip_construction:
             return None
 
         try:
-            return constructor(*args_for_constructor, **kwargs_for_constructor)
+            obj = constructor(*args_for_constructor, **kwargs_for_constructor)
+            if type(obj) is not constructor and inspect.isawaitable(obj):
+                obj = yield AwaitRequest(obj)
         except Exception as e:
             if raise_configuration_error:
                 raise ConfigurationError(
-                    f"[{get_path_name(path)}] Failed to construct object with constructor {constructor}."
+                    f"[{get_path_name(to_param_path(path))}] Failed to construct object with constructor {constructor}."
                 ) from e
             else:
                 raise
+        if cache_keys is not None:
+            self._put_cached(cache_keys, obj)
+        return obj
+
+    def _cache_keys(self, constructor: Any, config: Mapping[str, Any]) -> Tuple[Optional[Hashable], Optional[str]]:
+        """Keys of a config in the object cache and in the disk cache.
+
+        The keys consist of the settings that affect building nested configs, the
+        resolved constructor and the canonical form of the config. A key is `None` if
+        the cache is not given or the config cannot be cached in it.
+        """
+        settings = (self._typekey, self._argskey, self._strict, self._tagkey)
+        object_key: Optional[Hashable] = None
+        if self._object_cache is not None:
+            config_key = get_config_key(config)
+            if config_key is not None:
+                object_key = (settings, constructor, config_key)
+        disk_key: Optional[str] = None
+        if self._disk_cache is not None:
+            disk_key = self._disk_cache.key(constructor, config, settings)
+        return object_key, disk_key
+
+    def _get_cached(self, keys: Tuple[Optional[Hashable], Optional[str]]) -> Tuple[bool, Any]:
+        object_key, disk_key = keys
+        if object_key is not None and self._object_cache is not None:
+            cached, obj = self._object_cache.get(object_key)
+            if cached:
+                return True, obj
+        if disk_key is not None and self._disk_cache is not None:
+            cached, obj = self._disk_cache.get(disk_key)
+            if cached:
+                if object_key is not None and self._object_cache is not None:
+                    self._object_cache.put(object_key, obj)
+                return True, obj
+        return False, None
+
+    def _put_cached(self, keys: Tuple[Optional[Hashable], Optional[str]], obj: Any) -> None:
+        object_key, disk_key = keys
+        if object_key is not None and self._object_cache is not None:
+            self._object_cache.put(object_key, obj)
+        if disk_key is not None and self._disk_cache is not None:
+            self._disk_cache.put(disk_key, obj)
+
+    def _build_value(self, config: Any, path: LinkedPath, plan: BuildPlan) -> Any:
+        """Build a config that is neither a mapping nor a collection with the default handler."""
+        annotation = plan.annotation
+        origin = plan.origin
+
+        if plan.is_numeric and isinstance(config, int):
+            return annotation(config)
+
+        if plan.is_instance_origin and isinstance(config, origin):
+            return config
+
+        if origin is not None and not isinstance(config, origin):
+            raise _TypeMismatchError(
+                f"[{get_path_name(to_param_path(path))}] Type mismatch, expected type is "
+                f"{origin}, but actual type is {type(config)}.",
+                path,
+            )
+        if (
+            isinstance(annotation, type)
+            and not isinstance(annotation, GenericAlias)
+            and not isinstance(config, annotation)
+        ):
+            raise _TypeMismatchError(
+                f"[{get_path_name(to_param_path(path))}] Type mismatch, expected type is "
+                f"{annotation}, but actual type is {type(config)}.",
+                path,
+            )
+        return config
+
+    def _untyped_mapping_steps(
+        self,
+        config: Mapping[Any, Any],
+        path: LinkedPath,
+        skip_construction: bool,
+    ) -> Generator[BuildRequest, Any, Optional[Dict[Any, Any]]]:
+        if skip_construction and _check_only.get():
+            for key, val in config.items():
+                yield (val, (path, key), None, True, skip_construction)
+            return None
+        values: Dict[Any, Any] = {}
+        for key, val in config.items():
+            values[key] = yield (val, (path, key), None, True, skip_construction)
+        return values
+
+
+# Builders of worker processes and of unpickled `Lazy` objects, keyed on their settings.
+_shared_builders: Dict[Tuple[Tuple[str, Any], ...], ColtBuilder] = {}
+
+
+def _get_shared_builder(settings: Dict[str, Any]) -> ColtBuilder:
+    """Builder created from `ColtBuilder._settings`, shared within the process."""
+    key = tuple(sorted(settings.items()))
+    builder = _shared_builders.get(key)
+    if builder is None:
+        builder = _shared_builders[key] = ColtBuilder(**settings)
+    return builder
+
+
+def _build_in_process(payload: bytes) -> Optional[bytes]:
+    """Build a pickled subtree in a worker process and return the pickled object.
+
+    `None` is returned if the object cannot be pickled.
+    """
+    settings, _, config, path, annotation = pickle.loads(payload)
+    builder = _get_shared_builder(settings)
+    obj = builder._build(config, to_linked_path(path), annotation, context=ColtContext(config=config))
+    try:
+        return pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+ColtBuilder.register_handler(List, list, Sequence, abc.Sequence, abc.MutableSequence)(ColtBuilder._sequence_steps)
+ColtBuilder.register_handler(Set, set, abc.Set)(ColtBuilder._set_steps)
+ColtBuilder.register_handler(Tuple, tuple)(ColtBuilder._tuple_steps)
+ColtBuilder.register_handler(Dict, dict, abc.Mapping, abc.MutableMapping)(ColtBuilder._mapping_steps)
+ColtBuilder.register_handler(Literal)(ColtBuilder._build_literal)
+ColtBuilder.register_handler(Union, UnionType)(ColtBuilder._union_steps)
+ColtBuilder.register_handler(Lazy)(ColtBuilder._lazy_steps)
@@ -0,0 +1,312 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict, abc
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Hashable, List, NamedTuple, Optional, Tuple, Union
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+def get_config_shape(config: Any, typekey: str, depth: int = 2) -> Hashable:
+    """Fingerprint of a config made of its mapping keys and leaf types.
+
+    Type names under the typekey are part of the shape. Mappings nested deeper
+    than `depth` and all sequences are represented only by their type.
+    """
+    if isinstance(config, abc.Mapping) and depth > 0:
+        return tuple(
+            (key, value if key == typekey and isinstance(value, str) else get_config_shape(value, typekey, depth - 1))
+            for key, value in config.items()
+        )
+    return type(config)
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def get_config_key(config: Any) -> Optional[Hashable]:
+    """Canonical hashable form of a config, or `None` if it contains unhashable values.
+
+    Mappings compare equal regardless of the order of their keys, and every leaf is
+    paired with its type so that e.g. `1`, `1.0` and `True` are told apart.
+    """
+    try:
+        return _canonicalize(config)
+    except _Unhashable:
+        return None
+
+
+def _canonicalize(config: Any) -> Hashable:
+    if isinstance(config, abc.Mapping):
+        return (dict, frozenset((key, _canonicalize(value)) for key, value in config.items()))
+    if isinstance(config, (list, tuple)):
+        return (type(config), tuple(_canonicalize(value) for value in config))
+    if isinstance(config, (set, frozenset)):
+        return (set, frozenset(_canonicalize(value) for value in config))
+    try:
+        hash(config)
+    except TypeError:
+        raise _Unhashable from None
+    return (type(config), config)
+
+
+# Leaf types whose representation is stable across processes.
+_DIGESTIBLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def get_config_digest(config: Any) -> Optional[str]:
+    """SHA-256 digest of the canonical form of a config, stable across processes.
+
+    Like `get_config_key`, the digest does not depend on the order of mapping keys.
+    `None` is returned if the config contains values other than mappings, lists,
+    tuples and scalars of builtin types.
+    """
+    try:
+        encoded = _encode(config)
+    except _Unhashable:
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _encode(config: Any) -> str:
+    if isinstance(config, abc.Mapping):
+        return "{" + ",".join(sorted(_encode(key) + ":" + _encode(value) for key, value in config.items())) + "}"
+    if isinstance(config, (list, tuple)):
+        return type(config).__name__ + "[" + ",".join(_encode(value) for value in config) + "]"
+    if type(config) in _DIGESTIBLE_TYPES:
+        return type(config).__name__ + ":" + repr(config)
+    raise _Unhashable
+
+
+def get_qualified_name(obj: Any) -> Optional[str]:
+    """Importable name of a class or function, or `None` if it is not importable."""
+    owner = getattr(obj, "__self__", None)
+    if owner is not None:
+        owner_name = get_qualified_name(owner)
+        return None if owner_name is None else f"{owner_name}.{obj.__name__}"
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str) or "<locals>" in qualname:
+        return None
+    return f"{module}.{qualname}"
+
+
+class UnionMismatchCache:
+    """Remembers which members of a union mismatch the type of configs of a given shape.
+
+    Such members are skipped when building configs of the same shape. The other members
+    are still tried in declaration order, so the cache does not change build results.
+    """
+
+    def __init__(self) -> None:
+        self._mismatches: Dict[Hashable, FrozenSet[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[FrozenSet[Any]]:
+        mismatches = self._mismatches.get(key)
+        if mismatches is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return mismatches
+
+    def put(self, key: Hashable, mismatches: FrozenSet[Any]) -> None:
+        self._mismatches[key] = mismatches
+
+    def clear(self) -> None:
+        self._mismatches.clear()
+        self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(hits=self._hits, misses=self._misses, evictions=0, size=len(self._mismatches))
+
+
+class ObjectCache:
+    """Size-bounded LRU cache of constructed objects.
+
+    Builders given the cache return the cached instance for configs of classes
+    registered with `cacheable=True` instead of constructing them again. The cache
+    may be shared by several builders and is safe to use from multiple threads.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._objects: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return whether the key is cached and the cached object."""
+        with self._lock:
+            try:
+                obj = self._objects[key]
+            except KeyError:
+                self._misses += 1
+                return False, None
+            self._objects.move_to_end(key)
+            self._hits += 1
+            return True, obj
+
+    def put(self, key: Hashable, obj: Any) -> None:
+        with self._lock:
+            self._objects[key] = obj
+            self._objects.move_to_end(key)
+            while len(self._objects) > self._maxsize:
+                self._objects.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._objects.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._objects))
+
+
+class DiskCache:
+    """Directory of pickled constructed objects that persists across processes.
+
+    Entries are keyed on a digest of the constructor name, the builder settings, the
+    canonical config and `version`, which should be changed whenever the code of the
+    cached classes changes. Entries are written atomically, so concurrent processes may
+    share the directory. If `max_bytes` is given, least recently used entries are
+    removed once the total size of the entries exceeds it.
+    """
+
+    suffix = ".pkl"
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        version: str = "",
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._version = version
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    def key(self, constructor: Any, config: Any, settings: Tuple[Any, ...] = ()) -> Optional[str]:
+        """Return the key of a config built by a constructor, or `None` if it cannot be stored."""
+        name = get_qualified_name(constructor)
+        config_digest = get_config_digest(config)
+        if name is None or config_digest is None:
+            return None
+        material = "\n".join((self._version, name, repr(settings), config_digest))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return whether the key is stored and the stored object."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                obj = pickle.load(f)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return False, None
+        except Exception:
+            # truncated, or written by code that is no longer compatible
+            with suppress(OSError):
+                path.unlink()
+            self._count(hit=False)
+            return False, None
+        with suppress(OSError):
+            os.utime(path)  # entries are evicted in the order of their last use
+        self._count(hit=True)
+        return True, obj
+
+    def put(self, key: str, obj: Any) -> bool:
+        """Store an object and return whether it could be pickled."""
+        try:
+            payload = pickle.dumps(obj)
+        except Exception:
+            return False
+        fd, temp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(temp, self._path(key))
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temp)
+            raise
+        if self._max_bytes is not None:
+            self._evict(self._max_bytes)
+        return True
+
+    def clear(self) -> None:
+        for path in self._entries():
+            with suppress(OSError):
+                path.unlink()
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        size = len(self._entries())
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, evictions=self._evictions, size=size)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / (key + self.suffix)
+
+    def _entries(self) -> List[Path]:
+        return list(self._directory.glob("*" + self.suffix))
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _evict(self, max_bytes: int) -> None:
+        entries: List[Tuple[int, int, Path]] = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            with suppress(OSError):
+                path.unlink()
+                with self._lock:
+                    self._evictions += 1
+            total -= size
@@ -1,6 +1,6 @@
 import typing
 from contextlib import suppress
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Collection, Optional, Type, TypeVar, Union
 
 if typing.TYPE_CHECKING:
     from colt.builder import ColtBuilder, ParamPath
@@ -9,11 +9,50 @@ if typing.TYPE_CHECKING:
 
 T = TypeVar("T")
 
+HOOKS = ("on_start", "on_build")
+
 
 class SkipCallback(Exception): ...
 
 
 class ColtCallback:
+    """Hooks called by `ColtBuilder` while building a config.
+
+    A callback may declare what it is interested in, so that the builder does not
+    have to call it (and catch `SkipCallback`) for every node:
+
+    - `hooks`: names of the hooks to call. Defaults to the hooks overridden by the subclass.
+    - `annotations`: annotations for which `on_build` is called. Defaults to all.
+    - `paths`: paths for which `on_build` is called, e.g. `[()]` for the root only. Defaults to all.
+
+    Raising `SkipCallback` from a hook leaves the config unchanged.
+    """
+
+    hooks: Optional[Collection[str]] = None
+    annotations: Optional[Collection[Any]] = None
+    paths: Optional[Collection["ParamPath"]] = None
+
+    def implements(self, hook: str) -> bool:
+        """Return whether the builder has to call the given hook."""
+        if self.hooks is not None:
+            return hook in self.hooks
+        return getattr(type(self), hook) is not getattr(ColtCallback, hook)
+
+    def accepts(
+        self,
+        path: "ParamPath",
+        annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> bool:
+        """Return whether `on_build` has to be called for the given path and annotation."""
+        if self.annotations is not None:
+            try:
+                if annotation not in self.annotations:
+                    return False
+            except TypeError:
+                # unhashable annotations cannot be declared
+                return False
+        return self.paths is None or path in self.paths
+
     def on_start(
         self,
         config: Any,
@@ -38,6 +77,16 @@ class ColtCallback:
 class MultiCallback(ColtCallback):
     def __init__(self, *callbacks: ColtCallback) -> None:
         self.callbacks = callbacks
+        self.hooks = frozenset(hook for hook in HOOKS if any(callback.implements(hook) for callback in callbacks))
+        self._start_callbacks = tuple(callback for callback in callbacks if callback.implements("on_start"))
+        self._build_callbacks = tuple(callback for callback in callbacks if callback.implements("on_build"))
+
+    def accepts(
+        self,
+        path: "ParamPath",
+        annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> bool:
+        return any(callback.accepts(path, annotation) for callback in self._build_callbacks)
 
     def on_start(
         self,
@@ -46,7 +95,7 @@ class MultiCallback(ColtCallback):
         context: "ColtContext",
         annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
     ) -> Any:
-        for callback in self.callbacks:
+        for callback in self._start_callbacks:
             with suppress(SkipCallback):
                 config = callback.on_start(config, builder, context, annotation)
         return config
@@ -59,7 +108,9 @@ class MultiCallback(ColtCallback):
         context: "ColtContext",
         annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
     ) -> Any:
-        for callback in self.callbacks:
+        for callback in self._build_callbacks:
+            if not callback.accepts(path, annotation):
+                continue
             with suppress(SkipCallback):
                 config = callback.on_build(path, config, builder, context, annotation)
         return config
@@ -1,6 +1,10 @@
 import dataclasses
 import typing
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
+
+from colt.record import BuildRecord
+from colt.reference import ReferenceTable
+from colt.validation import ValidationScope
 
 if typing.TYPE_CHECKING:
     from colt.callback import ColtCallback
@@ -13,3 +17,6 @@ CallbackState = Dict[Type["ColtCallback"], Dict[str, Any]]
 class ColtContext:
     config: Any
     state: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    references: Optional[ReferenceTable] = None
+    record: Optional[BuildRecord] = None
+    scope: Optional[ValidationScope] = None
@@ -144,6 +144,7 @@ class JsonSchemaGenerator:
                 if not root:
                     definitions.update({ref_name: {}})  # prevent recursion
                 if issubclass(target, Registrable):
+                    target._load_pending()
                     if registry := Registrable._registry[target]:
                         subclasses = defaultdict(list)
                         for name, (subclass, constructor_name) in registry.items():
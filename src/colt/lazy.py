@@ -1,9 +1,13 @@
+import dataclasses
+import pickle
 import typing
-from copy import deepcopy
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
+    Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -12,10 +16,12 @@ from typing import (
     Union,
 )
 
-from colt.utils import update_field
+from colt.error import ConfigurationError
+from colt.reference import ReferenceTable, find_references
+from colt.utils import get_field_path, get_path_name, override_fields, to_linked_path, update_field
 
 if typing.TYPE_CHECKING:
-    from colt.builder import ColtBuilder, ParamPath
+    from colt.builder import ColtBuilder, ObjectFactory, ParamPath
     from colt.context import ColtContext
 
 T = TypeVar("T")
@@ -41,8 +47,69 @@ class Lazy(Generic[T]):
         self._path = path
         self._context = context
         self._builder = builder or ColtBuilder()
+        self._validated = False
+        # compiled on the first construction, `None` if the config cannot be compiled
+        self._factory: Optional["ObjectFactory"] = None
+        self._compiled = False
 
-        self._builder.dry_run(self._config, self._cls, path=self._path, context=self._context)
+        if self._builder.defer_lazy_validation:
+            self._builder._count_lazy_validation(deferred=1)
+        else:
+            self._validate()
+
+    def _validate(self) -> None:
+        self._share_root(self._context.references)
+        self._builder._validate_lazy(self._config, self._cls, self._path, self._context)
+        self._validated = True
+
+    def _share_root(self, references: Optional[ReferenceTable]) -> None:
+        if references is not None and self._path in references.targets:
+            # the `Lazy` is the object shared at its path; its config is built as usual
+            references.pending = self._path
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the config of the `Lazy` and the settings of its builder.
+
+        The root config and the caches of the builder are left out, so that a `Lazy`
+        is cheap to send to worker processes, where it is constructed without being
+        validated again. The constructor named by the typekey is pickled as well, so
+        that unpickling imports the module registering it.
+        """
+        builder = self._builder
+        if self._context.references is not None and find_references(self._config, builder.refkey):
+            raise pickle.PicklingError(f"[{get_path_name(self._path)}] Lazy configs with references cannot be pickled.")
+        constructor = None
+        if isinstance(self._config, Mapping) and builder.typekey in self._config:
+            try:
+                constructor = self.constructor
+            except ConfigurationError:
+                pass
+        return {
+            "config": self._config,
+            "path": self._path,
+            "cls": self._cls,
+            "constructor": constructor,
+            "settings": builder._settings(),
+            "callback": builder.callback,
+            "validated": self._validated,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        from colt.builder import ColtBuilder, _get_shared_builder
+        from colt.context import ColtContext
+
+        settings = state["settings"]
+        callback = state["callback"]
+        self._cls = state["cls"]
+        self._config = state["config"]
+        self._path = state["path"]
+        self._context = ColtContext(config=self._config)
+        self._builder = (
+            _get_shared_builder(settings) if callback is None else ColtBuilder(callback=callback, **settings)
+        )
+        self._validated = state["validated"]
+        self._factory = None
+        self._compiled = False
 
     @property
     def config(self) -> Any:
@@ -58,32 +125,74 @@ class Lazy(Generic[T]):
 
     @property
     def constructor(self) -> Optional[Union[Type[T], Callable[..., T]]]:
-        return self._builder._get_constructor(self._config, self._path, self._cls) or self._cls
+        return self._builder._get_constructor(self._config, to_linked_path(self._path), self._cls) or self._cls
 
     def update(
         self,
         *args: Mapping[Union[int, str, Sequence[Union[int, str]]], Any],
         **kwargs: Any,
     ) -> None:
-        for arg in args:
-            for field, value in arg.items():
-                update_field(self._config, field, value)
-        for k, v in kwargs.items():
-            update_field(self._config, k, v)
-        self._builder.dry_run(self._config, self._cls, path=self._path)
+        """Update fields of the config in place.
+
+        Only the updated fields and their ancestors are checked again, or nothing
+        if the validation of the config is deferred until construction.
+        """
+        updates = [item for arg in args for item in arg.items()]
+        updates.extend(kwargs.items())
+        for field, value in updates:
+            update_field(self._config, field, value)
+        self._factory = None
+        self._compiled = False
+        if not self._validated:
+            self._builder._count_lazy_validation(deferred=1)
+            return
+        self._share_root(self._context.references)
+        self._builder._validate_lazy(
+            self._config,
+            self._cls,
+            self._path,
+            self._context,
+            [(get_field_path(self._config, field), value) for field, value in updates],
+        )
 
     def construct(
         self,
         *args: Mapping[Union[int, str, Sequence[Union[int, str]]], Any],
         **kwargs: Any,
     ) -> T:
+        """Construct an object from the config with the given fields overridden.
+
+        The construction of the config is compiled on the first call, so that later
+        calls do not resolve the constructor and the arguments that are not overridden
+        again.
+        """
+        if not self._validated:
+            self._validate()
         if args or kwargs:
-            config = deepcopy(self._config)
-            for arg in args:
-                for field, value in arg.items():
-                    update_field(config, field, value)
-            for k, v in kwargs.items():
-                update_field(config, k, v)
+            overrides = [item for arg in args for item in arg.items()]
+            overrides.extend(kwargs.items())
+            config = override_fields(self._config, overrides)
         else:
             config = self._config
-        return self._builder._build(config, self._path, self._cls, context=self._context)
+        if self._factory is not None:
+            return self._factory(config, self._context)
+        context = self._context
+        references = context.references
+        if references is not None:
+            # objects referenced within the config are built for each construction
+            context = dataclasses.replace(context, references=references.subtree(self._path, config))
+            self._share_root(context.references)
+        obj = self._builder._build(config, to_linked_path(self._path), self._cls, context=context)
+        if references is not None and context.references is not None:
+            references.merge(context.references, self._path)
+        if not self._compiled:
+            self._factory = self._builder._compile_factory(self._config, self._path, self._cls, self._context)
+            self._compiled = True
+        return obj
+
+    def construct_many(
+        self,
+        overrides: Iterable[Mapping[Union[int, str, Sequence[Union[int, str]]], Any]],
+    ) -> List[T]:
+        """Construct an object for each mapping of fields to override."""
+        return [self.construct(fields) for fields in overrides]
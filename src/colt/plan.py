@@ -0,0 +1,169 @@
+import dataclasses
+import typing
+from collections import abc
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from colt._compat import EnumType
+from colt.utils import (
+    evaluate_forward_refs,
+    find_classes,
+    get_new_type_constructor,
+    get_typevar_map,
+    infer_scope,
+    is_defined_in,
+    is_global,
+    is_namedtuple,
+    is_new_type,
+    is_typeddict,
+    remove_optional,
+    reveal_origin,
+    trace_bases,
+)
+
+
+@dataclasses.dataclass
+class BuildPlan:
+    """Config-independent analysis of a type annotation.
+
+    A plan records every decision of `ColtBuilder` that depends only on the
+    annotation (origin, type arguments, the handler it is dispatched to and the
+    default constructor), so that repeated builds only execute the parts that
+    depend on the given config.
+    Plans are created and cached by `ColtBuilder.compile`.
+    """
+
+    annotation: Any
+    origin: Any
+    args: Tuple[Any, ...]
+    is_namedtuple: bool
+    is_enum: bool
+    is_typevar: bool
+    is_callable: bool
+    is_numeric: bool
+    is_instance_origin: bool
+    candidate_constructor: Any
+    constructor: Any
+    handler: Optional[Callable[..., Any]] = None
+    # whether the handler is a generator function yielding the builds of nested values
+    stepwise: bool = False
+
+    @classmethod
+    def from_annotation(cls, annotation: Any) -> "BuildPlan":
+        if annotation is not None and isinstance(annotation, type):
+            annotation = remove_optional(annotation)
+        if annotation == Any:
+            annotation = None
+
+        origin = reveal_origin(annotation)
+        args = typing.get_args(annotation)
+
+        candidate_constructor = origin or annotation
+        constructor = candidate_constructor
+        if constructor and is_new_type(constructor):
+            constructor = get_new_type_constructor(constructor)
+
+        return cls(
+            annotation=annotation,
+            origin=origin,
+            args=args,
+            is_namedtuple=bool(annotation) and is_namedtuple(annotation),
+            is_enum=bool(annotation) and isinstance(annotation, EnumType),
+            is_typevar=not origin and isinstance(annotation, TypeVar),
+            is_callable=origin == abc.Callable,
+            is_numeric=isinstance(annotation, type) and issubclass(annotation, (float, complex)),
+            is_instance_origin=origin is not None and not is_typeddict(origin) and isinstance(origin, type),
+            candidate_constructor=candidate_constructor,
+            constructor=constructor,
+        )
+
+    @cached_property
+    def field_type_hints(self) -> Dict[str, Any]:
+        """Field annotations of a NamedTuple annotation."""
+        return typing.get_type_hints(self.annotation)
+
+    @cached_property
+    def typevar_params(self) -> Mapping[TypeVar, TypeVar]:
+        """Type variables of the annotation that are parameterized by other type variables."""
+        return {k: v for k, v in get_typevar_map(self.annotation).items() if isinstance(v, TypeVar)}
+
+    @cached_property
+    def typevar_bindings(self) -> List[Tuple[TypeVar, Any]]:
+        """Type variable bindings declared by the bases of the annotated class, in resolution order."""
+        if not isinstance(self.annotation, type):
+            return []
+        scope: Dict[str, Any] = {}
+        bindings: List[Tuple[TypeVar, Any]] = []
+        for cls_ in trace_bases(self.annotation):
+            for type_var, type_ in get_typevar_map(cls_).items():
+                if isinstance(type_, ForwardRef):
+                    scope = scope or infer_scope(self.annotation)
+                    type_ = evaluate_forward_refs(type_, globals(), scope)
+                bindings.append((type_var, type_))
+        return bindings
+
+
+# `Py_TPFLAGS_HEAPTYPE`, set for classes created at runtime (e.g. by class statements)
+_HEAPTYPE = 1 << 9
+
+
+class PlanCache:
+    """Cache of build plans keyed on annotations.
+
+    A plan refers to the classes of its annotation, so caching the plans of classes
+    that may be garbage collected (e.g. classes defined in a function) would keep them
+    alive as long as the builder. Plans of annotations referring to classes that cannot
+    be imported by their qualified name are therefore compiled on every access.
+    """
+
+    def __init__(self) -> None:
+        self._plans: Dict[Any, BuildPlan] = {}
+
+    def __getitem__(self, annotation: Any) -> BuildPlan:
+        return self._plans[annotation]
+
+    def __setitem__(self, annotation: Any, plan: BuildPlan) -> None:
+        if self._is_cacheable(plan):
+            self._plans[annotation] = plan
+
+    def __contains__(self, annotation: Any) -> bool:
+        return annotation in self._plans
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    @staticmethod
+    def _is_cacheable(plan: BuildPlan) -> bool:
+        # static types (e.g. builtins and NoneType) are never collected
+        return all(
+            not cls.__flags__ & _HEAPTYPE or is_global(cls)
+            for cls in (*find_classes(plan.annotation), plan.constructor)
+            if isinstance(cls, type)
+        )
+
+    def invalidate(self, modules: Iterable[str] = ()) -> None:
+        """Drop plans referring to objects defined in the given modules (all if empty)."""
+        modules = tuple(modules)
+        if not modules:
+            self._plans.clear()
+            return
+        for key in [
+            key
+            for key, plan in self._plans.items()
+            if any(
+                is_defined_in(obj, modules)
+                for obj in (*find_classes(plan.annotation), plan.annotation, plan.constructor)
+            )
+        ]:
+            del self._plans[key]
@@ -0,0 +1,61 @@
+from collections import abc
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from colt.types import ParamPath
+
+
+def find_unchanged_paths(old: Any, new: Any) -> Set[ParamPath]:
+    """Paths at which two configs have equal subtrees.
+
+    Mappings are compared regardless of the order of their keys, and leaves are only
+    equal if they are of the same type.
+    """
+    # nodes in pre-order, so that every node comes after its parent
+    nodes: List[Tuple[ParamPath, Any, Any, int]] = []
+    stack: List[Tuple[ParamPath, Any, Any, int]] = [((), old, new, -1)]
+    while stack:
+        node = stack.pop()
+        path, a, b, _ = node
+        index = len(nodes)
+        nodes.append(node)
+        if isinstance(a, abc.Mapping) and isinstance(b, abc.Mapping):
+            stack.extend((path + (key,), a[key], b[key], index) for key in a if key in b)
+        elif isinstance(a, (list, tuple)) and type(a) is type(b):
+            stack.extend((path + (i,), x, y, index) for i, (x, y) in enumerate(zip(a, b)))
+
+    equal = [_shallow_equal(a, b) for _, a, b, _ in nodes]
+    for index in range(len(nodes) - 1, 0, -1):
+        if not equal[index]:
+            equal[nodes[index][3]] = False
+    return {node[0] for node, same in zip(nodes, equal) if same}
+
+
+def _shallow_equal(a: Any, b: Any) -> bool:
+    if isinstance(a, abc.Mapping):
+        return isinstance(b, abc.Mapping) and a.keys() == b.keys()
+    if isinstance(a, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b)
+    if type(a) is not type(b):
+        return False
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+class BuildRecord:
+    """Objects built at each path of a config, with the annotations they were built for.
+
+    A record is filled while building and is used by `ColtBuilder.rebuild` to reuse
+    the objects of subtrees that did not change. Only configs that are mappings or
+    collections are recorded.
+    """
+
+    def __init__(self, reusable: Optional[Dict[ParamPath, Tuple[Any, Any]]] = None) -> None:
+        self.reusable: Dict[ParamPath, Tuple[Any, Any]] = reusable or {}
+        # reused objects keep their place in the record of the new build
+        self.objects: Dict[ParamPath, Tuple[Any, Any]] = dict(self.reusable)
+
+    def reuse(self, unchanged: Set[ParamPath]) -> "BuildRecord":
+        """Create a record for rebuilding, reusing the objects at unchanged paths."""
+        return BuildRecord({path: entry for path, entry in self.objects.items() if path in unchanged})
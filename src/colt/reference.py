@@ -0,0 +1,109 @@
+from collections import abc
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from colt.types import ParamPath
+from colt.utils import override_fields
+
+_CONTAINER_TYPES = {dict, list, tuple}
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def find_references(config: Any, refkey: str) -> List[str]:
+    """Collect the names of the configs referenced within a config.
+
+    A reference is a mapping whose only key is `refkey`, with the dotted path of
+    the referenced config from the root as its value, e.g. `{"@ref": "encoder.embedding"}`.
+    """
+    names: List[str] = []
+    stack: List[Any] = [config] if isinstance(config, (abc.Mapping, list, tuple)) else []
+    while stack:
+        node = stack.pop()
+        if isinstance(node, abc.Mapping):
+            name = node.get(refkey)
+            if isinstance(name, str):
+                names.append(name)
+            children: Iterable[Any] = node.values()
+        elif node and type(node[0]) in _SCALAR_TYPES and _SCALAR_TYPES.issuperset(map(type, node)):
+            # long lists of numbers or strings are skipped without a loop in Python
+            continue
+        else:
+            children = node
+        for child in children:
+            kind = type(child)
+            if kind in _CONTAINER_TYPES or (
+                kind not in _SCALAR_TYPES and isinstance(child, (abc.Mapping, list, tuple))
+            ):
+                stack.append(child)
+    return names
+
+
+class ReferenceTable:
+    """Objects shared through references during a build.
+
+    Referenced configs are built once, when they or a reference to them are
+    reached first, and the built object is returned for every other occurrence.
+    """
+
+    def __init__(self, root: Any, targets: Set[ParamPath], annotation: Any = None) -> None:
+        self.root = root
+        # annotation of the root config, which the annotations of the targets are resolved from
+        self.annotation = annotation
+        self.annotations: Dict[ParamPath, Any] = {}
+        self.targets = targets
+        self.values: Dict[ParamPath, Any] = {}
+        self.building: Set[ParamPath] = set()
+        # target whose build is requested next, which is built as usual instead of shared
+        self.pending: Optional[ParamPath] = None
+
+    @classmethod
+    def from_config(cls, config: Any, refkey: str, annotation: Any = None) -> Optional["ReferenceTable"]:
+        """Create a table for the references within a config, or return `None` if there are none."""
+        names = find_references(config, refkey)
+        if not names:
+            return None
+        table = cls(config, set(), annotation)
+        for name in names:
+            try:
+                table.targets.add(table.resolve(name)[0])
+            except KeyError:
+                # reported when the reference is built
+                continue
+        return table
+
+    def subtree(self, path: ParamPath, config: Any) -> "ReferenceTable":
+        """Table for building `config` again in place of the config at `path`.
+
+        Objects built outside of `path` are still shared, while targets within it are
+        built again and resolved against `config`, e.g. for each construction of a `Lazy`.
+        """
+        root = override_fields(self.root, [(path, config)]) if path else config
+        table = ReferenceTable(root, self.targets, self.annotation)
+        table.values = {target: value for target, value in self.values.items() if target[: len(path)] != path}
+        table.annotations = {
+            target: annotation for target, annotation in self.annotations.items() if target[: len(path)] != path
+        }
+        return table
+
+    def merge(self, table: "ReferenceTable", path: ParamPath) -> None:
+        """Share the objects built outside of `path` by a table created with `subtree`."""
+        for target, value in table.values.items():
+            if target[: len(path)] != path:
+                self.values.setdefault(target, value)
+
+    def resolve(self, name: str) -> Tuple[ParamPath, Any]:
+        """Return the path and the config referenced by a dotted path.
+
+        Raises `KeyError` if the path does not exist in the root config.
+        """
+        path: List[Union[int, str]] = []
+        node = self.root
+        for key in name.split(".") if name else ():
+            if isinstance(node, abc.Mapping) and key in node:
+                node = node[key]
+                path.append(key)
+            elif isinstance(node, (list, tuple)) and key.isdigit() and int(key) < len(node):
+                node = node[int(key)]
+                path.append(int(key))
+            else:
+                raise KeyError(name)
+        return tuple(path), node
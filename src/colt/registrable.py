@@ -5,7 +5,10 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Literal,
+    Mapping,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -13,14 +16,32 @@ from typing import (
     cast,
 )
 
+from colt._compat import entry_points
 from colt.error import ConfigurationError
 
 T = TypeVar("T")
 Registry = Dict[Type["Registrable"], Dict[str, Tuple[Type[Any], Optional[str]]]]
+Executor = Literal["process"]
+
+
+class _ImportFailure:
+    """Failure to import the object at an import path, raised again on later lookups."""
+
+    __slots__ = ("message", "cause")
+
+    def __init__(self, message: str, cause: BaseException) -> None:
+        self.message = message
+        self.cause = cause
 
 
 class Registrable:
     _registry: ClassVar[Registry] = defaultdict(dict)
+    _executors: ClassVar[Dict[Type[Any], Executor]] = {}
+    _cacheable: ClassVar[Set[Type[Any]]] = set()
+    # import paths of the names registered with `register_lazy`, until they are imported
+    _pending: ClassVar[Dict[Type["Registrable"], Dict[str, str]]] = defaultdict(dict)
+    # objects imported for names of each registry, or the failures to import them
+    _resolved: ClassVar[Dict[Type["Registrable"], Dict[str, Any]]] = defaultdict(dict)
 
     @classmethod
     def register(
@@ -28,7 +49,16 @@ class Registrable:
         name: str,
         constructor: Optional[str] = None,
         exist_ok: bool = False,
+        executor: Optional[Executor] = None,
+        cacheable: bool = False,
     ) -> Callable[[Type[T]], Type[T]]:
+        """Register a subclass with the given name.
+
+        With `executor="process"`, a builder given a process pool constructs the subclass
+        in a worker process when it is configured as a keyword argument.
+        With `cacheable=True`, a builder given an object cache or a disk cache returns the
+        cached object for identical configs of the subclass.
+        """
         registry = Registrable._registry[cls]
 
         def decorator(subclass: Type[T]) -> Type[T]:
@@ -41,11 +71,79 @@ class Registrable:
                 )
 
             registry[name] = (subclass, constructor)
+            Registrable._pending[cls].pop(name, None)
+            if executor is not None:
+                Registrable._executors[subclass] = executor
+            if cacheable:
+                Registrable._cacheable.add(subclass)
 
             return subclass
 
         return decorator
 
+    @classmethod
+    def register_lazy(cls, manifest: Mapping[str, str], exist_ok: bool = False) -> None:
+        """Register names whose classes are imported when the names are first looked up.
+
+        `manifest` maps names to import paths of the form `module:attr` or `module.attr`.
+        The module is imported by the first lookup of the name, even if importing is not
+        allowed, and a class the module registers with the name itself (e.g. with the
+        `register` decorator) takes precedence over the attribute.
+        """
+        registry = Registrable._registry[cls]
+        pending = Registrable._pending[cls]
+        for name, target in manifest.items():
+            if name in registry or name in pending:
+                if not exist_ok:
+                    raise ValueError(f"type name conflict: {name}")
+                registry.pop(name, None)
+            pending[name] = target
+
+    @classmethod
+    def register_entry_points(cls, group: str, exist_ok: bool = False) -> None:
+        """Register the entry points of a group with `register_lazy` without loading them.
+
+        The names of the entry points are the registered names, and their values
+        are the import paths.
+        """
+        cls.register_lazy({entry_point.name: entry_point.value for entry_point in entry_points(group=group)}, exist_ok)
+
+    @classmethod
+    def _load_pending(cls, name: Optional[str] = None) -> None:
+        """Import the classes of a lazily registered name, or of all of them if `name` is not given."""
+        registry = Registrable._registry[cls]
+        pending = Registrable._pending[cls]
+        for pending_name in [name] if name is not None else list(pending):
+            target = pending.get(pending_name)
+            if target is None:
+                continue
+            resolution = cls._import_name(target)
+            if isinstance(resolution, _ImportFailure):
+                raise ConfigurationError(
+                    f"{resolution.message}, registered as {pending_name} for {cls.__name__}"
+                ) from resolution.cause
+            if pending_name not in registry:
+                registry[pending_name] = (resolution, None)
+            pending.pop(pending_name, None)
+
+    @staticmethod
+    def executor_of(constructor: Any) -> Optional[Executor]:
+        """Return the executor registered for the class of a constructor."""
+        owner = getattr(constructor, "__self__", constructor)
+        try:
+            return Registrable._executors.get(owner)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def is_cacheable(constructor: Any) -> bool:
+        """Return whether the class of a constructor is registered as cacheable."""
+        owner = getattr(constructor, "__self__", constructor)
+        try:
+            return owner in Registrable._cacheable
+        except TypeError:
+            return False
+
     @classmethod
     def by_name(cls, name: str, allow_to_import: bool = True) -> Union[Type[T], Callable[..., T]]:
         subclass, constructor = cls.resolve_class_name(name, allow_to_import)
@@ -57,33 +155,67 @@ class Registrable:
 
     @classmethod
     def resolve_class_name(cls, name: str, allow_to_import: bool = True) -> Tuple[Type[Any], Optional[str]]:
+        """Return the class registered with a name and the name of its constructor.
+
+        Names registered with `register_lazy` are imported on their first lookup. If
+        importing is allowed, names of the form `module.attr` or `module:attr` that are
+        not registered are imported. Imported objects and import failures are cached for
+        each registry, see `clear_resolution_cache`.
+        """
         registry = Registrable._registry[cls]
 
         if name in registry:
             subclass, constructor = registry[name]
             return subclass, constructor
 
+        if name in Registrable._pending[cls]:
+            cls._load_pending(name)
+            subclass, constructor = registry[name]
+            return subclass, constructor
+
         if allow_to_import and (("." in name) or (":" in name)):
-            if ":" in name:
-                modulename, subname = name.split(":", 1)
+            resolved = Registrable._resolved[cls]
+            if name in resolved:
+                resolution = resolved[name]
             else:
-                modulename, subname = name.rsplit(".", 1)
-
-            try:
-                module = importlib.import_module(modulename)
-            except ModuleNotFoundError as e:
-                raise ConfigurationError(f"module {modulename} not found ({name})") from e
-
-            try:
-                while "." in subname:
-                    parentname, subname = subname.split(".", 1)
-                    module = getattr(module, parentname)
-                subclass = getattr(module, subname)
-                constructor = None
-                return subclass, constructor
-            except AttributeError as e:
-                raise ConfigurationError(
-                    f"attribute {subname} not found in {modulename} ({name})"  # noqa: E713
-                ) from e
+                resolution = resolved[name] = cls._import_name(name)
+            if isinstance(resolution, _ImportFailure):
+                raise ConfigurationError(resolution.message) from resolution.cause
+            return resolution, None
 
         raise ConfigurationError(f"{name} is not a registered name for {cls.__name__}. ")
+
+    @classmethod
+    def clear_resolution_cache(cls) -> None:
+        """Forget the objects imported for names of this registry and the failures to import them.
+
+        Called on `Registrable`, the caches of all registries are cleared, e.g. after
+        modules are installed or changed.
+        """
+        if cls is Registrable:
+            Registrable._resolved.clear()
+        else:
+            Registrable._resolved.pop(cls, None)
+
+    @staticmethod
+    def _import_name(name: str) -> Any:
+        if ":" in name:
+            modulename, subname = name.split(":", 1)
+        else:
+            modulename, subname = name.rsplit(".", 1)
+
+        try:
+            module = importlib.import_module(modulename)
+        except ModuleNotFoundError as e:
+            return _ImportFailure(f"module {modulename} not found ({name})", e)
+
+        try:
+            while "." in subname:
+                parentname, subname = subname.split(".", 1)
+                module = getattr(module, parentname)
+            return getattr(module, subname)
+        except AttributeError as e:
+            return _ImportFailure(
+                f"attribute {subname} not found in {modulename} ({name})",  # noqa: E713
+                e,
+            )
@@ -0,0 +1,97 @@
+import dataclasses
+import inspect
+import types
+import typing
+import weakref
+from typing import Any, FrozenSet, Iterable, Literal, Mapping, Tuple
+
+from colt.utils import find_typevars, get_constructor_type_hints, is_defined_in, is_typeddict
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstructorSignature:
+    """Resolved type hints and parameters of a constructor."""
+
+    type_hints: Mapping[str, Any]
+    annotated_arguments: FrozenSet[str]
+    literal_arguments: Mapping[str, Tuple[Any, ...]]
+    parameter_kinds: Mapping[str, inspect._ParameterKind]
+    defaults: Mapping[str, Any]
+    keyword_names: FrozenSet[str]
+    accepts_var_keyword: bool
+    # whether any type hint contains a type variable, so that arguments depend on each other
+    generic: bool
+
+    @classmethod
+    def from_constructor(cls, constructor: Any) -> "ConstructorSignature":
+        type_hints = get_constructor_type_hints(constructor)
+
+        annotated_arguments = frozenset(type_hints)
+        if isinstance(constructor, type) and is_typeddict(constructor):
+            # TypedDict fields are not arguments of `__init__`
+            annotated_arguments = frozenset(get_constructor_type_hints(constructor.__init__))
+
+        try:
+            parameters = inspect.signature(constructor).parameters
+        except (TypeError, ValueError):
+            parameters = typing.cast(Mapping[str, inspect.Parameter], {})
+
+        return cls(
+            type_hints=type_hints,
+            annotated_arguments=annotated_arguments,
+            literal_arguments={
+                name: typing.get_args(hint) for name, hint in type_hints.items() if typing.get_origin(hint) is Literal
+            },
+            parameter_kinds={name: param.kind for name, param in parameters.items()},
+            defaults={
+                name: param.default
+                for name, param in parameters.items()
+                if param.default is not inspect.Parameter.empty
+            },
+            keyword_names=frozenset(
+                name
+                for name, param in parameters.items()
+                if param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+            ),
+            accepts_var_keyword=any(param.kind == inspect.Parameter.VAR_KEYWORD for param in parameters.values()),
+            generic=any(find_typevars(hint) for hint in type_hints.values()),
+        )
+
+
+class SignatureCache:
+    """Cache of constructor signatures weakly keyed on the constructor.
+
+    Bound methods (e.g. registered classmethod constructors) are keyed on their
+    underlying function since a new method object is created on every lookup.
+    Constructors that cannot be weakly referenced are resolved on every access.
+    """
+
+    def __init__(self) -> None:
+        self._signatures: "weakref.WeakKeyDictionary[Any, ConstructorSignature]" = weakref.WeakKeyDictionary()
+        self._method_signatures: "weakref.WeakKeyDictionary[Any, ConstructorSignature]" = weakref.WeakKeyDictionary()
+
+    def __getitem__(self, constructor: Any) -> ConstructorSignature:
+        if isinstance(constructor, types.MethodType):
+            store, key = self._method_signatures, constructor.__func__
+        else:
+            store, key = self._signatures, constructor
+        try:
+            return store[key]
+        except KeyError:
+            signature = store[key] = ConstructorSignature.from_constructor(constructor)
+            return signature
+        except TypeError:
+            return ConstructorSignature.from_constructor(constructor)
+
+    def __len__(self) -> int:
+        return len(self._signatures) + len(self._method_signatures)
+
+    def invalidate(self, modules: Iterable[str] = ()) -> None:
+        """Drop cached signatures of constructors defined in the given modules (all if empty)."""
+        modules = tuple(modules)
+        for store in (self._signatures, self._method_signatures):
+            if not modules:
+                store.clear()
+                continue
+            for key in [key for key in store.keys() if is_defined_in(key, modules)]:
+                del store[key]
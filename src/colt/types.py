@@ -1,3 +1,8 @@
-from typing import Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 ParamPath = Tuple[Union[int, str], ...]
+
+# Parent-pointer form of `ParamPath` used while building: `None` is the root and
+# `(parent, key)` appends `key` to `parent`. `(parent, index, None)` stands for the
+# `index`-th key of a mapping and is rendered as `[key:{index}]` on materialization.
+LinkedPath = Optional[Tuple[Any, ...]]
@@ -18,6 +18,7 @@ from typing import (
     NewType,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -27,7 +28,7 @@ from typing import (
 )
 
 from colt._compat import GenericAlias, NoneType, UnionType
-from colt.types import ParamPath
+from colt.types import LinkedPath, ParamPath
 
 _NewTypeT = TypeVar("_NewTypeT", bound=NewType)  # pyright: ignore[reportGeneralTypeIssues]
 
@@ -67,18 +68,39 @@ def get_path_name(path: ParamPath) -> str:
     return ".".join(str(x) for x in path)
 
 
+def to_linked_path(path: ParamPath) -> LinkedPath:
+    linked: LinkedPath = None
+    for key in path:
+        linked = (linked, key)
+    return linked
+
+
+def to_param_path(path: LinkedPath) -> ParamPath:
+    keys: List[Union[int, str]] = []
+    while path is not None:
+        if len(path) == 3:
+            keys.append(f"[key:{path[1]}]")
+        else:
+            keys.append(path[1])
+        path = path[0]
+    keys.reverse()
+    return tuple(keys)
+
+
+def _split_field(field: Union[int, str, Sequence[Union[int, str]]]) -> Sequence[Union[int, str]]:
+    if isinstance(field, str):
+        return field.split(".")
+    if isinstance(field, int):
+        return (field,)
+    return field
+
+
 def update_field(
     obj: Union[Dict[Union[int, str], Any], List[Any]],
     field: Union[int, str, Sequence[Union[int, str]]],
     value: Any,
 ) -> None:
-    path: Sequence[Union[int, str]]
-    if isinstance(field, str):
-        path = field.split(".")
-    elif isinstance(field, int):
-        path = (field,)
-    else:
-        path = field
+    path = _split_field(field)
     if len(path) == 1:
         target_field = path[0]
         if isinstance(obj, dict):
@@ -102,6 +124,61 @@ def update_field(
             raise ValueError("obj must be dict or list")
 
 
+def get_field_path(obj: Any, field: Union[int, str, Sequence[Union[int, str]]]) -> ParamPath:
+    """Path of an existing field given in the syntax of `update_field`.
+
+    Indices of lists are given as ints, and the path of an item appended with `"+"`
+    is the path of its list.
+    """
+    path: List[Union[int, str]] = []
+    for key in _split_field(field):
+        if isinstance(obj, list):
+            if key == "+":
+                break
+            index = int(key)
+            if index < 0:
+                index += len(obj)
+            path.append(index)
+            obj = obj[index]
+        else:
+            path.append(key)
+            obj = obj[key]
+    return tuple(path)
+
+
+def override_fields(
+    obj: Any,
+    overrides: Iterable[Tuple[Union[int, str, Sequence[Union[int, str]]], Any]],
+) -> Any:
+    """Return `obj` with fields updated like `update_field`, leaving `obj` unchanged.
+
+    Only the dicts and lists on the paths of the updated fields are copied (each at
+    most once), so all other subtrees are shared with `obj`.
+    """
+    copied: Set[int] = set()
+    for field, value in overrides:
+        obj = _override_field(obj, _split_field(field), value, copied)
+    return obj
+
+
+def _override_field(obj: Any, path: Sequence[Union[int, str]], value: Any, copied: Set[int]) -> Any:
+    if id(obj) not in copied:
+        if isinstance(obj, dict):
+            obj = dict(obj)
+        elif isinstance(obj, list):
+            obj = list(obj)
+        else:
+            raise ValueError("obj must be dict or list")
+        copied.add(id(obj))
+    target_field = path[0]
+    if isinstance(obj, list) and target_field == "+" and len(path) == 1:
+        obj.append(value)
+        return obj
+    key: Any = int(target_field) if isinstance(obj, list) else target_field
+    obj[key] = value if len(path) == 1 else _override_field(obj[key], path[1:], value, copied)
+    return obj
+
+
 def remove_optional(annotation: Any) -> Any:
     origin = typing.get_origin(annotation)
     args = typing.get_args(annotation)
@@ -336,6 +413,23 @@ def find_typevars(annotation: Any) -> List[TypeVar]:
     return output
 
 
+def find_classes(annotation: Any) -> List[type]:
+    """Classes referred to by an annotation, including its origin and type arguments."""
+    if isinstance(annotation, (list, tuple)):
+        # parameters of `Callable[[...], ...]`
+        return [cls for arg in annotation for cls in find_classes(arg)]
+    args = typing.get_args(annotation)
+    if not args:
+        return [annotation] if isinstance(annotation, type) else []
+    output: List[type] = []
+    origin = typing.get_origin(annotation)
+    if isinstance(origin, type):
+        output.append(origin)
+    for arg in args:
+        output.extend(find_classes(arg))
+    return output
+
+
 def get_typevar_map(annotation: Any) -> Dict[TypeVar, Any]:
     origin = reveal_origin(annotation)
     if origin is None:
@@ -429,6 +523,39 @@ def get_new_type_constructor(type_: _NewTypeT) -> Callable[..., _NewTypeT]:
     return _constructor
 
 
+def get_constructor_type_hints(constructor: Any) -> Dict[str, Any]:
+    if isinstance(constructor, type):
+        try:
+            if is_typeddict(constructor):
+                return typing.get_type_hints(constructor)
+            return typing.get_type_hints(getattr(constructor, "__init__"))  # noqa: B009
+        except NameError:
+            return constructor.__init__.__annotations__  # type: ignore[misc]
+    try:
+        return typing.get_type_hints(constructor)
+    except NameError:
+        return constructor.__annotations__
+
+
+def is_defined_in(obj: Any, modules: Iterable[str]) -> bool:
+    name = getattr(obj, "__module__", None)
+    if not isinstance(name, str):
+        return False
+    return any(name == module or name.startswith(module + ".") for module in modules)
+
+
+def is_global(obj: Any) -> bool:
+    """Whether the object can be reached by its qualified name from an imported module."""
+    module = sys.modules.get(getattr(obj, "__module__", None) or "")
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or not isinstance(qualname, str):
+        return False
+    target: Any = module
+    for name in qualname.split("."):
+        target = getattr(target, name, None)
+    return target is obj
+
+
 def safe_get_type_hints(obj: Any) -> Dict[str, Any]:
     try:
         return typing.get_type_hints(obj)
@@ -0,0 +1,75 @@
+import dataclasses
+from typing import Iterable, List, NamedTuple, Set
+
+from colt.error import ConfigurationError
+from colt.types import LinkedPath, ParamPath
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationIssue:
+    """A configuration error found at `path`."""
+
+    path: ParamPath
+    error: ConfigurationError
+
+    @property
+    def message(self) -> str:
+        return str(self.error)
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    """Configuration errors found by `ColtBuilder.validate`, in the order the config is walked."""
+
+    issues: List[ValidationIssue] = dataclasses.field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+
+class LazyValidationInfo(NamedTuple):
+    """Counts of the validations of `Lazy` configs by a builder.
+
+    `full` and `scoped` count the dry runs of whole configs and of updated fields,
+    `deferred` counts the validations postponed until construction, and `skipped`
+    counts the subtrees left out by scoped dry runs.
+    """
+
+    full: int
+    scoped: int
+    deferred: int
+    skipped: int
+
+
+class ValidationScope:
+    """Paths that a dry run checks after fields of a config are updated.
+
+    The subtrees at the updated paths are checked as a whole, and their ancestors
+    are checked without their other children, which are left out of the dry run.
+    """
+
+    def __init__(self, roots: Iterable[LinkedPath]) -> None:
+        self.roots: Set[LinkedPath] = set(roots)
+        self.ancestors: Set[LinkedPath] = set()
+        for root in self.roots:
+            path = root
+            while path is not None:
+                path = path[0]
+                self.ancestors.add(path)
+        # ancestors within an updated subtree are checked as a whole
+        for path in list(self.ancestors):
+            parent = path
+            while parent is not None:
+                if parent in self.roots:
+                    self.ancestors.discard(path)
+                    break
+                parent = parent[0]
+        self.skipped = 0
+
+    def excludes(self, path: LinkedPath) -> bool:
+        """Whether the subtree at `path` is left out, counting the subtrees left out."""
+        if path is None or path[0] not in self.ancestors or path in self.ancestors or path in self.roots:
+            return False
+        self.skipped += 1
+        return True
@@ -0,0 +1,19 @@
+import pytest
+
+from colt import _constants
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--engine",
+        choices=("recursive", "stack"),
+        default=_constants.DEFAULT_ENGINE,
+        help="default build engine of ColtBuilder",
+    )
+
+
+@pytest.fixture(autouse=True)
+def engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    engine = str(request.config.getoption("--engine"))
+    monkeypatch.setattr(_constants, "DEFAULT_ENGINE", engine)
+    return engine
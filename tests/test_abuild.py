@@ -0,0 +1,202 @@
+import asyncio
+import dataclasses
+import time
+from typing import Any, List, Union
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ConfigurationError, Registrable
+
+
+def test_abuild_awaits_async_factories() -> None:
+    class Pool(Registrable):
+        def __init__(self, url: str, opened: bool) -> None:
+            self.url = url
+            self.opened = opened
+
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            await asyncio.sleep(0)
+            return cls(url, opened=True)
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    @dataclasses.dataclass
+    class Service:
+        primary: Pool
+        replica: Pool
+        name: str = "service"
+
+    config = {"primary": {"@type": "pool", "url": "a"}, "replica": {"@type": "pool", "url": "b"}, "name": "db"}
+    service = asyncio.run(colt.abuild(config, Service))
+
+    assert isinstance(service.primary, Pool)
+    assert service.primary.url == "a"
+    assert service.primary.opened
+    assert service.replica.url == "b"
+    assert service.name == "db"
+
+
+def test_abuild_builds_arguments_concurrently() -> None:
+    class Pool(Registrable):
+        def __init__(self, url: str) -> None:
+            self.url = url
+
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            await asyncio.sleep(0.2)
+            return cls(url)
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    @dataclasses.dataclass
+    class Service:
+        primary: Pool
+        replica: Pool
+
+    config = {"primary": {"@type": "pool", "url": "a"}, "replica": {"@type": "pool", "url": "b"}}
+    start = time.perf_counter()
+    service = asyncio.run(ColtBuilder().abuild(config, Service))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.35
+    assert [service.primary.url, service.replica.url] == ["a", "b"]
+
+
+def test_abuild_builds_sequence_items_concurrently() -> None:
+    class Pool(Registrable):
+        def __init__(self, url: str) -> None:
+            self.url = url
+
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            await asyncio.sleep(0.2)
+            return cls(url)
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    @dataclasses.dataclass
+    class Cluster:
+        pools: List[Pool]
+
+    config = {"pools": [{"@type": "pool", "url": str(i)} for i in range(4)]}
+    start = time.perf_counter()
+    cluster = asyncio.run(colt.abuild(config, Cluster))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.35
+    assert [pool.url for pool in cluster.pools] == ["0", "1", "2", "3"]
+
+
+def test_abuild_reports_failed_constructors_with_path() -> None:
+    class Pool(Registrable):
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            await asyncio.sleep(0)
+            if not url:
+                raise ValueError("url is empty")
+            return cls()
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    @dataclasses.dataclass
+    class Service:
+        primary: Pool
+        replica: Pool
+
+    config = {"primary": {"@type": "pool", "url": "a"}, "replica": {"@type": "pool", "url": ""}}
+    with pytest.raises(ConfigurationError) as excinfo:
+        asyncio.run(colt.abuild(config, Service))
+
+    assert "replica" in str(excinfo.value)
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+def test_abuild_raises_first_error_in_config_order() -> None:
+    class Pool(Registrable):
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            await asyncio.sleep(0.1)
+            raise ValueError("unreachable")
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    @dataclasses.dataclass
+    class Service:
+        primary: Pool
+        replica: Pool
+
+    config = {"primary": {"@type": "pool", "url": "a"}, "replica": {"@type": "pool", "url": 1}}
+    with pytest.raises(ConfigurationError) as excinfo:
+        asyncio.run(colt.abuild(config, Service))
+
+    assert "primary" in str(excinfo.value)
+
+
+def test_abuild_tries_union_members_after_failed_await() -> None:
+    class Pool(Registrable):
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            raise ValueError("url is empty")
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    result = asyncio.run(colt.abuild({"@type": "pool", "url": ""}, Union[Pool, dict]))  # type: ignore[arg-type]
+
+    assert result == {"@type": "pool", "url": ""}
+
+
+def test_abuild_builds_synchronous_configs() -> None:
+    @dataclasses.dataclass
+    class Connection:
+        url: str
+        opened: bool
+
+    @dataclasses.dataclass
+    class Plain:
+        values: List[int]
+        connection: Connection
+
+    config = {"values": [1, 2], "connection": {"url": "x", "opened": False}}
+    plain = asyncio.run(colt.abuild(config, Plain))
+
+    assert plain.values == [1, 2]
+    assert plain.connection == Connection("x", False)
+
+
+def test_build_returns_awaitable_of_async_factory() -> None:
+    class Pool(Registrable):
+        def __init__(self, url: str) -> None:
+            self.url = url
+
+        @classmethod
+        async def open(cls, url: str) -> "Pool":
+            return cls(url)
+
+    Pool.register("pool", constructor="open")(Pool)
+
+    coroutine = colt.build({"@type": "pool", "url": "a"}, Pool)
+
+    assert asyncio.iscoroutine(coroutine)
+    assert asyncio.run(coroutine).url == "a"
+
+
+def test_abuild_allows_synchronous_builds_in_constructors() -> None:
+    @dataclasses.dataclass
+    class Connection:
+        url: str
+
+    @dataclasses.dataclass
+    class Service:
+        primary: Connection
+        replica: Connection
+
+    class Wrapper:
+        def __init__(self, inner: Any) -> None:
+            self.service = colt.build(inner, Service)
+
+    config = {"inner": {"primary": {"url": "a"}, "replica": {"url": "b"}}}
+    wrapper = asyncio.run(colt.abuild(config, Wrapper))
+
+    assert wrapper.service.replica.url == "b"
@@ -0,0 +1,54 @@
+import dataclasses
+from typing import Iterator, List
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ConfigurationError
+
+
+@dataclasses.dataclass
+class Record:
+    name: str
+    values: List[int]
+
+
+def test_build_many_returns_list() -> None:
+    configs = [{"name": f"r{i}", "values": [i, i + 1]} for i in range(3)]
+    records = colt.build_many(configs, Record)
+    assert records == [Record(f"r{i}", [i, i + 1]) for i in range(3)]
+
+
+def test_build_many_accepts_generator() -> None:
+    configs = ({"name": str(i), "values": []} for i in range(5))
+    records = colt.build_many(configs, Record)
+    assert [record.name for record in records] == ["0", "1", "2", "3", "4"]
+
+
+def test_build_many_lazy_builds_on_iteration() -> None:
+    consumed: List[int] = []
+
+    def generate() -> Iterator[dict]:
+        for i in range(3):
+            consumed.append(i)
+            yield {"name": str(i), "values": [i]}
+
+    results = colt.build_many(generate(), Record, lazy=True)
+    assert consumed == []
+    assert next(results) == Record("0", [0])
+    assert consumed == [0]
+    assert list(results) == [Record("1", [1]), Record("2", [2])]
+
+
+def test_build_many_shares_plans_across_batch() -> None:
+    builder = ColtBuilder()
+    builder.build_many([{"name": "a", "values": [1]}, {"name": "b", "values": [2]}], Record)
+    assert Record in builder._plans
+    plan = builder._plans[Record]
+    builder.build_many([{"name": "c", "values": []}], Record)
+    assert builder._plans[Record] is plan
+
+
+def test_build_many_reports_failing_config() -> None:
+    with pytest.raises(ConfigurationError):
+        colt.build_many([{"name": "a", "values": [1]}, {"name": "b", "values": ["x"]}], Record)
@@ -0,0 +1,69 @@
+import dataclasses
+from typing import Any, Dict, List, Optional
+
+import colt
+from colt import BuildPlan, ColtBuilder
+
+
+@dataclasses.dataclass
+class Item:
+    name: str
+    score: float
+
+
+@dataclasses.dataclass
+class Container:
+    items: List[Item]
+    labels: Dict[str, int]
+    parent: Optional["Container"] = None
+
+
+def test_compile_returns_cached_plan() -> None:
+    builder = ColtBuilder()
+
+    plan = builder.compile(Container)
+
+    assert isinstance(plan, BuildPlan)
+    assert builder.compile(Container) is plan
+    assert plan.constructor is Container
+
+
+def test_compile_records_dispatch_decisions() -> None:
+    builder = ColtBuilder()
+
+    assert builder.compile(List[int]).handler is ColtBuilder._sequence_steps
+    assert builder.compile(Dict[str, int]).handler is ColtBuilder._mapping_steps
+    assert builder.compile(Optional[int]).handler is ColtBuilder._union_steps
+    assert builder.compile(Item).handler is ColtBuilder._object_steps
+    assert builder.compile(Item).stepwise
+    assert builder.compile(float).is_numeric
+    assert builder.compile(Any).annotation is None
+
+
+def test_build_with_compiled_plan_gives_same_result() -> None:
+    config = {
+        "items": [{"name": "a", "score": 1}, {"name": "b", "score": 2.5}],
+        "labels": {"x": 1},
+        "parent": {"items": [], "labels": {}},
+    }
+    builder = ColtBuilder()
+    builder.compile(Container)
+
+    first = builder(config, Container)
+    second = builder(config, Container)
+
+    assert first == second == colt.build(config, Container)
+    assert isinstance(first.parent, Container)
+    assert first.items[0].score == 1.0
+
+
+def test_compile_does_not_cache_unhashable_annotation() -> None:
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+    builder = ColtBuilder()
+
+    plan = builder.compile(Unhashable())
+
+    assert isinstance(plan, BuildPlan)
+    assert builder.compile(Unhashable()) is not plan
@@ -1,6 +1,7 @@
 import dataclasses
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
+import colt
 from colt import ColtBuilder, ColtCallback, ColtContext, SkipCallback
 from colt.types import ParamPath
 
@@ -62,3 +63,104 @@ def test_callback_on_build() -> None:
     assert isinstance(foo, Foo)
     assert foo.x == 2
     assert foo.y == "foo"
+
+
+class RecordBuild(ColtCallback):
+    def __init__(self) -> None:
+        self.calls: List[Tuple[ParamPath, Any]] = []
+
+    def on_build(
+        self,
+        path: "ParamPath",
+        config: Any,
+        builder: "ColtBuilder",
+        context: "ColtContext",
+        annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
+    ) -> Any:
+        self.calls.append((path, annotation))
+        return config
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: float
+    labels: List[str]
+
+
+def test_callback_declares_implemented_hooks() -> None:
+    class StartOnly(ColtCallback):
+        def on_start(
+            self,
+            config: Any,
+            builder: "ColtBuilder",
+            context: "ColtContext",
+            annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
+        ) -> Any:
+            return config
+
+    assert StartOnly().implements("on_start")
+    assert not StartOnly().implements("on_build")
+    assert RecordBuild().implements("on_build")
+    assert not RecordBuild().implements("on_start")
+
+    class Declared(RecordBuild):
+        hooks = ("on_start",)
+
+    callback = Declared()
+    ColtBuilder(callback=callback)({"x": 1, "y": 2.0, "labels": []}, Point)
+    assert callback.calls == []
+
+
+def test_callback_filters_annotations_and_paths() -> None:
+    config = {"x": 1, "y": 2.0, "labels": ["a", "b"]}
+
+    class IntsOnly(RecordBuild):
+        annotations = {int}
+
+    callback = IntsOnly()
+    ColtBuilder(callback=callback)(config, Point)
+    assert callback.calls == [(("x",), int)]
+
+    class RootOnly(RecordBuild):
+        paths = [()]
+
+    callback = RootOnly()
+    ColtBuilder(callback=callback)(config, Point)
+    assert callback.calls == [((), Point)]
+
+
+def test_multi_callback_filters_each_callback() -> None:
+    class IntsOnly(RecordBuild):
+        annotations = {int}
+
+    class Labels(RecordBuild):
+        paths = [("labels", 0), ("labels", 1)]
+
+    ints, labels, skipping = IntsOnly(), Labels(), ColtCallback()
+    builder = ColtBuilder(callback=[ints, labels, skipping])
+    point = builder({"x": 1, "y": 2.0, "labels": ["a", "b"]}, Point)
+
+    assert point == Point(1, 2.0, ["a", "b"])
+    assert ints.calls == [(("x",), int)]
+    assert labels.calls == [(("labels", 0), str), (("labels", 1), str)]
+
+
+def test_skip_callback_with_declared_filters() -> None:
+    class Increment(ColtCallback):
+        annotations = {int}
+
+        def on_build(
+            self,
+            path: "ParamPath",
+            config: Any,
+            builder: "ColtBuilder",
+            context: "ColtContext",
+            annotation: Optional[Union[Type[T], Callable[..., T]]] = None,
+        ) -> Any:
+            if path == ("x",):
+                raise SkipCallback
+            return config + 1
+
+    values = colt.build({"x": 1, "y": 2}, Dict[str, int], callback=Increment())
+    assert values == {"x": 1, "y": 3}
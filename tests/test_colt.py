@@ -656,3 +656,19 @@ def test_config_with_schema_key() -> None:
 
     assert isinstance(obj, Foo)
     assert obj.x == "hello"
+
+
+def test_build_error_reports_materialized_path() -> None:
+    @dataclasses.dataclass
+    class Inner:
+        values: Dict[str, int]
+
+    @dataclasses.dataclass
+    class Outer:
+        inners: List[Inner]
+
+    with pytest.raises(colt.ConfigurationError, match=r"\[inners\.1\.values\.b\] Type mismatch"):
+        colt.build({"inners": [{"values": {"a": 1}}, {"values": {"b": "x"}}]}, Outer)
+
+    with pytest.raises(colt.ConfigurationError, match=r"\[values\.\[key:0\]\] Type mismatch"):
+        colt.build({"values": {1: 1}}, Inner)
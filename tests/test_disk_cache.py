@@ -0,0 +1,121 @@
+import threading
+from pathlib import Path
+from typing import List
+
+from colt import CacheInfo, ColtBuilder, DiskCache, ObjectCache, Registrable
+from colt.cache import get_config_digest
+
+
+# defined at module level so that its instances can be pickled to the cache
+class Scaler(Registrable):
+    def __init__(self, columns: List[str], scale: float = 1.0) -> None:
+        self.columns = columns
+        self.scale = scale
+        self.payload = "x" * 1000
+
+
+Scaler.register("scaler", cacheable=True)(Scaler)
+
+
+def test_disk_cache_survives_new_builders(tmp_path: Path) -> None:
+    config = {"@type": "scaler", "columns": ["age", "fare"]}
+    first = ColtBuilder(disk_cache=DiskCache(tmp_path))(config, Scaler)
+    cache = DiskCache(tmp_path)
+    second = ColtBuilder(disk_cache=cache)(config, Scaler)
+
+    assert isinstance(second, Scaler)
+    assert second is not first
+    assert second.columns == first.columns == ["age", "fare"]
+    assert cache.info() == CacheInfo(hits=1, misses=0, evictions=0, size=1)
+
+
+def test_disk_cache_keys_on_config_and_version(tmp_path: Path) -> None:
+    ColtBuilder(disk_cache=DiskCache(tmp_path, version="1"))(
+        {"@type": "scaler", "columns": ["age"], "scale": 2.0}, Scaler
+    )
+
+    cache = DiskCache(tmp_path, version="1")
+    ColtBuilder(disk_cache=cache)({"scale": 2.0, "columns": ["age"], "@type": "scaler"}, Scaler)
+    assert (cache.info().hits, cache.info().misses) == (1, 0)
+
+    cache = DiskCache(tmp_path, version="1")
+    ColtBuilder(disk_cache=cache)({"@type": "scaler", "columns": ["age"], "scale": 3.0}, Scaler)
+    assert (cache.info().hits, cache.info().misses) == (0, 1)
+
+    cache = DiskCache(tmp_path, version="2")
+    ColtBuilder(disk_cache=cache)({"@type": "scaler", "columns": ["age"], "scale": 2.0}, Scaler)
+    assert (cache.info().hits, cache.info().misses) == (0, 1)
+
+
+def test_disk_cache_writes_entries_atomically(tmp_path: Path) -> None:
+    ColtBuilder(disk_cache=DiskCache(tmp_path))({"@type": "scaler", "columns": ["age"]}, Scaler)
+
+    assert [path.suffix for path in tmp_path.iterdir()] == [".pkl"]
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=2500)
+    builder = ColtBuilder(disk_cache=cache)
+    for column in ("a", "b", "c"):
+        builder({"@type": "scaler", "columns": [column]}, Scaler)
+
+    info = cache.info()
+    assert info.evictions == 1 and info.size == 2
+    builder({"@type": "scaler", "columns": ["c"]}, Scaler)
+    assert (cache.info().hits, cache.info().misses) == (1, 3)
+    builder({"@type": "scaler", "columns": ["a"]}, Scaler)
+    assert (cache.info().hits, cache.info().misses) == (1, 4)
+
+
+def test_disk_cache_rebuilds_corrupted_entries(tmp_path: Path) -> None:
+    config = {"@type": "scaler", "columns": ["age"]}
+    ColtBuilder(disk_cache=DiskCache(tmp_path))(config, Scaler)
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"broken")
+    cache = DiskCache(tmp_path)
+    scaler = ColtBuilder(disk_cache=cache)(config, Scaler)
+
+    assert isinstance(scaler, Scaler)
+    assert (cache.info().hits, cache.info().misses) == (0, 1)
+
+
+def test_disk_cache_skips_unpicklable_objects(tmp_path: Path) -> None:
+    class Locked(Registrable):
+        def __init__(self, name: str) -> None:
+            self.name = name
+            self.lock = threading.Lock()
+
+    Locked.register("locked", cacheable=True)(Locked)
+
+    cache = DiskCache(tmp_path)
+    locked = ColtBuilder(disk_cache=cache)({"@type": "locked", "name": "a"}, Locked)
+
+    assert isinstance(locked, Locked)
+    assert cache.info().size == 0
+
+
+def test_disk_cache_fills_object_cache(tmp_path: Path) -> None:
+    config = {"@type": "scaler", "columns": ["age"]}
+    ColtBuilder(disk_cache=DiskCache(tmp_path))(config, Scaler)
+    cache = DiskCache(tmp_path)
+    builder = ColtBuilder(object_cache=ObjectCache(), disk_cache=cache)
+    first = builder(config, Scaler)
+    second = builder(config, Scaler)
+
+    assert second is first
+    assert (cache.info().hits, cache.info().misses) == (1, 0)
+
+
+def test_disk_cache_clear(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    ColtBuilder(disk_cache=cache)({"@type": "scaler", "columns": ["age"]}, Scaler)
+    cache.clear()
+
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, size=0)
+
+
+def test_config_digest_is_canonical() -> None:
+    assert get_config_digest({"a": 1, "b": [1, 2]}) == get_config_digest({"b": [1, 2], "a": 1})
+    assert get_config_digest({"a": 1}) != get_config_digest({"a": True})
+    assert get_config_digest({"a": [1]}) != get_config_digest({"a": (1,)})
+    assert get_config_digest({"a": object()}) is None
@@ -0,0 +1,83 @@
+import dataclasses
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+
+from colt import ColtBuilder, ConfigurationError
+
+DEPTH = 10_000
+
+
+@dataclasses.dataclass
+class Stage:
+    name: str
+    next: Optional["Stage"] = None
+
+
+@dataclasses.dataclass
+class Wrapper:
+    inner: Union["Wrapper", int]
+
+
+def chain_config(depth: int, leaf: Any = "stage") -> Dict[str, Any]:
+    config: Dict[str, Any] = {"name": leaf}
+    for i in range(depth - 1):
+        config = {"name": f"stage{i}", "next": config}
+    return config
+
+
+def test_default_engine(engine: str) -> None:
+    assert ColtBuilder().engine == engine
+
+
+def test_unknown_engine() -> None:
+    with pytest.raises(ValueError):
+        ColtBuilder(engine="unknown")  # type: ignore[arg-type]
+
+
+def test_stack_engine_builds_deeply_nested_config() -> None:
+    stage = ColtBuilder(engine="stack")(chain_config(DEPTH), Stage)
+
+    depth = 1
+    while stage.next is not None:
+        depth += 1
+        stage = stage.next
+    assert depth == DEPTH
+    assert stage.name == "stage"
+
+
+def test_stack_engine_builds_deeply_nested_union_trials() -> None:
+    config: Any = 1
+    for _ in range(DEPTH):
+        config = {"inner": config}
+
+    obj = ColtBuilder(engine="stack")(config, Wrapper)
+
+    for _ in range(DEPTH):
+        assert isinstance(obj, Wrapper)
+        obj = obj.inner
+    assert obj == 1
+
+
+def test_stack_engine_reports_path_of_deep_error() -> None:
+    with pytest.raises(ConfigurationError) as excinfo:
+        ColtBuilder(engine="stack")(chain_config(DEPTH, leaf=1), Stage)
+    assert str(excinfo.value).startswith("[" + ".".join(["next"] * (DEPTH - 1)) + ".name] Type mismatch")
+
+
+def test_recursive_engine_is_limited_by_recursion_limit() -> None:
+    with pytest.raises(RecursionError):
+        ColtBuilder(engine="recursive")(chain_config(DEPTH), Stage)
+
+
+@pytest.mark.parametrize(
+    "config, annotation",
+    [
+        ({"name": "a", "next": {"name": "b"}}, Stage),
+        ({"x": [1, {"y": (2, 3)}], "z": {"w": None}}, None),
+        ([{"name": "a"}, {"name": "b", "next": {"name": "c"}}], List[Stage]),
+        ({"a": {"inner": {"inner": 3}}}, Dict[str, Wrapper]),
+    ],
+)
+def test_engines_build_same_results(config: Any, annotation: Any) -> None:
+    assert ColtBuilder(engine="stack")(config, annotation) == ColtBuilder(engine="recursive")(config, annotation)
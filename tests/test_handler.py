@@ -0,0 +1,112 @@
+from typing import Any, Generator, Generic, List, Tuple, TypeVar
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ColtContext
+from colt.plan import BuildPlan
+from colt.types import LinkedPath
+
+T = TypeVar("T")
+
+
+class Repeated(Generic[T]):
+    def __init__(self, values: List[T]) -> None:
+        self.values = values
+
+
+@ColtBuilder.register_handler(Repeated)
+def build_repeated(
+    builder: ColtBuilder,
+    config: Any,
+    path: LinkedPath,
+    plan: BuildPlan,
+    *,
+    context: ColtContext,
+    raise_configuration_error: bool,
+    skip_construction: bool,
+) -> Any:
+    if not isinstance(config, dict) or "value" not in config:
+        return builder.build_default(
+            config,
+            path,
+            plan,
+            context=context,
+            raise_configuration_error=raise_configuration_error,
+            skip_construction=skip_construction,
+        )
+    value_cls = plan.args[0] if plan.args else None
+    value = builder.build_child(config["value"], path, "value", value_cls, context=context)
+    return Repeated([value] * config["times"])
+
+
+class Pair(Generic[T]):
+    def __init__(self, items: Tuple[T, T]) -> None:
+        self.items = items
+
+
+@ColtBuilder.register_handler(Pair)
+def build_pair(
+    builder: ColtBuilder,
+    config: Any,
+    path: LinkedPath,
+    plan: BuildPlan,
+    *,
+    context: ColtContext,
+    raise_configuration_error: bool,
+    skip_construction: bool,
+) -> Generator[Any, Any, Any]:
+    if not isinstance(config, list):
+        return (
+            yield from builder.default_steps(
+                config,
+                path,
+                plan,
+                context=context,
+                raise_configuration_error=raise_configuration_error,
+                skip_construction=skip_construction,
+            )
+        )
+    item_cls = plan.args[0] if plan.args else None
+    first = yield builder.child_request(config[0], path, 0, item_cls, skip_construction=skip_construction)
+    second = yield builder.child_request(config[1], path, 1, item_cls, skip_construction=skip_construction)
+    return Pair((first, second))
+
+
+def test_custom_handler_for_generic_type() -> None:
+    obj = colt.build({"value": 2, "times": 3}, Repeated[float])
+
+    assert isinstance(obj, Repeated)
+    assert obj.values == [2.0, 2.0, 2.0]
+    assert all(isinstance(value, float) for value in obj.values)
+
+
+def test_custom_handler_can_delegate_to_default_handler() -> None:
+    obj = colt.build({"values": [1, 2]}, Repeated[int])
+
+    assert isinstance(obj, Repeated)
+    assert obj.values == [1, 2]
+
+
+def test_generator_handler_builds_children_with_requests() -> None:
+    obj = colt.build([1, 2], Pair[float])
+
+    assert isinstance(obj, Pair)
+    assert obj.items == (1.0, 2.0)
+    assert all(isinstance(item, float) for item in obj.items)
+
+    with pytest.raises(colt.ConfigurationError) as excinfo:
+        colt.build([1, "x"], Pair[int])
+    assert "1" in str(excinfo.value)
+
+
+def test_generator_handler_can_delegate_to_default_handler() -> None:
+    obj = colt.build({"items": [1, 2]}, Pair[int])
+
+    assert isinstance(obj, Pair)
+    assert obj.items == (1, 2)
+
+
+def test_register_handler_conflict() -> None:
+    with pytest.raises(ValueError):
+        ColtBuilder.register_handler(list)(build_repeated)
@@ -1,4 +1,27 @@
+import importlib
+import sys
+import types
+from typing import Any, Iterator, List
+
+import pytest
+
 import colt
+from colt import ConfigurationError, DefaultRegistry, Registrable
+
+
+@pytest.fixture
+def imported(monkeypatch: pytest.MonkeyPatch) -> Iterator[List[str]]:
+    names: List[str] = []
+    import_module = importlib.import_module
+
+    def count_import(name: str, package: Any = None) -> Any:
+        names.append(name)
+        return import_module(name, package)
+
+    Registrable.clear_resolution_cache()
+    monkeypatch.setattr(importlib, "import_module", count_import)
+    yield names
+    Registrable.clear_resolution_cache()
 
 
 def test_colt_import() -> None:
@@ -7,3 +30,29 @@ def test_colt_import() -> None:
     obj = colt.build(config)
 
     assert obj.year == 2020
+
+
+def test_import_path_is_resolved_once(imported: List[str]) -> None:
+    for day in (1, 2):
+        obj = colt.build({"@type": "datetime:date", "year": 2020, "month": 1, "day": day})
+        assert obj.day == day
+
+    assert imported == ["datetime"]
+
+
+def test_import_failure_is_cached_until_cleared(imported: List[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    name = "colt_test_plugins.Plugin"
+    for _ in range(2):
+        with pytest.raises(ConfigurationError, match="module colt_test_plugins not found"):
+            DefaultRegistry.by_name(name)
+    assert imported == ["colt_test_plugins"]
+
+    module = types.ModuleType("colt_test_plugins")
+    module.Plugin = dict  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "colt_test_plugins", module)
+    with pytest.raises(ConfigurationError):
+        DefaultRegistry.by_name(name)
+
+    DefaultRegistry.clear_resolution_cache()
+    assert DefaultRegistry.by_name(name) is dict
+    assert imported == ["colt_test_plugins", "colt_test_plugins"]
@@ -1,4 +1,5 @@
 import dataclasses
+from typing import List
 
 import pytest
 
@@ -51,6 +52,27 @@ def test_lazy_update() -> None:
         bar.foo.update(name=123)
 
 
+def test_lazy_construct_with_overrides() -> None:
+    @dataclasses.dataclass
+    class Foo:
+        name: str
+        values: List[int]
+
+    @dataclasses.dataclass
+    class Bar:
+        foo: Lazy[Foo]
+
+    bar = colt.build({"foo": {"name": "foo", "values": [1, 2]}}, Bar)
+
+    foo = bar.foo.construct(name="bar")
+    assert foo == Foo(name="bar", values=[1, 2])
+
+    foo = bar.foo.construct({"values.+": 3})
+    assert foo == Foo(name="foo", values=[1, 2, 3])
+
+    assert bar.foo.config == {"name": "foo", "values": [1, 2]}
+
+
 def test_lazy_constructor() -> None:
     @dataclasses.dataclass
     class Foo:
@@ -0,0 +1,114 @@
+import dataclasses
+from typing import Any, List, Optional
+
+import pytest
+
+from colt import ColtBuilder, ConfigurationError, Lazy, Registrable
+
+
+def test_lazy_construct_many() -> None:
+    @dataclasses.dataclass
+    class Layer:
+        size: int
+
+    class Model(Registrable):
+        def __init__(self, layers: List[Layer], rate: float, seed: Optional[int] = None) -> None:
+            self.layers = layers
+            self.rate = rate
+            self.seed = seed
+
+    @Model.register("mlp")
+    class MLP(Model): ...
+
+    @dataclasses.dataclass
+    class Worker:
+        model: Lazy[Model]
+
+    config = {"model": {"@type": "mlp", "layers": [{"size": 8}, {"size": 4}], "rate": 1}}
+    worker = ColtBuilder()(config, Worker)
+
+    models = worker.model.construct_many([{"seed": 0}, {"seed": 1, "rate": 0.5}, {"layers.0.size": 2}])
+
+    assert all(isinstance(model, MLP) for model in models)
+    assert [(model.seed, model.rate) for model in models] == [(0, 1.0), (1, 0.5), (None, 1.0)]
+    assert isinstance(models[0].rate, float)
+    assert [layer.size for layer in models[2].layers] == [2, 4]
+    # nested objects are built for each instance
+    assert models[0].layers is not models[1].layers
+    assert models[0].layers[0] is not models[1].layers[0]
+
+
+def test_lazy_construct_resolves_constructor_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Model(Registrable):
+        def __init__(self, rate: float, seed: Optional[int] = None) -> None:
+            self.rate = rate
+            self.seed = seed
+
+    @Model.register("mlp")
+    class MLP(Model): ...
+
+    @Model.register("linear")
+    class Linear(Model): ...
+
+    @dataclasses.dataclass
+    class Worker:
+        model: Lazy[Model]
+
+    worker = ColtBuilder()({"model": {"@type": "mlp", "rate": 1}}, Worker)
+    worker.model.construct()
+
+    lookups: List[Any] = []
+    by_name = Model.by_name.__func__  # type: ignore[attr-defined]
+
+    def count_lookup(cls: Any, name: str, allow_to_import: bool = True) -> Any:
+        lookups.append(name)
+        return by_name(cls, name, allow_to_import)
+
+    monkeypatch.setattr(Model, "by_name", classmethod(count_lookup))
+    models = worker.model.construct_many([{"seed": i} for i in range(3)])
+    assert lookups == []
+    assert all(isinstance(model, MLP) for model in models)
+
+    # overriding the type builds the config as usual
+    model = worker.model.construct({"@type": "linear"})
+    assert lookups == ["linear"]
+    assert isinstance(model, Linear)
+
+
+def test_lazy_construct_checks_overrides() -> None:
+    class Model:
+        def __init__(self, rate: float) -> None:
+            self.rate = rate
+
+    @dataclasses.dataclass
+    class Worker:
+        model: Lazy[Model]
+
+    worker = ColtBuilder()({"model": {"rate": 1}}, Worker)
+    worker.model.construct()
+
+    with pytest.raises(ConfigurationError, match=r"\[model\.rate\]"):
+        worker.model.construct(rate="fast")
+    with pytest.raises(ConfigurationError, match=r"\[model\]"):
+        worker.model.construct(unknown=1)
+
+
+def test_lazy_update_after_construct() -> None:
+    class Model(Registrable):
+        def __init__(self, rate: float) -> None:
+            self.rate = rate
+
+    @Model.register("mlp")
+    class MLP(Model): ...
+
+    @dataclasses.dataclass
+    class Worker:
+        model: Lazy[Model]
+
+    worker = ColtBuilder()({"model": {"@type": "mlp", "rate": 1}}, Worker)
+    worker.model.construct()
+
+    worker.model.update(rate=0.25)
+    model = worker.model.construct()
+    assert isinstance(model, MLP)
+    assert model.rate == 0.25
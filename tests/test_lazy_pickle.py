@@ -0,0 +1,101 @@
+import dataclasses
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Tuple
+
+import pytest
+
+from colt import ColtBuilder, Lazy, LazyValidationInfo, Registrable
+
+
+class Model(Registrable):
+    pass
+
+
+@Model.register("pickle:mlp")
+class MLP(Model):
+    def __init__(self, sizes: List[int], seed: int = 0) -> None:
+        self.sizes = sizes
+        self.seed = seed
+
+
+@dataclasses.dataclass
+class Job:
+    model: Lazy[Model]
+    data: List[List[int]]
+
+
+@Model.register("pickle:ensemble")
+class Ensemble(Model):
+    def __init__(self, members: List[Model]) -> None:
+        self.members = members
+
+
+@dataclasses.dataclass
+class Shared:
+    ensemble: Lazy[Model]
+    model: Model
+
+
+def build_job(**settings: Any) -> Job:
+    config = {"model": {"@type": "pickle:mlp", "sizes": [8, 4]}, "data": [[i] * 10 for i in range(1000)]}
+    return ColtBuilder(typekey="@type", **settings)(config, Job)
+
+
+def construct_in_worker(lazy: Lazy[Model], seed: int) -> Tuple[int, List[int], int]:
+    model = lazy.construct(seed=seed)
+    assert isinstance(model, MLP)
+    return os.getpid(), model.sizes, model.seed
+
+
+def test_lazy_pickles_only_its_config() -> None:
+    job = build_job()
+    payload = pickle.dumps(job.model)
+
+    assert len(payload) < len(pickle.dumps(job.data)) // 10
+
+    lazy = pickle.loads(payload)
+    assert lazy.config == {"@type": "pickle:mlp", "sizes": [8, 4]}
+    assert lazy.path == ("model",)
+    assert lazy.builder.typekey == "@type"
+
+    model = lazy.construct(seed=1)
+    assert isinstance(model, MLP)
+    assert (model.sizes, model.seed) == ([8, 4], 1)
+    # the config was validated before pickling
+    assert lazy.builder.lazy_validation_info.full == 0
+
+
+def test_lazy_pickled_before_validation_is_validated_on_construction() -> None:
+    job = build_job(defer_lazy_validation=True)
+    lazy = pickle.loads(pickle.dumps(job.model))
+
+    info = lazy.builder.lazy_validation_info
+    lazy.construct()
+    assert lazy.builder.lazy_validation_info == LazyValidationInfo(
+        full=info.full + 1, scoped=info.scoped, deferred=info.deferred, skipped=info.skipped
+    )
+
+
+def test_lazy_with_references_is_not_pickled() -> None:
+    config = {
+        "ensemble": {"@type": "pickle:ensemble", "members": [{"@ref": "model"}]},
+        "model": {"@type": "pickle:mlp", "sizes": [1]},
+    }
+    shared = ColtBuilder()(config, Shared)
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(shared.ensemble)
+
+
+def test_lazy_is_constructed_in_worker_processes() -> None:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method is not available")
+    job = build_job()
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")) as executor:
+        results = list(executor.map(construct_in_worker, [job.model] * 3, range(3)))
+
+    assert all(pid != os.getpid() for pid, _, _ in results)
+    assert [(sizes, seed) for _, sizes, seed in results] == [([8, 4], 0), ([8, 4], 1), ([8, 4], 2)]
@@ -0,0 +1,120 @@
+import importlib
+import sys
+import textwrap
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import colt
+from colt import ConfigurationError, JsonSchemaGenerator, Registrable
+
+
+class Plugin(Registrable):
+    pass
+
+
+@pytest.fixture
+def plugins(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
+
+
+def write_module(directory: Path, name: str, source: str) -> None:
+    (directory / f"{name}.py").write_text(textwrap.dedent(source))
+
+
+def test_register_lazy_imports_module_on_first_lookup(plugins: Path) -> None:
+    write_module(plugins, "colt_lazy_plugin_base", "from colt import Registrable\n\nclass Base(Registrable): ...\n")
+    write_module(
+        plugins,
+        "colt_lazy_plugin_a",
+        """
+        from colt_lazy_plugin_base import Base as Plugin
+
+        @Plugin.register("lazy:self", constructor="create")
+        class SelfRegistered(Plugin):
+            def __init__(self, size: int) -> None:
+                self.size = size
+
+            @classmethod
+            def create(cls, size: int) -> "SelfRegistered":
+                return cls(size * 2)
+
+        class Attribute(Plugin):
+            def __init__(self, size: int) -> None:
+                self.size = size
+        """,
+    )
+    base: Any = importlib.import_module("colt_lazy_plugin_base").Base
+    base.register_lazy({"lazy:self": "colt_lazy_plugin_a:SelfRegistered", "lazy:attr": "colt_lazy_plugin_a.Attribute"})
+
+    assert "colt_lazy_plugin_a" not in sys.modules
+
+    obj: Any = colt.build({"@type": "lazy:self", "size": 2}, base)
+    assert type(obj).__name__ == "SelfRegistered"
+    assert obj.size == 4
+    assert "colt_lazy_plugin_a" in sys.modules
+
+    obj = colt.build({"@type": "lazy:attr", "size": 2}, base, strict=True)
+    assert type(obj).__name__ == "Attribute"
+    assert obj.size == 2
+
+
+def test_register_lazy_conflicts() -> None:
+    Plugin.register_lazy({"lazy:conflict": "colt_lazy_plugin_missing:Plugin"})
+    with pytest.raises(ValueError):
+        Plugin.register_lazy({"lazy:conflict": "colt_lazy_plugin_missing:Other"})
+
+    @Plugin.register("lazy:eager")
+    class Eager(Plugin):
+        pass
+
+    with pytest.raises(ValueError):
+        Plugin.register_lazy({"lazy:eager": "colt_lazy_plugin_missing:Plugin"})
+    Plugin.register_lazy({"lazy:eager": "builtins:dict"}, exist_ok=True)
+    assert Plugin.by_name("lazy:eager") is dict
+
+
+def test_register_lazy_reports_import_failure(plugins: Path) -> None:
+    Plugin.register_lazy({"lazy:later": "colt_lazy_plugin_b:Later"})
+
+    with pytest.raises(ConfigurationError, match="registered as lazy:later"):
+        Plugin.by_name("lazy:later")
+
+    write_module(plugins, "colt_lazy_plugin_b", "Later = dict\n")
+    assert Plugin.by_name("lazy:later") is dict
+
+
+def test_register_entry_points(plugins: Path) -> None:
+    write_module(plugins, "colt_lazy_plugin_c", "from collections import OrderedDict\n")
+    dist_info = plugins / "colt_lazy_plugin_c-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: colt-lazy-plugin-c\nVersion: 0.1\n")
+    (dist_info / "entry_points.txt").write_text("[colt.test_plugins]\nordered = colt_lazy_plugin_c:OrderedDict\n")
+
+    colt.register_entry_points("colt.test_plugins")
+
+    assert "colt_lazy_plugin_c" not in sys.modules
+    obj = colt.build({"@type": "ordered", "a": 1})
+    assert type(obj).__name__ == "OrderedDict"
+    assert obj == {"a": 1}
+
+
+def test_json_schema_includes_lazily_registered_classes(plugins: Path) -> None:
+    class Tool(Registrable):
+        pass
+
+    write_module(
+        plugins,
+        "colt_lazy_plugin_d",
+        """
+        class Hammer:
+            def __init__(self, weight: int) -> None:
+                self.weight = weight
+        """,
+    )
+    Tool.register_lazy({"hammer": "colt_lazy_plugin_d:Hammer"})
+
+    schema = JsonSchemaGenerator()(Tool)
+    assert "hammer" in str(schema)
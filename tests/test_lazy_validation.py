@@ -0,0 +1,134 @@
+import dataclasses
+from typing import Any, List
+
+import pytest
+
+from colt import ColtBuilder, ColtCallback, ColtContext, ConfigurationError, Lazy, LazyValidationInfo, Registrable
+from colt.types import ParamPath
+
+
+def test_lazy_validation_is_deferred_until_construction() -> None:
+    @dataclasses.dataclass
+    class Layer:
+        size: int
+
+    @dataclasses.dataclass
+    class Model:
+        layers: List[Layer]
+        rate: float
+
+    @dataclasses.dataclass
+    class Trainer:
+        model: Lazy[Model]
+
+    builder = ColtBuilder(defer_lazy_validation=True)
+    trainer = builder({"model": {"layers": [{"size": 1}], "rate": "fast"}}, Trainer)
+
+    assert builder.lazy_validation_info == LazyValidationInfo(full=0, scoped=0, deferred=1, skipped=0)
+
+    with pytest.raises(ConfigurationError):
+        trainer.model.construct(rate=0.2)
+
+    trainer.model.update(rate=0.2)
+    model = trainer.model.construct()
+    assert model.rate == 0.2
+    assert builder.lazy_validation_info == LazyValidationInfo(full=2, scoped=0, deferred=2, skipped=0)
+
+
+def test_lazy_update_validates_updated_fields() -> None:
+    @dataclasses.dataclass
+    class Layer:
+        size: int
+
+    @dataclasses.dataclass
+    class Model:
+        layers: List[Layer]
+        head: Layer
+        rate: float
+
+    @dataclasses.dataclass
+    class Trainer:
+        model: Lazy[Model]
+
+    builder = ColtBuilder()
+    trainer = builder(
+        {"model": {"layers": [{"size": 0}, {"size": 1}, {"size": 2}], "head": {"size": 1}, "rate": 0.1}}, Trainer
+    )
+
+    trainer.model.update({"head.size": 3})
+    assert trainer.model.construct().head == Layer(3)
+    # layers and rate are not checked again
+    assert builder.lazy_validation_info == LazyValidationInfo(full=1, scoped=1, deferred=0, skipped=2)
+
+    with pytest.raises(ConfigurationError, match=r"\[model\.layers\.1\.size\]"):
+        trainer.model.update({"layers.1.size": "large"})
+
+    trainer = builder({"model": {"layers": [{"size": 0}], "head": {"size": 1}, "rate": 0.1}}, Trainer)
+    with pytest.raises(ConfigurationError, match=r"\[model\.layers\.1\.size\]"):
+        trainer.model.update({"layers.+": {"size": "large"}})
+
+
+def test_lazy_update_of_typekey_validates_sibling_fields() -> None:
+    class Encoder(Registrable): ...
+
+    @Encoder.register("int")
+    class IntEncoder(Encoder):
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+    @Encoder.register("str")
+    class StrEncoder(Encoder):
+        def __init__(self, x: str) -> None:
+            self.x = x
+
+    @dataclasses.dataclass
+    class Holder:
+        encoder: Encoder
+
+    builder = ColtBuilder()
+    holder = builder({"encoder": {"@type": "int", "x": 1}}, Lazy[Holder])
+
+    with pytest.raises(ConfigurationError, match=r"\[encoder\.x\]"):
+        holder.update({"encoder.@type": "str"})
+
+    holder.update({"encoder.@type": "str", "encoder.x": "a"})
+    assert isinstance(holder.construct().encoder, StrEncoder)
+
+
+def test_lazy_update_validates_whole_config_with_callback() -> None:
+    class Visit(ColtCallback):
+        def __init__(self) -> None:
+            self.visited: List[ParamPath] = []
+
+        def on_build(
+            self,
+            path: ParamPath,
+            config: Any,
+            builder: ColtBuilder,
+            context: ColtContext,
+            annotation: Any = None,
+        ) -> Any:
+            self.visited.append(path)
+            return config
+
+    @dataclasses.dataclass
+    class Layer:
+        size: int
+
+    @dataclasses.dataclass
+    class Model:
+        head: Layer
+        rate: float
+
+    @dataclasses.dataclass
+    class Trainer:
+        model: Lazy[Model]
+
+    callback = Visit()
+    builder = ColtBuilder(callback=callback)
+    trainer = builder({"model": {"head": {"size": 1}, "rate": 0.1}}, Trainer)
+
+    callback.visited.clear()
+    trainer.model.update({"head.size": 3})
+    assert ("model", "rate") in callback.visited
+    assert builder.lazy_validation_info == LazyValidationInfo(full=2, scoped=0, deferred=0, skipped=0)
@@ -0,0 +1,176 @@
+import dataclasses
+from typing import Any, Dict, List
+
+import pytest
+
+import colt
+from colt import CacheInfo, ColtBuilder, ObjectCache, Registrable
+
+
+def test_object_cache_returns_cached_instance_across_builds() -> None:
+    created = 0
+
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str]) -> None:
+            nonlocal created
+            created += 1
+            self.vocab = vocab
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    builder = ColtBuilder(object_cache=ObjectCache(maxsize=8))
+    first = builder({"@type": "tokenizer", "vocab": ["a", "b"]}, Tokenizer)
+    second = builder({"@type": "tokenizer", "vocab": ["a", "b"]}, Tokenizer)
+
+    assert second is first
+    assert created == 1
+    assert builder.object_cache_info == CacheInfo(hits=1, misses=1, evictions=0, size=1)
+
+
+def test_object_cache_shares_identical_subtrees_within_a_build() -> None:
+    created = 0
+
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str]) -> None:
+            nonlocal created
+            created += 1
+            self.vocab = vocab
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    @dataclasses.dataclass
+    class Pipeline:
+        first: Tokenizer
+        second: Tokenizer
+
+    config = {"first": {"@type": "tokenizer", "vocab": ["a"]}, "second": {"@type": "tokenizer", "vocab": ["a"]}}
+    pipeline = ColtBuilder(object_cache=ObjectCache())(config, Pipeline)
+
+    assert pipeline.first is pipeline.second
+    assert created == 1
+
+
+def test_object_cache_ignores_key_order_but_not_values() -> None:
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str], lowercase: bool = True, options: Any = None) -> None:
+            self.vocab = vocab
+            self.lowercase = lowercase
+            self.options = options
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    builder = ColtBuilder(object_cache=ObjectCache())
+    first = builder({"vocab": ["a"], "lowercase": True, "@type": "tokenizer"}, Tokenizer)
+    second = builder({"lowercase": True, "@type": "tokenizer", "vocab": ["a"]}, Tokenizer)
+    third = builder({"@type": "tokenizer", "vocab": ["a"], "lowercase": False}, Tokenizer)
+    fourth = builder({"@type": "tokenizer", "vocab": ["a"], "options": 1}, Tokenizer)
+    fifth = builder({"@type": "tokenizer", "vocab": ["a"], "options": True}, Tokenizer)
+
+    assert second is first
+    assert third is not first
+    assert fifth is not fourth
+
+
+def test_object_cache_skips_classes_not_registered_as_cacheable() -> None:
+    class Counter(Registrable):
+        def __init__(self, start: int) -> None:
+            self.start = start
+
+    Counter.register("counter")(Counter)
+
+    builder = ColtBuilder(object_cache=ObjectCache())
+    config = {"@type": "counter", "start": 1}
+
+    assert builder(config, Counter) is not builder(config, Counter)
+    assert builder.object_cache_info == CacheInfo(hits=0, misses=0, evictions=0, size=0)
+
+
+def test_object_cache_supports_registered_constructors() -> None:
+    class Table(Registrable):
+        def __init__(self, rows: Dict[str, int]) -> None:
+            self.rows = rows
+
+        @classmethod
+        def load(cls, name: str) -> "Table":
+            return cls({name: len(name)})
+
+    Table.register("table", constructor="load", cacheable=True)(Table)
+
+    builder = ColtBuilder(object_cache=ObjectCache())
+    config = {"@type": "table", "name": "words"}
+    table = builder(config, Table)
+
+    assert builder(config, Table) is table
+    assert table.rows == {"words": 5}
+
+
+def test_object_cache_evicts_least_recently_used() -> None:
+    created = 0
+
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str]) -> None:
+            nonlocal created
+            created += 1
+            self.vocab = vocab
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    builder = ColtBuilder(object_cache=ObjectCache(maxsize=2))
+    a = builder({"@type": "tokenizer", "vocab": ["a"]}, Tokenizer)
+    builder({"@type": "tokenizer", "vocab": ["b"]}, Tokenizer)
+    assert builder({"@type": "tokenizer", "vocab": ["a"]}, Tokenizer) is a
+    builder({"@type": "tokenizer", "vocab": ["c"]}, Tokenizer)
+
+    assert builder({"@type": "tokenizer", "vocab": ["a"]}, Tokenizer) is a
+    assert builder({"@type": "tokenizer", "vocab": ["b"]}, Tokenizer) is not None
+    assert created == 4
+    info = builder.object_cache_info
+    assert info is not None and info.evictions == 2 and info.size == 2
+
+
+def test_object_cache_is_shared_between_builders() -> None:
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str]) -> None:
+            self.vocab = vocab
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    cache = ObjectCache()
+    first = ColtBuilder(object_cache=cache)({"@type": "tokenizer", "vocab": ["a"]}, Tokenizer)
+    second = ColtBuilder(object_cache=cache)({"@type": "tokenizer", "vocab": ["a"]}, Tokenizer)
+
+    assert second is first
+
+
+def test_object_cache_skips_dry_run_and_unhashable_configs() -> None:
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str], options: Any = None) -> None:
+            self.vocab = vocab
+            self.options = options
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    builder = ColtBuilder(object_cache=ObjectCache())
+    builder.dry_run({"@type": "tokenizer", "vocab": ["a"]}, Tokenizer)
+    config = {"@type": "tokenizer", "vocab": ["a"], "options": bytearray(b"x")}
+
+    assert builder(config, Tokenizer) is not builder(config, Tokenizer)
+    assert builder.object_cache_info == CacheInfo(hits=0, misses=0, evictions=0, size=0)
+
+
+def test_object_cache_is_disabled_by_default() -> None:
+    class Tokenizer(Registrable):
+        def __init__(self, vocab: List[str]) -> None:
+            self.vocab = vocab
+
+    Tokenizer.register("tokenizer", cacheable=True)(Tokenizer)
+
+    config = {"@type": "tokenizer", "vocab": ["a"]}
+
+    assert ColtBuilder().object_cache_info is None
+    assert colt.build(config, Tokenizer) is not colt.build(config, Tokenizer)
+
+
+def test_object_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError):
+        ObjectCache(maxsize=0)
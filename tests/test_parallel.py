@@ -0,0 +1,102 @@
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, List, TypeVar
+
+import pytest
+
+from colt import ColtBuilder, ConfigurationError, Registrable
+
+T = TypeVar("T")
+
+
+def test_parallel_builds_siblings_concurrently() -> None:
+    class Loader:
+        def __init__(self, name: str) -> None:
+            time.sleep(0.2)
+            self.name = name
+            self.thread = threading.current_thread().name
+
+    @dataclasses.dataclass
+    class Service:
+        first: Loader
+        second: Loader
+        third: Loader
+        port: int
+
+    config = {"first": {"name": "a"}, "second": {"name": "b"}, "third": {"name": "c"}, "port": 80}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        builder = ColtBuilder(executor=executor)
+        start = time.perf_counter()
+        service = builder(config, Service)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [service.first.name, service.second.name, service.third.name] == ["a", "b", "c"]
+    assert service.port == 80
+    assert len({service.first.thread, service.second.thread, service.third.thread}) == 3
+
+
+def test_parallel_reports_first_error_in_argument_order() -> None:
+    class Loader:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    class Failing:
+        def __init__(self, name: str) -> None:
+            raise RuntimeError(name)
+
+    @dataclasses.dataclass
+    class Broken:
+        first: Loader
+        second: Failing
+        third: Failing
+
+    config = {"first": {"name": "a"}, "second": {"name": "b"}, "third": {"name": "c"}}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        with pytest.raises(ConfigurationError, match=r"^\[second\] Failed to construct"):
+            ColtBuilder(executor=executor)(config, Broken)
+
+
+def test_parallel_nested_subtrees_do_not_deadlock() -> None:
+    class Loader:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    @dataclasses.dataclass
+    class Service:
+        first: Loader
+        second: Loader
+        third: Loader
+
+    @dataclasses.dataclass
+    class Nested:
+        left: Service
+        right: Service
+
+    service = {"first": {"name": "a"}, "second": {"name": "b"}, "third": {"name": "c"}}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        nested = ColtBuilder(executor=executor)({"left": service, "right": service}, Nested)
+
+    assert [nested.left.first.name, nested.right.third.name] == ["a", "c"]
+
+
+def test_parallel_keeps_type_variable_inference() -> None:
+    class Box(Registrable, Generic[T]):
+        def __init__(self, items: List[T]) -> None:
+            self.items = items
+
+    @Box.register("int")
+    class IntBox(Box[int]): ...
+
+    class Pair(Generic[T]):
+        def __init__(self, box: Box[T], extra: List[T]) -> None:
+            self.box = box
+            self.extra = extra
+
+    # `extra` is annotated by the type of `box`, so the arguments are built in order
+    config = {"box": {"@type": "int", "items": [1]}, "extra": ["2"]}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ConfigurationError, match=r"^\[extra\.0\] Type mismatch"):
+            ColtBuilder(executor=executor)(config, Pair)
@@ -0,0 +1,202 @@
+import dataclasses
+import importlib
+import multiprocessing
+import os
+import sys
+import textwrap
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ConfigurationError, Registrable
+
+
+class Model(Registrable):
+    pass
+
+
+@Model.register("process:heavy", executor="process")
+class Heavy(Model):
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.total = sum(range(size))
+        self.pid = os.getpid()
+
+
+@Model.register("process:light")
+class Light(Model):
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.pid = os.getpid()
+
+
+@Model.register("process:handle", executor="process")
+class Handle(Model):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+
+
+@dataclasses.dataclass
+class Pipeline:
+    first: Model
+    second: Model
+    third: Model
+
+
+@dataclasses.dataclass
+class Direct:
+    heavy: Heavy
+    light: Light
+
+
+@pytest.fixture(scope="module")
+def executor() -> Iterator[ProcessPoolExecutor]:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method is not available")
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")) as executor:
+        yield executor
+
+
+def test_process_builds_registered_classes_in_workers(executor: ProcessPoolExecutor) -> None:
+    config = {
+        "first": {"@type": "process:heavy", "size": 10},
+        "second": {"@type": "process:light", "size": 20},
+        "third": {"@type": "process:heavy", "size": 30},
+    }
+    pipeline = ColtBuilder(process_executor=executor)(config, Pipeline)
+
+    assert isinstance(pipeline.first, Heavy) and pipeline.first.total == sum(range(10))
+    assert isinstance(pipeline.third, Heavy) and pipeline.third.total == sum(range(30))
+    assert pipeline.first.pid != os.getpid()
+    assert pipeline.third.pid != os.getpid()
+    assert isinstance(pipeline.second, Light) and pipeline.second.pid == os.getpid()
+
+
+def test_process_resolves_classes_from_annotations(executor: ProcessPoolExecutor) -> None:
+    direct = ColtBuilder(process_executor=executor)({"heavy": {"size": 5}, "light": {"size": 5}}, Direct)
+
+    assert direct.heavy.total == 10
+    assert direct.heavy.pid != os.getpid()
+    assert direct.light.pid == os.getpid()
+
+
+def test_process_matches_sequential_build(executor: ProcessPoolExecutor) -> None:
+    config = {
+        "first": {"@type": "process:heavy", "size": 100},
+        "second": {"@type": "process:heavy", "size": 200},
+        "third": {"@type": "process:light", "size": 300},
+    }
+    parallel = ColtBuilder(process_executor=executor)(config, Pipeline)
+    sequential = ColtBuilder()(config, Pipeline)
+
+    assert isinstance(parallel.second, Heavy) and isinstance(sequential.second, Heavy)
+    assert parallel.second.total == sequential.second.total == sum(range(200))
+    assert isinstance(parallel.third, Light) and parallel.third.size == 300
+
+
+def test_process_reports_errors_with_full_path(executor: ProcessPoolExecutor) -> None:
+    config = {
+        "first": {"@type": "process:heavy", "size": 1},
+        "second": {"@type": "process:heavy", "size": "many"},
+        "third": {"@type": "process:light", "size": 1},
+    }
+    with pytest.raises(ConfigurationError) as excinfo:
+        ColtBuilder(process_executor=executor)(config, Pipeline)
+
+    assert "second.size" in str(excinfo.value)
+
+
+def test_process_falls_back_for_unpicklable_results(executor: ProcessPoolExecutor) -> None:
+    config = {
+        "first": {"@type": "process:handle", "name": "a"},
+        "second": {"@type": "process:heavy", "size": 1},
+        "third": {"@type": "process:handle", "name": "b"},
+    }
+    pipeline = ColtBuilder(process_executor=executor)(config, Pipeline)
+
+    assert isinstance(pipeline.first, Handle) and pipeline.first.name == "a"
+    assert pipeline.first.pid == os.getpid()
+    assert isinstance(pipeline.second, Heavy) and pipeline.second.pid != os.getpid()
+
+
+def test_process_falls_back_for_unpicklable_configs(executor: ProcessPoolExecutor) -> None:
+    @dataclasses.dataclass
+    class Local:
+        value: int
+
+    @Model.register("process:local-heavy", executor="process", exist_ok=True)
+    class LocalHeavy(Model):
+        def __init__(self, local: Local, callback: Callable[[], Any]) -> None:
+            self.local = local
+            self.callback = callback
+            self.pid = os.getpid()
+
+    config = {
+        "first": {"@type": "process:local-heavy", "local": {"value": 1}, "callback": lambda: 0},
+        "second": {"@type": "process:heavy", "size": 1},
+        "third": {"@type": "process:light", "size": 1},
+    }
+    pipeline = ColtBuilder(process_executor=executor)(config, Pipeline)
+
+    assert isinstance(pipeline.first, LocalHeavy)
+    assert pipeline.first.pid == os.getpid()
+    assert pipeline.first.local == Local(1)
+
+
+def test_process_imports_registering_modules_in_spawned_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # classes registered in a plugin module are unknown to workers which do not import it
+    (tmp_path / "process_spawn_base.py").write_text(
+        textwrap.dedent(
+            """
+            import dataclasses
+
+            from colt import Registrable
+
+
+            class Model(Registrable):
+                pass
+
+
+            @dataclasses.dataclass
+            class Pipeline:
+                first: Model
+                second: Model
+            """
+        )
+    )
+    (tmp_path / "process_spawn_plugin.py").write_text(
+        textwrap.dedent(
+            """
+            import os
+
+            from process_spawn_base import Model
+
+
+            @Model.register("heavy", executor="process")
+            class Heavy(Model):
+                def __init__(self, size: int) -> None:
+                    self.size = size
+                    self.pid = os.getpid()
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("process_spawn_base", "process_spawn_plugin"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    colt.import_modules(["process_spawn_plugin"])
+    base = importlib.import_module("process_spawn_base")
+
+    config = {"first": {"@type": "heavy", "size": 1}, "second": {"@type": "heavy", "size": 2}}
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        pipeline = ColtBuilder(process_executor=executor)(config, base.Pipeline)
+
+    assert [pipeline.first.size, pipeline.second.size] == [1, 2]
+    assert pipeline.first.pid != os.getpid()
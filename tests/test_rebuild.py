@@ -0,0 +1,193 @@
+import copy
+import dataclasses
+from typing import Any, List, Optional
+
+import pytest
+
+from colt import ColtBuilder, ColtCallback, ColtContext
+from colt.record import find_unchanged_paths
+from colt.types import ParamPath
+
+
+def test_rebuild_reuses_unchanged_subtrees() -> None:
+    created: List[Any] = []
+
+    class Tokenizer:
+        def __init__(self, vocab: List[str]) -> None:
+            created.append(self)
+            self.vocab = vocab
+
+    class Encoder:
+        def __init__(self, tokenizer: Tokenizer, hidden: int) -> None:
+            created.append(self)
+            self.tokenizer = tokenizer
+            self.hidden = hidden
+
+    class Head:
+        def __init__(self, labels: int) -> None:
+            created.append(self)
+            self.labels = labels
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        heads: List[Head]
+
+    builder = ColtBuilder(history=4)
+    old_config = {"encoder": {"tokenizer": {"vocab": ["a", "b"]}, "hidden": 8}, "heads": [{"labels": 2}, {"labels": 3}]}
+    old = builder(old_config, Model)
+    assert len(created) == 4
+
+    new_config = copy.deepcopy(old_config)
+    new_config["encoder"]["hidden"] = 16
+    new = builder.rebuild(old_config, old, new_config, Model)
+
+    assert new is not old
+    assert new.encoder is not old.encoder and new.encoder.hidden == 16
+    assert new.encoder.tokenizer is old.encoder.tokenizer
+    assert new.heads[0] is old.heads[0] and new.heads[1] is old.heads[1]
+    assert len(created) == 5
+
+
+def test_rebuild_builds_changed_sequence_items() -> None:
+    created: List[Any] = []
+
+    class Head:
+        def __init__(self, labels: int) -> None:
+            created.append(self)
+            self.labels = labels
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Head
+        heads: List[Head]
+
+    builder = ColtBuilder(history=1)
+    old_config = {"encoder": {"labels": 1}, "heads": [{"labels": 2}, {"labels": 3}]}
+    old = builder(old_config, Model)
+
+    new_config = copy.deepcopy(old_config)
+    new_config["heads"][1]["labels"] = 5
+    new_config["heads"].append({"labels": 7})
+    new = builder.rebuild(old_config, old, new_config, Model)
+
+    assert new.encoder is old.encoder
+    assert new.heads[0] is old.heads[0]
+    assert [head.labels for head in new.heads] == [2, 5, 7]
+    assert len(created) == 5
+
+
+def test_rebuild_handles_added_and_removed_keys() -> None:
+    @dataclasses.dataclass
+    class Head:
+        labels: int
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Head
+        dropout: float = 0.0
+        extra: Optional[Head] = None
+
+    builder = ColtBuilder(history=1)
+    old_config = {"encoder": {"labels": 1}, "dropout": 0.1}
+    old = builder(old_config, Model)
+
+    new_config = {"encoder": {"labels": 1}, "extra": {"labels": 2}}
+    new = builder.rebuild(old_config, old, new_config, Model)
+
+    assert new.dropout == 0.0
+    assert new.extra == Head(2)
+    assert new.encoder is old.encoder
+
+
+def test_rebuild_chains_results() -> None:
+    @dataclasses.dataclass
+    class Head:
+        labels: int
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Head
+        dropout: float
+
+    builder = ColtBuilder(history=1)
+    first_config = {"encoder": {"labels": 1}, "dropout": 0.1}
+    first = builder(first_config, Model)
+    second_config = {**first_config, "dropout": 0.2}
+    second = builder.rebuild(first_config, first, second_config, Model)
+    third_config = {**second_config, "dropout": 0.3}
+    third = builder.rebuild(second_config, second, third_config, Model)
+
+    assert third.encoder is first.encoder
+    assert third.dropout == 0.3
+    with pytest.raises(ValueError):
+        builder.rebuild(first_config, first, third_config, Model)
+
+
+def test_rebuild_requires_recorded_result() -> None:
+    @dataclasses.dataclass
+    class Head:
+        labels: int
+
+    config = {"labels": 1}
+    with pytest.raises(ValueError, match="history"):
+        ColtBuilder().rebuild(config, ColtBuilder()(config, Head), config, Head)
+
+
+def test_rebuild_does_not_reuse_with_callbacks() -> None:
+    class Scale(ColtCallback):
+        def on_build(
+            self,
+            path: ParamPath,
+            config: Any,
+            builder: ColtBuilder,
+            context: ColtContext,
+            annotation: Optional[Any] = None,
+        ) -> Any:
+            return config
+
+    @dataclasses.dataclass
+    class Head:
+        labels: int
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Head
+        heads: List[Head]
+
+    builder = ColtBuilder(history=1, callback=Scale())
+    config = {"encoder": {"labels": 1}, "heads": [{"labels": 2}]}
+    old = builder(config, Model)
+    new = builder.rebuild(config, old, config, Model)
+
+    assert new.encoder is not old.encoder
+    assert new.heads[0] is not old.heads[0]
+
+
+def test_rebuild_does_not_reuse_with_references() -> None:
+    @dataclasses.dataclass
+    class Head:
+        labels: int
+
+    @dataclasses.dataclass
+    class Model:
+        heads: List[Head]
+        extra: Optional[Head] = None
+
+    builder = ColtBuilder(history=1)
+    old_config = {"heads": [{"labels": 2}, {"labels": 3}], "extra": {"@ref": "heads.0"}}
+    old = builder(old_config, Model)
+
+    new_config = copy.deepcopy(old_config)
+    new_config["heads"][0]["labels"] = 9
+    new = builder.rebuild(old_config, old, new_config, Model)
+
+    assert new.extra is new.heads[0]
+    assert new.extra is not None and new.extra.labels == 9
+
+
+def test_find_unchanged_paths() -> None:
+    old = {"a": {"x": 1, "y": [1, 2]}, "b": 1, "c": {"z": 1}}
+    new = {"c": {"z": True}, "b": 1, "a": {"y": [1, 2], "x": 1}}
+
+    assert find_unchanged_paths(old, new) == {("a",), ("a", "x"), ("a", "y"), ("a", "y", 0), ("a", "y", 1), ("b",)}
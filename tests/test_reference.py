@@ -0,0 +1,424 @@
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ConfigurationError, Lazy
+from colt.reference import find_references
+
+
+def test_reference_shares_instance() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {
+        "encoder": {"embedding": {"size": 8}},
+        "decoder": {"embedding": {"@ref": "encoder.embedding"}},
+    }
+    model = colt.build(config, Model)
+
+    assert model.decoder.embedding is model.encoder.embedding
+    assert model.encoder.embedding.size == 8
+
+
+def test_reference_builds_target_before_its_position() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Decoder:
+        embedding: Embedding
+        layers: int = 1
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Decoder
+
+    config = {
+        "encoder": {"embedding": {"@ref": "decoder.embedding"}},
+        "decoder": {"embedding": {"size": 8}, "layers": 2},
+    }
+    model = colt.build(config, Model)
+
+    assert model.encoder.embedding is model.decoder.embedding
+    assert model.decoder.layers == 2
+
+
+def test_reference_resolves_sequence_indices_and_chains() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Stack:
+        embeddings: List[Embedding]
+        first: Embedding
+        alias: Embedding
+
+    config = {
+        "embeddings": [{"size": 1}, {"size": 2}],
+        "first": {"@ref": "embeddings.1"},
+        "alias": {"@ref": "first"},
+    }
+    stack = colt.build(config, Stack)
+
+    assert stack.first is stack.embeddings[1]
+    assert stack.alias is stack.embeddings[1]
+    assert stack.embeddings[0] is not stack.embeddings[1]
+
+
+def test_find_references_in_lists_of_scalars() -> None:
+    config = {"values": [1.0, 2.0, 3.0], "items": [1, "a", {"@ref": "values"}], "pair": ("x", [{"@ref": "items.0"}])}
+
+    assert sorted(find_references(config, "@ref")) == ["items.0", "values"]
+    assert find_references({"values": [0.5] * 1000}, "@ref") == []
+
+
+def test_reference_detects_cycles() -> None:
+    @dataclasses.dataclass
+    class Node:
+        name: str
+        child: Optional["Node"] = None
+
+    config = {"name": "a", "child": {"name": "b", "child": {"@ref": "child"}}}
+    with pytest.raises(ConfigurationError, match="Circular reference"):
+        colt.build(config, Node)
+
+
+def test_reference_detects_mutual_cycles() -> None:
+    @dataclasses.dataclass
+    class Node:
+        name: str
+        child: Optional["Node"] = None
+
+    @dataclasses.dataclass
+    class Pair:
+        left: Node
+        right: Node
+
+    config = {
+        "left": {"name": "l", "child": {"@ref": "right"}},
+        "right": {"name": "r", "child": {"@ref": "left"}},
+    }
+    with pytest.raises(ConfigurationError, match="Circular reference"):
+        colt.build(config, Pair)
+
+
+def test_reference_reports_missing_target() -> None:
+    @dataclasses.dataclass
+    class Embedding:
+        size: int
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {"encoder": {"embedding": {"size": 8}}, "decoder": {"embedding": {"@ref": "encoder.missing"}}}
+    with pytest.raises(ConfigurationError, match=r"\[decoder.embedding\] Referenced config 'encoder.missing'"):
+        colt.build(config, Model)
+
+
+def test_reference_rejects_extra_keys() -> None:
+    @dataclasses.dataclass
+    class Embedding:
+        size: int
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {"encoder": {"embedding": {"size": 8}}, "decoder": {"embedding": {"@ref": "encoder.embedding", "size": 1}}}
+    with pytest.raises(ConfigurationError, match="A reference must be a mapping"):
+        colt.build(config, Model)
+
+
+def test_reference_checks_type_of_shared_object() -> None:
+    @dataclasses.dataclass
+    class Embedding:
+        size: int
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Holder:
+        encoder: Encoder
+        other: Embedding
+
+    config = {"encoder": {"embedding": {"size": 8}}, "other": {"@ref": "encoder"}}
+    with pytest.raises(ConfigurationError, match="Type mismatch of the referenced object"):
+        colt.build(config, Holder)
+
+
+def test_reference_builds_target_with_its_own_annotation() -> None:
+    class Base: ...
+
+    @dataclasses.dataclass
+    class Sub(Base):
+        size: int
+
+    @dataclasses.dataclass
+    class Holder:
+        first: Base
+        second: Sub
+        meta: Dict[str, Any]
+
+    config = {"first": {"@ref": "second"}, "meta": {"sub": {"@ref": "second"}}, "second": {"size": 3}}
+    holder = colt.build(config, Holder)
+
+    assert isinstance(holder.second, Sub)
+    assert holder.first is holder.second
+    assert holder.meta["sub"] is holder.second
+
+    with pytest.raises(ConfigurationError, match="Type mismatch of the referenced object"):
+        colt.build({"second": {"@ref": "first"}, "first": {}, "meta": {}}, Holder)
+
+
+def test_reference_with_custom_refkey() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {
+        "encoder": {"embedding": {"size": 8}},
+        "decoder": {"embedding": {"$ref": "encoder.embedding"}},
+    }
+    model = ColtBuilder(refkey="$ref")(config, Model)
+
+    assert model.decoder.embedding is model.encoder.embedding
+
+
+def test_reference_in_untyped_config() -> None:
+    config: Dict[str, Any] = {"a": {"x": 1}, "b": {"@ref": "a"}}
+    built = colt.build(config)
+
+    assert built["b"] is built["a"]
+
+
+def test_reference_with_parallel_builder() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {
+        "encoder": {"embedding": {"size": 8}},
+        "decoder": {"embedding": {"@ref": "encoder.embedding"}},
+    }
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        model = ColtBuilder(executor=executor)(config, Model)
+
+    assert model.decoder.embedding is model.encoder.embedding
+
+
+def test_reference_with_abuild() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {
+        "encoder": {"embedding": {"@ref": "decoder.embedding"}},
+        "decoder": {"embedding": {"size": 8}},
+    }
+    model = asyncio.run(colt.abuild(config, Model))
+
+    assert model.encoder.embedding is model.decoder.embedding
+
+
+def test_reference_validation() -> None:
+    created: List[Any] = []
+
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            created.append(self)
+            self.size = size
+
+    @dataclasses.dataclass
+    class Encoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        decoder: Encoder
+
+    config = {
+        "encoder": {"embedding": {"size": "large"}},
+        "decoder": {"embedding": {"@ref": "encoder.missing"}},
+    }
+    report = colt.validate(config, Model)
+
+    assert [issue.path for issue in report.issues] == [("encoder", "embedding", "size"), ("decoder", "embedding")]
+    assert created == []
+
+    config = {"encoder": {"embedding": {"size": "large"}}, "decoder": {"embedding": {"@ref": "encoder.embedding"}}}
+    report = colt.validate(config, Model)
+
+    assert [issue.path for issue in report.issues] == [("encoder", "embedding", "size")]
+
+
+def test_reference_from_lazy_config() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Decoder:
+        embedding: Embedding
+
+    @dataclasses.dataclass
+    class Trainer:
+        embedding: Embedding
+        model: Lazy[Decoder]
+
+    config = {"embedding": {"size": 8}, "model": {"embedding": {"@ref": "embedding"}}}
+    trainer = colt.build(config, Trainer)
+    decoder = trainer.model.construct()
+
+    assert decoder.embedding is trainer.embedding
+
+
+def test_reference_to_lazy_config() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Trainer:
+        first: Lazy[Embedding]
+        second: Lazy[Embedding]
+
+    trainer = colt.build({"first": {"@ref": "second"}, "second": {"size": 8}}, Trainer)
+
+    assert trainer.first is trainer.second
+    assert trainer.first.construct().size == 8
+
+
+def test_reference_from_updated_lazy_config() -> None:
+    class Embedding:
+        def __init__(self, size: int) -> None:
+            self.size = size
+
+    @dataclasses.dataclass
+    class Decoder:
+        embedding: Embedding
+        layers: int = 1
+
+    @dataclasses.dataclass
+    class Trainer:
+        embedding: Embedding
+        model: Lazy[Decoder]
+
+    config = {"embedding": {"size": 8}, "model": {"embedding": {"@ref": "embedding"}}}
+    trainer = colt.build(config, Trainer)
+    trainer.model.update(layers=2)
+    decoder = trainer.model.construct()
+
+    assert decoder.layers == 2
+    assert decoder.embedding is trainer.embedding
+    with pytest.raises(ConfigurationError):
+        trainer.model.update(layers="many")
+
+
+def test_reference_within_lazy_config_is_built_for_each_construction() -> None:
+    class Embedding:
+        def __init__(self, dim: int) -> None:
+            self.dim = dim
+
+    @dataclasses.dataclass
+    class Encoder:
+        source: Embedding
+        target: Embedding
+
+    @dataclasses.dataclass
+    class Trainer:
+        encoder: Lazy[Encoder]
+
+    config = {"encoder": {"source": {"dim": 1}, "target": {"@ref": "encoder.source"}}}
+    trainer = colt.build(config, Trainer)
+    first = trainer.encoder.construct()
+    second = trainer.encoder.construct({"source.dim": 5})
+
+    assert first.target is first.source and first.source.dim == 1
+    assert second.target is second.source and second.source.dim == 5
+    assert second.source is not first.source
+
+
+def test_reference_within_updated_lazy_config() -> None:
+    class Embedding:
+        def __init__(self, dim: int) -> None:
+            self.dim = dim
+
+    @dataclasses.dataclass
+    class Encoder:
+        source: Embedding
+        target: Embedding
+
+    @dataclasses.dataclass
+    class Trainer:
+        encoder: Lazy[Encoder]
+
+    config = {"encoder": {"source": {"dim": 1}, "target": {"@ref": "encoder.source"}}}
+    trainer = colt.build(config, Trainer)
+    trainer.encoder.construct()
+    trainer.encoder.update({"source.dim": 7})
+    encoder = trainer.encoder.construct()
+
+    assert encoder.target is encoder.source
+    assert encoder.source.dim == 7
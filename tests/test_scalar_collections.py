@@ -0,0 +1,103 @@
+import dataclasses
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ColtCallback, ColtContext, ConfigurationError, Placeholder
+from colt.types import ParamPath
+
+
+@dataclasses.dataclass
+class Series:
+    values: List[float]
+    counts: Dict[str, int]
+    labels: Tuple[str, ...]
+    flags: Set[bool]
+
+
+def test_scalar_collections_are_built() -> None:
+    series = colt.build(
+        {"values": [1.5, 2, True], "counts": {"a": 1, "b": False}, "labels": ["x", "y"], "flags": [True]},
+        Series,
+    )
+    assert series == Series(values=[1.5, 2.0, 1.0], counts={"a": 1, "b": False}, labels=("x", "y"), flags={True})
+    assert all(type(x) is float for x in series.values)
+
+
+def test_scalar_collections_keep_special_configs() -> None:
+    placeholder = Placeholder(float)
+    values = colt.build([1.0, None, placeholder, colt.Constructed(3.0)], List[Optional[float]])
+    assert values == [1.0, None, placeholder, 3.0]
+    values = colt.build([1.0, None, placeholder], List[float])
+    assert values == [1.0, None, placeholder]
+
+
+@pytest.mark.parametrize(
+    "config, annotation",
+    [
+        ([1.5, 2, 3], List[float]),
+        ({"a": 1, "b": 2, "c": 3}, Dict[str, int]),
+    ],
+)
+def test_scalar_collections_do_not_build_elements(
+    monkeypatch: pytest.MonkeyPatch, config: Any, annotation: Any
+) -> None:
+    calls: List[Any] = []
+    begin_build = ColtBuilder._begin_build
+
+    def counting_begin_build(self: ColtBuilder, config: Any, *args: Any) -> Any:
+        calls.append(config)
+        return begin_build(self, config, *args)
+
+    monkeypatch.setattr(ColtBuilder, "_begin_build", counting_begin_build)
+
+    assert ColtBuilder()(config, annotation) == config
+    assert calls == [config]
+
+
+@pytest.mark.parametrize(
+    "config, annotation, path",
+    [
+        ([1.0, 2.0, "x"], List[float], "[2]"),
+        ([1, 2, 3, 4.5], List[int], "[3]"),
+        (["a", 1], Tuple[str, ...], "[1]"),
+        ({"a": 1, "b": "2"}, Dict[str, int], "[b]"),
+        ({"a": 1, 2: 3}, Dict[str, int], "[[key:1]]"),
+    ],
+)
+def test_scalar_collections_report_failing_index(config: Any, annotation: Any, path: str) -> None:
+    with pytest.raises(ConfigurationError) as excinfo:
+        colt.build(config, annotation)
+    assert str(excinfo.value).startswith(f"{path} Type mismatch")
+
+
+def test_scalar_collections_match_default_path_errors() -> None:
+    class Noop(ColtCallback):
+        hooks = ("on_build",)
+
+    for config, annotation in [([1.0, "x"], List[float]), ({"a": "1"}, Dict[str, int])]:
+        with pytest.raises(ConfigurationError) as fast:
+            ColtBuilder()(config, annotation)
+        with pytest.raises(ConfigurationError) as slow:
+            ColtBuilder(callback=Noop())(config, annotation)
+        assert str(fast.value) == str(slow.value)
+
+
+def test_scalar_collections_call_callback_per_element() -> None:
+    paths: List[ParamPath] = []
+
+    class Recorder(ColtCallback):
+        def on_build(
+            self,
+            path: ParamPath,
+            config: Any,
+            builder: ColtBuilder,
+            context: ColtContext,
+            annotation: Any = None,
+        ) -> Any:
+            paths.append(path)
+            return config
+
+    colt.build([1, 2], List[int], callback=Recorder())
+    assert paths == [(), (0,), (1,)]
@@ -0,0 +1,128 @@
+import dataclasses
+import gc
+import inspect
+import sys
+import types
+import weakref
+from typing import Dict, List
+
+import pytest
+
+import colt
+from colt import ColtBuilder
+from colt.signature import ConstructorSignature, SignatureCache
+
+
+class Foo:
+    def __init__(self, x: int, *, y: str = "y", **kwargs: float) -> None:
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def create(cls, x: int) -> "Foo":
+        return cls(x)
+
+
+def test_constructor_signature() -> None:
+    signature = ConstructorSignature.from_constructor(Foo)
+
+    assert signature.type_hints == {"x": int, "y": str, "kwargs": float, "return": type(None)}
+    assert signature.parameter_kinds["y"] == inspect.Parameter.KEYWORD_ONLY
+    assert signature.defaults == {"y": "y"}
+    assert signature.keyword_names == {"x", "y"}
+    assert signature.accepts_var_keyword
+
+
+def test_signature_cache_reuses_signatures() -> None:
+    cache = SignatureCache()
+
+    assert cache[Foo] is cache[Foo]
+    assert cache[Foo.create] is cache[Foo.create]
+    assert cache[Foo.create].keyword_names == {"x"}
+    assert len(cache) == 2
+
+
+def test_signature_cache_does_not_keep_constructors_alive() -> None:
+    cache = SignatureCache()
+
+    class Bar:
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+    assert cache[Bar].type_hints["x"] is int
+    assert len(cache) == 1
+
+    del Bar
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+def test_builder_does_not_keep_local_classes_alive() -> None:
+    builder = ColtBuilder()
+
+    def build() -> "weakref.ReferenceType[type]":
+        @dataclasses.dataclass
+        class Inner:
+            x: int
+
+        @dataclasses.dataclass
+        class Local:
+            inner: Inner
+
+        assert builder({"inner": {"x": 1}}, Local).inner.x == 1
+        assert Local not in builder._plans
+        return weakref.ref(Inner)
+
+    ref = build()
+    # `Inner` is released by dropping the cached signature of `Local` after the first collection
+    gc.collect()
+    gc.collect()
+
+    assert ref() is None
+    assert len(builder._signatures) == 0
+    assert builder({"a": 1}, Dict[str, int]) == {"a": 1}
+
+
+def test_builder_does_not_modify_built_classes() -> None:
+    cloudpickle = pytest.importorskip("cloudpickle")
+
+    @dataclasses.dataclass
+    class Local:
+        x: int
+
+    assert ColtBuilder()({"x": 1}, Local).x == 1
+    assert cloudpickle.loads(cloudpickle.dumps(Local))(x=2).x == 2
+    assert [name for name in vars(Local) if "colt" in name] == []
+
+
+def test_invalidate_caches_for_reloaded_module() -> None:
+    module = types.ModuleType("colt_test_reloaded_module")
+    sys.modules[module.__name__] = module
+    try:
+        exec(
+            "class Baz:\n    def __init__(self, x: int) -> None:\n        self.x = x\n",
+            module.__dict__,
+        )
+        builder = ColtBuilder()
+        assert builder({"x": 1}, module.Baz).x == 1
+        assert builder.compile(List[module.Baz]) is builder.compile(List[module.Baz])
+
+        builder.invalidate_caches("colt_test_unrelated_module")
+        assert len(builder._signatures) == 1
+
+        builder.invalidate_caches(module.__name__)
+        assert len(builder._signatures) == 0
+        assert module.Baz not in builder._plans
+        assert List[module.Baz] not in builder._plans
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_build_with_classmethod_constructor() -> None:
+    colt.register("signature_test_foo", constructor="create")(Foo)
+
+    builder = ColtBuilder()
+    foos = builder([{"@type": "signature_test_foo", "x": i} for i in range(3)], List[Foo])
+
+    assert [foo.x for foo in foos] == [0, 1, 2]
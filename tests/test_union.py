@@ -0,0 +1,134 @@
+import dataclasses
+from typing import Any, Dict, List, Literal, Union
+
+import pytest
+
+import colt
+from colt import ColtBuilder, ConfigurationError, Registrable
+from colt.cache import CacheInfo
+
+
+class Component(Registrable):
+    constructed: List[str] = []
+
+    def __init__(self, value: int) -> None:
+        Component.constructed.append(type(self).__name__)
+        self.value = value
+
+
+def _make_components(count: int) -> List[type]:
+    components = []
+    for i in range(count):
+        component = type(f"Component{i}", (Component,), {})
+        component.register(f"union_test_component_{i}")(component)
+        components.append(component)
+    return components
+
+
+COMPONENTS = _make_components(12)
+AnyComponent: Any = Union[tuple(COMPONENTS)]  # type: ignore[valid-type]
+
+
+def test_union_is_discriminated_by_typekey() -> None:
+    Component.constructed.clear()
+
+    obj = colt.build({"@type": "union_test_component_11", "value": 1}, AnyComponent)
+
+    assert type(obj) is COMPONENTS[11]
+    assert Component.constructed == ["Component11"]
+
+
+def test_union_discriminated_by_typekey_reports_member_error() -> None:
+    with pytest.raises(ConfigurationError, match=r"\[value\] Type mismatch"):
+        colt.build({"@type": "union_test_component_3", "value": "x"}, AnyComponent)
+
+
+@dataclasses.dataclass
+class Cat:
+    kind: Literal["cat"]
+    name: str
+
+
+@dataclasses.dataclass
+class Dog:
+    kind: Literal["dog"]
+    name: str
+
+
+def test_union_is_discriminated_by_literal_field() -> None:
+    builder = ColtBuilder()
+
+    assert isinstance(builder({"kind": "dog", "name": "pochi"}, Union[Cat, Dog]), Dog)
+    assert isinstance(builder({"kind": "cat", "name": "tama"}, Union[Cat, Dog]), Cat)
+
+
+def test_union_without_matching_member_tries_all_members() -> None:
+    with pytest.raises(ConfigurationError) as excinfo:
+        colt.build({"kind": "bird", "name": "piyo"}, Union[Cat, Dog])
+
+    message = str(excinfo.value)
+    assert "Cat" in message
+    assert "Dog" in message
+    assert "Traceback" in message
+
+
+@dataclasses.dataclass
+class Circle:
+    radius: float
+    shape: str = "circle"
+
+
+@dataclasses.dataclass
+class Square:
+    radius: float
+    shape: str = "square"
+
+
+def test_union_is_discriminated_by_tagkey() -> None:
+    config = {"shape": "square", "radius": 1.0}
+
+    assert isinstance(colt.build(config, Union[Circle, Square]), Circle)
+    assert isinstance(colt.build(config, Union[Circle, Square], tagkey="shape"), Square)
+
+
+def test_union_cache_skips_mismatching_members_by_config_shape() -> None:
+    annotation: Any = Union[int, List[int], Dict[str, int], str]
+    builder = ColtBuilder(union_cache=True)
+
+    assert builder("a", annotation) == "a"
+    assert builder("b", annotation) == "b"
+    assert builder.union_cache_info == CacheInfo(hits=1, misses=1, evictions=0, size=1)
+
+    assert builder([1, 2], annotation) == [1, 2]
+    assert builder.union_cache_info == CacheInfo(hits=1, misses=2, evictions=0, size=2)
+
+
+def test_union_cache_keeps_declaration_order() -> None:
+    class A:
+        def __init__(self, x: int) -> None:
+            if x < 0:
+                raise ValueError(x)
+            self.x = x
+
+    class B:
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+    annotation: Any = Union[A, B]
+    builder = ColtBuilder(union_cache=True)
+
+    assert isinstance(builder({"x": -1}, annotation), B)
+    assert isinstance(builder({"x": 1}, annotation), A)
+
+
+def test_union_cache_falls_back_to_other_members() -> None:
+    annotation: Any = Union[Dict[str, int], Dict[str, str]]
+    builder = ColtBuilder(union_cache=True)
+
+    assert builder({"a": "x"}, annotation) == {"a": "x"}
+    assert builder({"a": 1}, annotation) == {"a": 1}
+    assert builder({"a": "y"}, annotation) == {"a": "y"}
+
+
+def test_union_cache_is_disabled_by_default() -> None:
+    assert ColtBuilder().union_cache_info is None
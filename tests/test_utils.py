@@ -18,7 +18,15 @@ from typing import (
 
 import pytest
 
-from colt.utils import is_namedtuple, is_typeddict, issubtype, update_field
+from colt.utils import (
+    is_namedtuple,
+    is_typeddict,
+    issubtype,
+    override_fields,
+    to_linked_path,
+    to_param_path,
+    update_field,
+)
 
 if sys.version_info >= (3, 9):
     from collections.abc import Iterator
@@ -63,6 +71,23 @@ def test_update_field(
     assert obj == expected
 
 
+def test_override_fields() -> None:
+    obj = {"a": {"b": [1, {"c": 1}]}, "d": {"e": [1, 2, 3]}}
+    result = override_fields(obj, [("a.b.1.c", 2), ("a.b.+", 3), (("a", "f"), 4)])
+
+    assert result == {"a": {"b": [1, {"c": 2}, 3], "f": 4}, "d": {"e": [1, 2, 3]}}
+    assert obj == {"a": {"b": [1, {"c": 1}]}, "d": {"e": [1, 2, 3]}}
+    assert result["d"] is obj["d"]
+
+
+def test_override_fields_does_not_modify_given_values() -> None:
+    value = {"b": 1}
+    result = override_fields({}, [("a", value), ("a.b", 2)])
+
+    assert result == {"a": {"b": 2}}
+    assert value == {"b": 1}
+
+
 @pytest.mark.parametrize(
     "a, b, expected",
     [
@@ -170,3 +195,14 @@ def test_is_named_tuple(obj: Any, expected: bool) -> None:
 )
 def test_is_typeddict(cls: Any, expected: bool) -> None:
     assert is_typeddict(cls) == expected
+
+
+def test_linked_path_round_trip() -> None:
+    path = ("foo", 0, "bar")
+    assert to_linked_path(path) == ((((None, "foo"), 0), "bar"))
+    assert to_param_path(to_linked_path(path)) == path
+    assert to_param_path(None) == ()
+
+
+def test_linked_path_mapping_key() -> None:
+    assert to_param_path(((None, "foo"), 3, None)) == ("foo", "[key:3]")
@@ -0,0 +1,124 @@
+import dataclasses
+from typing import Dict, List, Optional, Union
+
+import colt
+from colt import ColtBuilder, ConfigurationError, Lazy, Registrable
+
+
+@dataclasses.dataclass
+class Layer:
+    size: int
+    dropout: float = 0.0
+
+
+@dataclasses.dataclass
+class Model:
+    name: str
+    layers: List[Layer]
+    options: Dict[str, int]
+    head: Optional[Layer] = None
+
+
+class Optimizer(Registrable): ...
+
+
+@Optimizer.register("sgd")
+class SGD(Optimizer):
+    def __init__(self, lr: float) -> None:
+        self.lr = lr
+
+
+def test_validate_valid_config_constructs_nothing() -> None:
+    constructed = []
+
+    @dataclasses.dataclass
+    class Tracked:
+        value: int
+
+        def __post_init__(self) -> None:
+            constructed.append(self)
+
+    report = colt.validate({"value": 1}, Tracked)
+    assert report.valid
+    assert report.issues == []
+    assert constructed == []
+
+
+def test_validate_reports_every_error_with_path() -> None:
+    config = {
+        "name": 1,
+        "layers": [{"size": 1}, {"size": "x"}, {"size": 3, "dropout": "high"}],
+        "options": {"a": 1, "b": "2"},
+        "head": {"size": None, "dropout": []},
+    }
+
+    report = colt.validate(config, Model)
+
+    assert not report.valid
+    assert [issue.path for issue in report.issues] == [
+        ("name",),
+        ("layers", 1, "size"),
+        ("layers", 2, "dropout"),
+        ("options", "b"),
+        ("head", "dropout"),
+    ]
+    assert all(isinstance(issue.error, ConfigurationError) for issue in report.issues)
+    assert report.issues[1].message.startswith("[layers.1.size] Type mismatch")
+
+
+def test_validate_matches_dry_run_first_error() -> None:
+    config = {"name": "m", "layers": [{"size": "x"}], "options": {}}
+    report = colt.validate(config, Model)
+    try:
+        colt.dry_run(config, Model)
+    except ConfigurationError as e:
+        assert str(e) == report.issues[0].message
+    else:
+        raise AssertionError("dry_run did not fail")
+
+
+def test_validate_reports_unknown_types_and_union_failures() -> None:
+    config = {
+        "first": {"@type": "adam", "lr": 0.1},
+        "second": {"@type": "sgd", "lr": "fast"},
+        "third": {"@type": "sgd", "lr": 0.1},
+    }
+    report = colt.validate(config, Dict[str, Optimizer])
+    assert [issue.path for issue in report.issues] == [("first",), ("second", "lr")]
+
+    report = colt.validate({"value": [1]}, Dict[str, Union[int, str]])
+    assert [issue.path for issue in report.issues] == [("value",)]
+    assert "Failed to construct object with type" in report.issues[0].message
+
+
+def test_validate_with_path_and_engine() -> None:
+    for engine in ("recursive", "stack"):
+        report = ColtBuilder(engine=engine).validate({"size": "x"}, Layer, path=("model", 0))
+        assert [issue.path for issue in report.issues] == [("model", 0, "size")]
+        report = ColtBuilder(engine=engine).validate("x", int, path=("n",))
+        assert [issue.path for issue in report.issues] == [("n",)]
+
+
+def test_validate_reports_every_error_within_lazy_configs() -> None:
+    @dataclasses.dataclass
+    class Foo:
+        a: int
+        b: int
+
+    @dataclasses.dataclass
+    class Bar:
+        foo: Lazy[Foo]
+        c: int
+
+    builder = ColtBuilder()
+    report = builder.validate({"foo": {"a": "x", "b": "y"}, "c": "z"}, Bar)
+
+    assert [issue.path for issue in report.issues] == [("foo", "a"), ("foo", "b"), ("c",)]
+    assert builder.lazy_validation_info.full == 0
+
+
+def test_dry_run_returns_collections() -> None:
+    builder = ColtBuilder()
+    assert builder.dry_run([1, 2], List[float]) == [1.0, 2.0]
+    assert builder.dry_run({"a": 1}, Dict[str, int]) == {"a": 1}
+    assert builder.dry_run({"a": [1]}, dict) == {"a": [1]}